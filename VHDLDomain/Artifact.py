@@ -0,0 +1,275 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains functions to write and read pre-analyzed VHDL designs as a model artifact.
+
+A model artifact is created by ``python -m VHDLDomain analyze`` (e.g. in a CI job) and loaded by the VHDL domain via
+configuration option ``vhdl_model_artifact`` instead of parsing and analyzing all VHDL sources again.
+
+Analyzed designs are not stored in the build environment. They are kept in a process-local :class:`DesignCache`, so
+the designs are neither written into ``environment.pickle`` nor pickled back from each parallel reader process. A model
+artifact is loaded on first use; before documents are read by parallel (forked) processes, it's loaded in the main
+process (see :func:`LoadBeforeParallelRead`), so the reader processes share the loaded designs copy-on-write instead
+of each unpickling the artifact again.
+
+The header of a model artifact records the versions of VHDLDomain, pyVHDLModel and pyGHDL, because the pickled designs
+are instances of their classes. An artifact, which was written with other versions or can't be unpickled, is reported
+and the designs are parsed from VHDL sources instead.
+"""
+from importlib.metadata import version, PackageNotFoundError
+from mmap import mmap, ACCESS_READ
+from os import replace as os_replace
+from pathlib import Path
+from pickle import dumps, loads, HIGHEST_PROTOCOL, UnpicklingError
+from typing import Callable, Dict, List, Union, Optional as Nullable
+
+from pyTooling.Decorators import export
+from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
+
+from VHDLDomain.Catalog import Catalog, CatalogPath, CatalogException, DesignView
+
+MAGIC = b"VHDLDomain-Model"   #: Magic bytes at the beginning of a model artifact.
+FORMAT_VERSION = 9            #: Version of the model artifact's file format.
+
+
+@export
+class ModelArtifactException(Exception):
+	"""Raised when a model artifact can't be read."""
+
+
+def _PackageVersion(packageName: str) -> str:
+	# Read from the package's metadata, because importing pyGHDL loads libghdl.
+	try:
+		return version(packageName)
+	except PackageNotFoundError:
+		return "unknown"
+
+
+def _Header() -> bytes:
+	from VHDLDomain import __version__
+
+	versions = (str(FORMAT_VERSION), __version__, _PackageVersion("pyVHDLModel"), _PackageVersion("pyGHDL"))
+	return MAGIC + "".join(f"\0{field}" for field in versions).encode("ascii") + b"\0"
+
+
+def _CheckHeader(path: Path, content: bytes) -> int:
+	header = _Header()
+	if content[:len(MAGIC)] != MAGIC:
+		raise ModelArtifactException(f"File '{path}' is not a VHDLDomain model artifact.")
+	elif content[:len(header)] != header:
+		found = bytes(content[len(MAGIC) + 1:len(MAGIC) + 128]).split(b"\0")[:4]
+		expected = header[len(MAGIC) + 1:].split(b"\0")[:4]
+		raise ModelArtifactException(
+			f"Model artifact '{path}' was written with other versions (format, VHDLDomain, pyVHDLModel, pyGHDL): "
+			f"{', '.join(field.decode('ascii', 'replace') for field in found)}; expected {', '.join(field.decode('ascii') for field in expected)}."
+		)
+
+	return len(header)
+
+
+@export
+def CheckModelArtifact(path: Path) -> None:
+	"""
+	Check the header of a model artifact without loading the designs.
+
+	:param path: Path to the model artifact.
+	:raises ModelArtifactException: If the file doesn't exist, isn't a model artifact or was written with other versions.
+	"""
+	try:
+		with path.open("rb") as fileHandle:
+			_CheckHeader(path, fileHandle.read(len(_Header()) + 128))
+	except OSError as ex:
+		raise ModelArtifactException(f"Model artifact '{path}' can't be read.") from ex
+
+
+@export
+def WriteModelArtifact(path: Path, designs: Dict[str, "Design"]) -> int:
+	"""
+	Write analyzed designs to a model artifact.
+
+	The file is written to a temporary file first and then moved to its final location, so readers never see a partially
+	written artifact.
+
+	:param path:    Path to the model artifact.
+	:param designs: Dictionary of analyzed designs.
+	:returns:       Size of the written model artifact in bytes.
+	"""
+	content = _Header() + dumps(designs, protocol=HIGHEST_PROTOCOL)
+
+	temporaryPath = path.with_name(f"{path.name}.tmp")
+	temporaryPath.write_bytes(content)
+	os_replace(temporaryPath, path)
+
+	return len(content)
+
+
+@export
+def ReadModelArtifact(path: Path) -> Dict[str, "Design"]:
+	"""
+	Read analyzed designs from a model artifact.
+
+	:param path: Path to the model artifact.
+	:returns:    Dictionary of analyzed designs.
+	:raises ModelArtifactException: If the file doesn't exist, was written with other versions, or can't be unpickled
+	                                (e.g. truncated or referring to classes, which don't exist anymore).
+	"""
+	try:
+		with path.open("rb") as fileHandle, mmap(fileHandle.fileno(), 0, access=ACCESS_READ) as content:
+			headerSize = _CheckHeader(path, content)
+			with memoryview(content) as view, view[headerSize:] as payload:
+				return loads(payload)
+	except (OSError, ValueError) as ex:
+		raise ModelArtifactException(f"Model artifact '{path}' can't be read.") from ex
+	except (UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError) as ex:
+		raise ModelArtifactException(f"Model artifact '{path}' can't be unpickled ({ex.__class__.__name__}: {ex}).") from ex
+
+
+@export
+class DesignCache:
+	"""
+	Process-local cache of analyzed designs.
+
+	The cache is either filled with designs loaded from VHDL sources, or it refers to a model artifact, which is read
+	(memory-mapped) on first use. If the model artifact can't be read, designs are loaded by a fallback function (parsing
+	the VHDL sources). Designs are used read-only by all directives, roles and indices.
+	"""
+
+	_designs:      Nullable[Dict[str, "Design"]]
+	_artifactPath: Nullable[Path]
+	_fallback:     Nullable[Callable[[], Dict[str, "Design"]]]
+	_catalogs:     Nullable[Dict[str, DesignView]]
+
+	def __init__(self) -> None:
+		self._designs = None
+		self._artifactPath = None
+		self._fallback = None
+		self._catalogs = None
+
+	@property
+	def IsLoaded(self) -> bool:
+		return self._designs is not None
+
+	@property
+	def ArtifactPath(self) -> Nullable[Path]:
+		return self._artifactPath
+
+	def SetDesigns(self, designs: Dict[str, "Design"]) -> None:
+		"""Use designs loaded from VHDL sources."""
+		self._designs = designs
+		self._artifactPath = None
+		self._fallback = None
+		self._catalogs = None
+
+	def SetArtifact(self, path: Path, fallback: Callable[[], Dict[str, "Design"]] = None) -> None:
+		"""
+		Use designs of a model artifact, which is read on first use.
+
+		:param path:     Path to the model artifact.
+		:param fallback: Optional function loading the designs, if the model artifact can't be read.
+		"""
+		self._designs = None
+		self._artifactPath = path
+		self._fallback = fallback
+		self._catalogs = None
+
+	def Get(self) -> Dict[str, "Design"]:
+		"""
+		Returns all designs, reading the model artifact on first use.
+
+		:raises ModelArtifactException: If the model artifact can't be read and no fallback is given.
+		"""
+		if self._designs is None:
+			if self._artifactPath is None:
+				self._designs = {}
+			else:
+				print(f"[VHDL]   Loading model artifact '{self._artifactPath}' ...")
+				try:
+					self._designs = ReadModelArtifact(self._artifactPath)
+				except ModelArtifactException as ex:
+					if self._fallback is None:
+						raise
+					print(f"[VHDL][WARNING] {ex} Parsing VHDL sources instead.")
+					self._designs = self._fallback()
+
+		return self._designs
+
+	def GetCatalogs(self) -> Dict[str, Union["Design", DesignView]]:
+		"""
+		Returns lightweight views of all designs for indices.
+
+		If the model artifact has a catalog, the catalog is memory-mapped and no design is deserialized. Otherwise, the
+		full designs are returned, which provide the same attributes.
+		"""
+		if self._catalogs is None:
+			if self._designs is None and self._artifactPath is not None:
+				try:
+					self._catalogs = Catalog(CatalogPath(self._artifactPath)).Designs
+				except CatalogException as ex:
+					print(f"[VHDL][WARNING] {ex} Falling back to the model artifact.")
+					self._catalogs = self.Get()
+			else:
+				self._catalogs = self.Get()
+
+		return self._catalogs
+
+
+@export
+def LoadBeforeParallelRead(sphinxApplication: Sphinx, env: BuildEnvironment, docnames: List[str]) -> None:
+	"""
+	Call back for Sphinx ``env-before-read-docs`` event.
+
+	If documents are read by parallel processes, the designs of a model artifact are loaded now in the main process
+	(before the reader processes are forked), so all readers share them instead of each unpickling the artifact. Serial
+	builds keep loading the artifact on first use, thus builds without model dependent directives never load it.
+
+	:param sphinxApplication: The Sphinx application.
+	:param env:               The build environment.
+	:param docnames:          Documents to be read.
+	"""
+	designCache = GetDesignCache(sphinxApplication.config)
+	if sphinxApplication.parallel > 1 and len(docnames) > 0 and designCache.ArtifactPath is not None:
+		designCache.Get()
+
+
+@export
+def GetDesignCache(config: Config) -> DesignCache:
+	"""Returns the process-local design cache attached to the Sphinx configuration (not pickled with the environment)."""
+	try:
+		return config._vhdlDesignCache
+	except AttributeError:
+		cache = DesignCache()
+		config._vhdlDesignCache = cache
+		return cache
@@ -0,0 +1,506 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains a binary, memory-mappable catalog of analyzed designs.
+
+A catalog holds what indices and overview pages need from a design (libraries, entities, architectures, packages, their
+ports and generics as formatted text) without the full language model. It's written next to a model artifact and
+opened via :mod:`mmap`, thus opening a catalog doesn't deserialize any object.
+
+File layout (all integers are little-endian 32-bit unsigned):
+
+* Header: magic bytes, format version and an (offset, count) pair per section.
+* String table: ``count + 1`` offsets into a UTF-8 blob. Each string (identifier, documentation, type text, path) is
+  stored once; records refer to strings by index.
+* Fixed-width record arrays for designs, libraries, units, ports, generics and source files. Relations are stored as
+  (first, count) ranges into the next array, e.g. a library's units or an entity's ports. An entity's architectures
+  directly follow the entity in the unit array.
+* Source file records hold each file's library, path and content hash, so outdated documents can be found without
+  loading the model artifact (see :mod:`VHDLDomain.Tracking`).
+
+Records are unpacked on access by thin view objects (:class:`DesignView`, :class:`LibraryView`, :class:`UnitView`,
+:class:`InterfaceItemView`), which mimic the parts of the pyVHDLModel API used by indices.
+"""
+from enum import IntEnum
+from mmap import mmap, ACCESS_READ
+from os import replace as os_replace
+from pathlib import Path
+from struct import Struct
+from typing import Dict, List, Tuple, Optional as Nullable
+
+from pyTooling.Decorators import export
+
+from VHDLDomain.Format import ModelFormatter
+from VHDLDomain.Location import SourceLocationKind
+from VHDLDomain.Tracking import SourceHashTable
+
+MAGIC = b"VHDLDomain-Catalog\0\0"  #: Magic bytes at the beginning of a catalog.
+CATALOG_VERSION = 2                #: Version of the catalog's file format.
+
+_SECTIONS = ("stringOffsets", "stringData", "designs", "libraries", "units", "ports", "generics", "sources")
+
+_headerRecord =    Struct(f"<{len(MAGIC)}sI{2 * len(_SECTIONS)}I")
+_offsetRecord =    Struct("<I")
+_designRecord =    Struct("<6I")   # name, baseDirectory, firstLibrary, libraryCount, firstSource, sourceCount
+_libraryRecord =   Struct("<3I")   # name, firstUnit, unitCount
+_unitRecord =      Struct("<12I")  # kind, library, name, documentation, document, line, firstPort, portCount, firstGeneric, genericCount, firstChild, childCount
+_portRecord =      Struct("<4I")   # name, mode, subtype, default
+_genericRecord =   Struct("<3I")   # name, subtype, default
+_sourceRecord =    Struct("<3I")   # library, path, hash
+
+_recordSizes = {
+	"stringOffsets": _offsetRecord.size,
+	"stringData":    1,
+	"designs":       _designRecord.size,
+	"libraries":     _libraryRecord.size,
+	"units":         _unitRecord.size,
+	"ports":         _portRecord.size,
+	"generics":      _genericRecord.size,
+	"sources":       _sourceRecord.size,
+}
+
+
+@export
+class UnitKind(IntEnum):
+	Entity =       1
+	Architecture = 2
+	Package =      3
+
+
+@export
+class CatalogException(Exception):
+	"""Raised when a catalog can't be read."""
+
+
+@export
+def CatalogPath(artifactPath: Path) -> Path:
+	"""Returns the path of the catalog written next to a model artifact."""
+	return artifactPath.with_name(f"{artifactPath.name}.catalog")
+
+
+class _StringTable:
+	_index:   Dict[str, int]
+	_strings: List[bytes]
+
+	def __init__(self) -> None:
+		self._index = {}
+		self._strings = []
+		self.Add("")
+
+	def Add(self, text: Nullable[str]) -> int:
+		if text is None:
+			text = ""
+
+		try:
+			return self._index[text]
+		except KeyError:
+			index = self._index[text] = len(self._strings)
+			self._strings.append(text.encode("utf-8"))
+			return index
+
+	def Serialize(self) -> Tuple[bytes, bytes, int]:
+		offsets = bytearray()
+		offset = 0
+		for string in self._strings:
+			offsets += _offsetRecord.pack(offset)
+			offset += len(string)
+		offsets += _offsetRecord.pack(offset)
+
+		return bytes(offsets), b"".join(self._strings), len(self._strings) + 1
+
+
+class _CatalogWriter:
+	def __init__(self) -> None:
+		self.Strings = _StringTable()
+		self.Formatter = ModelFormatter()
+		self.Designs = bytearray()
+		self.Libraries = bytearray()
+		self.Units = bytearray()
+		self.Ports = bytearray()
+		self.Generics = bytearray()
+		self.Sources = bytearray()
+		self.UnitCount = 0
+
+	def _AddInterfaceItems(self, items, withMode: bool) -> Tuple[int, int]:
+		target = self.Ports if withMode else self.Generics
+		record = _portRecord if withMode else _genericRecord
+		first = len(target) // record.size
+		for item in items:
+			subtype = self.Strings.Add(self.Formatter.Format(getattr(item, "Subtype", None)))
+			default = self.Strings.Add(self.Formatter.Format(getattr(item, "DefaultExpression", None)))
+			for identifier in getattr(item, "Identifiers", None) or (item.Identifier, ):
+				if withMode:
+					target += record.pack(self.Strings.Add(identifier), self.Strings.Add(str(item.Mode)), subtype, default)
+				else:
+					target += record.pack(self.Strings.Add(identifier), subtype, default)
+
+		return first, len(target) // record.size - first
+
+	def AddUnit(self, design, kind: UnitKind, libraryIndex: int, unit, locationName: str, childCount: int = 0) -> None:
+		locationKind = {UnitKind.Entity: SourceLocationKind.Entity, UnitKind.Architecture: SourceLocationKind.Architecture, UnitKind.Package: SourceLocationKind.Package}[kind]
+		span = design.SourceLocations.Get(locationKind, locationName)
+
+		ports = self._AddInterfaceItems(getattr(unit, "PortItems", ()), True) if kind is UnitKind.Entity else (0, 0)
+		generics = self._AddInterfaceItems(getattr(unit, "GenericItems", ()), False) if kind is not UnitKind.Architecture else (0, 0)
+
+		self.Units += _unitRecord.pack(
+			kind,
+			libraryIndex,
+			self.Strings.Add(unit.Identifier),
+			self.Strings.Add(unit.Documentation),
+			self.Strings.Add(span.Document if span is not None else ""),
+			span.Line if span is not None else 0,
+			*ports,
+			*generics,
+			self.UnitCount + 1 if childCount > 0 else 0,
+			childCount
+		)
+		self.UnitCount += 1
+
+	def AddDesign(self, designName: str, design) -> None:
+		firstLibrary = len(self.Libraries) // _libraryRecord.size
+		for library in design.Libraries.values():
+			libraryIndex = len(self.Libraries) // _libraryRecord.size
+			firstUnit = self.UnitCount
+			libraryName = library.NormalizedIdentifier
+
+			for entity in library.Entities.values():
+				entityName = f"{libraryName}.{entity.NormalizedIdentifier}"
+				architectures = library.Architectures.get(entity.NormalizedIdentifier, {})
+				self.AddUnit(design, UnitKind.Entity, libraryIndex, entity, entityName, len(architectures))
+				for architecture in architectures.values():
+					self.AddUnit(design, UnitKind.Architecture, libraryIndex, architecture, f"{entityName}({architecture.NormalizedIdentifier})")
+
+			for package in library.Packages.values():
+				self.AddUnit(design, UnitKind.Package, libraryIndex, package, f"{libraryName}.{package.NormalizedIdentifier}")
+
+			self.Libraries += _libraryRecord.pack(self.Strings.Add(library.Identifier), firstUnit, self.UnitCount - firstUnit)
+
+		firstSource = len(self.Sources) // _sourceRecord.size
+		for libraryName, path, hash in design.SourceHashes.IterateFiles():
+			self.Sources += _sourceRecord.pack(self.Strings.Add(libraryName), self.Strings.Add(path), self.Strings.Add(hash))
+
+		baseDirectory = design.BaseDirectory.as_posix() if design.BaseDirectory is not None else ""
+		self.Designs += _designRecord.pack(
+			self.Strings.Add(designName),
+			self.Strings.Add(baseDirectory),
+			firstLibrary,
+			len(self.Libraries) // _libraryRecord.size - firstLibrary,
+			firstSource,
+			len(self.Sources) // _sourceRecord.size - firstSource
+		)
+
+	def Serialize(self) -> bytes:
+		stringOffsets, stringData, stringCount = self.Strings.Serialize()
+		sections = {
+			"stringOffsets": (stringOffsets, stringCount),
+			"stringData":    (stringData, len(stringData)),
+			"designs":       (self.Designs, len(self.Designs) // _designRecord.size),
+			"libraries":     (self.Libraries, len(self.Libraries) // _libraryRecord.size),
+			"units":         (self.Units, self.UnitCount),
+			"ports":         (self.Ports, len(self.Ports) // _portRecord.size),
+			"generics":      (self.Generics, len(self.Generics) // _genericRecord.size),
+			"sources":       (self.Sources, len(self.Sources) // _sourceRecord.size),
+		}
+
+		offset = _headerRecord.size
+		table = []
+		for name in _SECTIONS:
+			content, count = sections[name]
+			table.extend((offset, count))
+			offset += len(content)
+
+		return _headerRecord.pack(MAGIC, CATALOG_VERSION, *table) + b"".join(sections[name][0] for name in _SECTIONS)
+
+
+@export
+def WriteCatalog(path: Path, designs: Dict[str, "Design"]) -> int:
+	"""
+	Write a catalog of analyzed designs.
+
+	:param path:    Path to the catalog.
+	:param designs: Dictionary of analyzed designs.
+	:returns:       Size of the written catalog in bytes.
+	"""
+	writer = _CatalogWriter()
+	for designName, design in designs.items():
+		writer.AddDesign(designName, design)
+
+	content = writer.Serialize()
+
+	temporaryPath = path.with_name(f"{path.name}.tmp")
+	temporaryPath.write_bytes(content)
+	os_replace(temporaryPath, path)
+
+	return len(content)
+
+
+@export
+class Catalog:
+	"""
+	A memory-mapped catalog. Records and strings are only unpacked when accessed through views.
+	"""
+
+	_mmap:     mmap
+	_sections: Dict[str, Tuple[int, int]]
+
+	def __init__(self, path: Path) -> None:
+		"""
+		Open a catalog.
+
+		:param path:              Path to the catalog.
+		:raises CatalogException: If the file isn't a catalog of this format version.
+		"""
+		try:
+			with path.open("rb") as fileHandle:
+				self._mmap = mmap(fileHandle.fileno(), 0, access=ACCESS_READ)
+		except (OSError, ValueError) as ex:
+			raise CatalogException(f"Catalog '{path}' can't be read.") from ex
+
+		if len(self._mmap) < _headerRecord.size:
+			raise CatalogException(f"File '{path}' is not a VHDLDomain catalog.")
+
+		magic, version, *table = _headerRecord.unpack_from(self._mmap, 0)
+		if magic != MAGIC:
+			raise CatalogException(f"File '{path}' is not a VHDLDomain catalog.")
+		elif version != CATALOG_VERSION:
+			raise CatalogException(f"Catalog '{path}' has format version {version}, expected {CATALOG_VERSION}.")
+
+		self._sections = {name: (table[2 * index], table[2 * index + 1]) for index, name in enumerate(_SECTIONS)}
+
+	def Close(self) -> None:
+		self._mmap.close()
+
+	def Count(self, section: str) -> int:
+		return self._sections[section][1]
+
+	def Record(self, section: str, record: Struct, index: int) -> Tuple[int, ...]:
+		offset, count = self._sections[section]
+		if not 0 <= index < count:
+			raise IndexError(f"Record {index} of section '{section}' is out of range.")
+
+		return record.unpack_from(self._mmap, offset + index * _recordSizes[section])
+
+	def String(self, index: int) -> str:
+		offsetsOffset = self._sections["stringOffsets"][0] + index * _offsetRecord.size
+		start = _offsetRecord.unpack_from(self._mmap, offsetsOffset)[0]
+		end = _offsetRecord.unpack_from(self._mmap, offsetsOffset + _offsetRecord.size)[0]
+		dataOffset = self._sections["stringData"][0]
+
+		return self._mmap[dataOffset + start:dataOffset + end].decode("utf-8")
+
+	@property
+	def Designs(self) -> Dict[str, "DesignView"]:
+		designs = {}
+		for index in range(self.Count("designs")):
+			design = DesignView(self, index)
+			designs[design.Identifier] = design
+
+		return designs
+
+
+@export
+class DesignView:
+	"""A view of a design record."""
+
+	__slots__ = ("_catalog", "_record", "_sortedDesign", "_sourceHashes")
+
+	def __init__(self, catalog: Catalog, index: int) -> None:
+		self._catalog = catalog
+		self._record = catalog.Record("designs", _designRecord, index)
+		self._sourceHashes = None
+
+	@property
+	def Identifier(self) -> str:
+		return self._catalog.String(self._record[0])
+
+	@property
+	def BaseDirectory(self) -> Nullable[Path]:
+		baseDirectory = self._catalog.String(self._record[1])
+		return Path(baseDirectory) if baseDirectory else None
+
+	@property
+	def SourceHashes(self) -> SourceHashTable:
+		"""Content hashes of all source files, read from the catalog on first access."""
+		if self._sourceHashes is None:
+			first, count = self._record[4:6]
+			self._sourceHashes = SourceHashTable()
+			for index in range(first, first + count):
+				libraryName, path, hash = (self._catalog.String(string) for string in self._catalog.Record("sources", _sourceRecord, index))
+				self._sourceHashes.AddHash(libraryName, path, hash)
+
+		return self._sourceHashes
+
+	@property
+	def Libraries(self) -> Dict[str, "LibraryView"]:
+		first, count = self._record[2:4]
+		libraries = {}
+		for index in range(first, first + count):
+			library = LibraryView(self._catalog, index)
+			libraries[library.NormalizedIdentifier] = library
+
+		return libraries
+
+
+@export
+class LibraryView:
+	"""A view of a library record."""
+
+	__slots__ = ("_catalog", "_index", "_record")
+
+	def __init__(self, catalog: Catalog, index: int) -> None:
+		self._catalog = catalog
+		self._index = index
+		self._record = catalog.Record("libraries", _libraryRecord, index)
+
+	@property
+	def Identifier(self) -> str:
+		return self._catalog.String(self._record[0])
+
+	@property
+	def NormalizedIdentifier(self) -> str:
+		return self.Identifier.lower()
+
+	def _Units(self, kind: UnitKind) -> Dict[str, "UnitView"]:
+		first, count = self._record[1:3]
+		units = {}
+		for index in range(first, first + count):
+			unit = UnitView(self._catalog, index)
+			if unit.Kind is kind:
+				units[unit.NormalizedIdentifier] = unit
+
+		return units
+
+	@property
+	def Entities(self) -> Dict[str, "UnitView"]:
+		return self._Units(UnitKind.Entity)
+
+	@property
+	def Packages(self) -> Dict[str, "UnitView"]:
+		return self._Units(UnitKind.Package)
+
+	@property
+	def Architectures(self) -> Dict[str, Dict[str, "UnitView"]]:
+		return {entityName: entity.Architectures for entityName, entity in self.Entities.items()}
+
+
+@export
+class UnitView:
+	"""A view of a design unit record (entity, architecture or package)."""
+
+	__slots__ = ("_catalog", "_record")
+
+	def __init__(self, catalog: Catalog, index: int) -> None:
+		self._catalog = catalog
+		self._record = catalog.Record("units", _unitRecord, index)
+
+	@property
+	def Kind(self) -> UnitKind:
+		return UnitKind(self._record[0])
+
+	@property
+	def Library(self) -> LibraryView:
+		return LibraryView(self._catalog, self._record[1])
+
+	@property
+	def Identifier(self) -> str:
+		return self._catalog.String(self._record[2])
+
+	@property
+	def NormalizedIdentifier(self) -> str:
+		return self.Identifier.lower()
+
+	@property
+	def Documentation(self) -> str:
+		return self._catalog.String(self._record[3])
+
+	@property
+	def Document(self) -> str:
+		"""Path of the source file relative to the design's base directory."""
+		return self._catalog.String(self._record[4])
+
+	@property
+	def Line(self) -> int:
+		return self._record[5]
+
+	@property
+	def PortItems(self) -> List["InterfaceItemView"]:
+		first, count = self._record[6:8]
+		return [InterfaceItemView(self._catalog, "ports", _portRecord, index) for index in range(first, first + count)]
+
+	@property
+	def GenericItems(self) -> List["InterfaceItemView"]:
+		first, count = self._record[8:10]
+		return [InterfaceItemView(self._catalog, "generics", _genericRecord, index) for index in range(first, first + count)]
+
+	@property
+	def Architectures(self) -> Dict[str, "UnitView"]:
+		first, count = self._record[10:12]
+		architectures = {}
+		for index in range(first, first + count):
+			architecture = UnitView(self._catalog, index)
+			architectures[architecture.NormalizedIdentifier] = architecture
+
+		return architectures
+
+
+@export
+class InterfaceItemView:
+	"""A view of a port or generic record. Types and default values are formatted VHDL code."""
+
+	__slots__ = ("_catalog", "_record")
+
+	def __init__(self, catalog: Catalog, section: str, record: Struct, index: int) -> None:
+		self._catalog = catalog
+		self._record = catalog.Record(section, record, index)
+
+	@property
+	def Identifier(self) -> str:
+		return self._catalog.String(self._record[0])
+
+	@property
+	def Identifiers(self) -> Tuple[str]:
+		return (self.Identifier, )
+
+	@property
+	def Mode(self) -> str:
+		return self._catalog.String(self._record[1]) if len(self._record) == 4 else ""
+
+	@property
+	def Subtype(self) -> str:
+		return self._catalog.String(self._record[-2])
+
+	@property
+	def DefaultExpression(self) -> str:
+		return self._catalog.String(self._record[-1])
@@ -0,0 +1,260 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains the transitive dependencies of all libraries and design units of a design.
+
+The closures are computed once after analysis. Vertices are processed in topological order, so each vertex's closure
+is the union of its direct dependencies' closures. Closures are stored as bitsets (Python integers with one bit per
+vertex), thus looking up all (transitive) dependencies or dependents of a unit doesn't walk the dependency graph.
+"""
+from typing import Dict, List, NamedTuple, Set
+
+from pyTooling.Decorators import export
+from pyVHDLModel import DependencyGraphVertexKind
+
+_predefinedLibraries = ("std", "ieee")
+
+
+@export
+class DependencyEntry(NamedTuple):
+	"""A library or design unit in a list of dependencies."""
+	Name:        str  #: Normalized name, e.g. ``lib.counter`` or ``lib.counter(rtl)``.
+	DisplayName: str  #: Name as written in the source.
+	Kind:        str  #: Kind of the library or design unit, e.g. ``Entity``.
+	Depth:       int  #: Distance in the dependency graph, or 0 if not computed.
+
+
+def _DisplayName(vertex) -> str:
+	value = vertex.Value
+	kind = vertex["kind"]
+	try:
+		if kind is DependencyGraphVertexKind.Library:
+			return value.Identifier
+		elif kind is DependencyGraphVertexKind.Architecture:
+			return f"{value.Library.Identifier}.{value.Entity.Identifier}({value.Identifier})"
+		elif kind is DependencyGraphVertexKind.PackageBody:
+			return f"{value.Library.Identifier}.{value.Identifier}(body)"
+		else:
+			return f"{value.Library.Identifier}.{value.Identifier}"
+	except AttributeError:
+		return vertex.ID
+
+
+@export
+class DependencyClosure:
+	"""
+	Direct and transitive dependencies (and dependents) of all libraries and design units of a design.
+
+	Vertices and edges are added first, then :meth:`Compute` computes the closures. If the graph contains cycles (e.g.
+	recursive instantiation), the closures of vertices on or behind a cycle are computed by iterating to a fixed point.
+	"""
+
+	_names:        List[str]
+	_displayNames: List[str]
+	_kinds:        List[str]
+	_predefined:   List[bool]
+	_index:        Dict[str, int]
+	_successors:   List[Set[int]]
+	_predecessors: List[Set[int]]
+	_dependencies: List[int]
+	_dependents:   List[int]
+
+	def __init__(self) -> None:
+		self._names = []
+		self._displayNames = []
+		self._kinds = []
+		self._predefined = []
+		self._index = {}
+		self._successors = []
+		self._predecessors = []
+		self._dependencies = []
+		self._dependents = []
+
+	def __len__(self) -> int:
+		return len(self._names)
+
+	def __contains__(self, name: str) -> bool:
+		return name.lower() in self._index
+
+	def Add(self, name: str, displayName: str, kind: str) -> None:
+		"""
+		Add a library or design unit.
+
+		:param name:        Normalized name (vertex ID of the dependency graph).
+		:param displayName: Name as written in the source.
+		:param kind:        Kind of the library or design unit.
+		"""
+		if name in self._index:
+			return
+
+		self._index[name] = len(self._names)
+		self._names.append(name)
+		self._displayNames.append(displayName)
+		self._kinds.append(kind)
+		self._predefined.append(name.split(".", 1)[0] in _predefinedLibraries)
+		self._successors.append(set())
+		self._predecessors.append(set())
+
+	def AddDependency(self, name: str, dependency: str) -> None:
+		"""Add a direct dependency of a library or design unit. Both must be added before."""
+		source = self._index[name]
+		destination = self._index[dependency]
+		if source != destination:
+			self._successors[source].add(destination)
+			self._predecessors[destination].add(source)
+
+	def AddDesign(self, design) -> None:
+		"""
+		Add all libraries and design units of an analyzed design and compute the closures.
+
+		:param design: The analyzed design.
+		"""
+		vertices = []
+		for vertex in design.DependencyGraph.IterateVertices():
+			if vertex["kind"] is DependencyGraphVertexKind.Document:
+				continue
+
+			self.Add(vertex.ID, _DisplayName(vertex), vertex["kind"].name)
+			vertices.append(vertex)
+
+		for vertex in vertices:
+			for successor in vertex.IterateSuccessorVertices():
+				if successor.ID in self._index:
+					self.AddDependency(vertex.ID, successor.ID)
+
+		self.Compute()
+
+	@staticmethod
+	def _Close(successors: List[Set[int]], predecessors: List[Set[int]]) -> List[int]:
+		count = len(successors)
+		closures = [0] * count
+
+		# Kahn's algorithm: a vertex is ready when all of its successors are closed.
+		pending = [len(s) for s in successors]
+		ready = [vertex for vertex in range(count) if pending[vertex] == 0]
+		closed = 0
+		while ready:
+			vertex = ready.pop()
+			closed += 1
+			closure = 0
+			for successor in successors[vertex]:
+				closure |= closures[successor] | (1 << successor)
+			closures[vertex] = closure
+
+			for predecessor in predecessors[vertex]:
+				pending[predecessor] -= 1
+				if pending[predecessor] == 0:
+					ready.append(predecessor)
+
+		if closed < count:
+			cyclic = [vertex for vertex in range(count) if pending[vertex] > 0]
+			changed = True
+			while changed:
+				changed = False
+				for vertex in cyclic:
+					closure = closures[vertex]
+					for successor in successors[vertex]:
+						closure |= closures[successor] | (1 << successor)
+					if closure != closures[vertex]:
+						closures[vertex] = closure
+						changed = True
+
+		return closures
+
+	def Compute(self) -> None:
+		"""Compute the transitive dependencies and dependents of all vertices."""
+		self._dependencies = self._Close(self._successors, self._predecessors)
+		self._dependents = self._Close(self._predecessors, self._successors)
+
+	def _Entry(self, vertex: int, depth: int) -> DependencyEntry:
+		return DependencyEntry(self._names[vertex], self._displayNames[vertex], self._kinds[vertex], depth)
+
+	def _Query(self, name: str, closures: List[int], adjacency: List[Set[int]], depth: int, predefined: bool) -> List[DependencyEntry]:
+		start = self._index[name.lower()]
+
+		if depth == 0:
+			entries = []
+			bits = closures[start]
+			while bits:
+				lowest = bits & -bits
+				vertex = lowest.bit_length() - 1
+				bits ^= lowest
+				if predefined or not self._predefined[vertex]:
+					entries.append(self._Entry(vertex, 0))
+		else:
+			# A depth-limited query walks at most 'depth' levels breadth-first.
+			entries = []
+			visited = {start}
+			level = [start]
+			for distance in range(1, depth + 1):
+				nextLevel = []
+				for vertex in level:
+					for neighbour in adjacency[vertex]:
+						if neighbour not in visited:
+							visited.add(neighbour)
+							nextLevel.append(neighbour)
+							if predefined or not self._predefined[neighbour]:
+								entries.append(self._Entry(neighbour, distance))
+				level = nextLevel
+
+		entries.sort(key=lambda entry: (entry.Depth, entry.Name))
+		return entries
+
+	def Dependencies(self, name: str, depth: int = 0, predefined: bool = False) -> List[DependencyEntry]:
+		"""
+		Returns the libraries and design units a library or design unit depends on.
+
+		:param name:       Normalized name of the library or design unit.
+		:param depth:      Maximum distance, or 0 for all transitive dependencies.
+		:param predefined: Include units of predefined libraries (``std``, ``ieee``).
+		:returns:          List of dependencies sorted by depth and name.
+		:raises KeyError:  If the name is unknown.
+		"""
+		return self._Query(name, self._dependencies, self._successors, depth, predefined)
+
+	def Dependents(self, name: str, depth: int = 0, predefined: bool = False) -> List[DependencyEntry]:
+		"""
+		Returns the libraries and design units depending on a library or design unit.
+
+		:param name:       Normalized name of the library or design unit.
+		:param depth:      Maximum distance, or 0 for all transitive dependents.
+		:param predefined: Include units of predefined libraries (``std``, ``ieee``).
+		:returns:          List of dependents sorted by depth and name.
+		:raises KeyError:  If the name is unknown.
+		"""
+		return self._Query(name, self._dependents, self._predecessors, depth, predefined)
+
+	def DependsOn(self, name: str, dependency: str) -> bool:
+		"""Returns true, if a library or design unit depends (transitively) on another one."""
+		return bool(self._dependencies[self._index[name.lower()]] >> self._index[dependency.lower()] & 1)
@@ -0,0 +1,162 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module collects diagnostics (read, parse and analysis errors) while loading a design.
+
+A broken source file doesn't abort loading a design. Instead, the file is skipped, its errors are recorded with file
+and line (as far as pyGHDL or the Python exception reports them), and all remaining files are parsed, analyzed and
+documented. The collected diagnostics are reported in bulk after the design was loaded.
+"""
+from re import compile as re_compile
+from typing import Dict, Iterator, List, NamedTuple, Pattern
+
+from pyTooling.Decorators import export
+
+_positionPattern: Pattern = re_compile(r"^(?P<path>.*?):(?P<line>\d+):(?P<column>\d+):\s*(?P<message>.*)$")  #: Message format of libghdl: ``file:line:column: message``.
+
+
+@export
+class Diagnostic(NamedTuple):
+	"""A single diagnostic message. Line and column are 0, if unknown."""
+
+	Path:    str
+	Line:    int
+	Column:  int
+	Stage:   str  #: ``read``, ``parse`` or ``analyze``
+	Message: str
+
+	def __str__(self) -> str:
+		position = self.Path
+		if self.Line > 0:
+			position += f":{self.Line}:{self.Column}"
+
+		return f"{position}: {self.Stage} error: {self.Message}"
+
+
+def _IterateExceptions(exception: BaseException) -> Iterator[BaseException]:
+	seen = set()
+	while exception is not None and id(exception) not in seen:
+		seen.add(id(exception))
+		yield exception
+		exception = exception.__cause__ if exception.__cause__ is not None else exception.__context__
+
+
+@export
+def CreateDiagnostics(path: str, stage: str, exception: BaseException) -> List[Diagnostic]:
+	"""
+	Converts an exception into diagnostics.
+
+	libghdl reports its error messages (``file:line:column: message``) as ``InternalErrors`` of a chained
+	``LibGHDLException``. Each of these messages becomes a diagnostic with line and column. Otherwise, the exception
+	chain is searched for a line number (``lineno``) and a single diagnostic is created from the outermost exception's
+	message.
+
+	:param path:      Path of the source file (relative to the design).
+	:param stage:     Stage in which the exception was raised.
+	:param exception: The raised exception.
+	:returns:         A list of diagnostics.
+	"""
+	diagnostics = []
+	line = 0
+	column = 0
+	for ex in _IterateExceptions(exception):
+		for error in getattr(ex, "InternalErrors", None) or ():
+			match = _positionPattern.match(str(error))
+			if match is None:
+				diagnostics.append(Diagnostic(path, 0, 0, stage, str(error)))
+			else:
+				diagnostics.append(Diagnostic(path, int(match["line"]), int(match["column"]), stage, match["message"]))
+
+		if line == 0 and isinstance(getattr(ex, "lineno", None), int):
+			line = ex.lineno
+			column = getattr(ex, "offset", None) or 0
+
+	if not diagnostics:
+		message = str(exception) or exception.__class__.__name__
+		match = _positionPattern.match(message)
+		if match is not None:
+			line, column, message = int(match["line"]), int(match["column"]), match["message"]
+		diagnostics.append(Diagnostic(path, line, column, stage, message))
+
+	return diagnostics
+
+
+@export
+class DiagnosticCollection:
+	"""All diagnostics of a design, in the order they were recorded."""
+
+	_diagnostics: List[Diagnostic]
+
+	def __init__(self) -> None:
+		self._diagnostics = []
+
+	def __len__(self) -> int:
+		return len(self._diagnostics)
+
+	def __iter__(self) -> Iterator[Diagnostic]:
+		return iter(self._diagnostics)
+
+	def Add(self, path: str, stage: str, exception: BaseException) -> None:
+		"""
+		Records all diagnostics of an exception.
+
+		:param path:      Path of the source file (relative to the design).
+		:param stage:     Stage in which the exception was raised.
+		:param exception: The raised exception.
+		"""
+		self._diagnostics.extend(CreateDiagnostics(path, stage, exception))
+
+	@property
+	def Files(self) -> Dict[str, List[Diagnostic]]:
+		"""Diagnostics grouped by source file."""
+		files = {}
+		for diagnostic in self._diagnostics:
+			files.setdefault(diagnostic.Path, []).append(diagnostic)
+
+		return files
+
+	def Report(self, designName: str) -> None:
+		"""
+		Prints all diagnostics of a design grouped by source file.
+
+		:param designName: Name of the design.
+		"""
+		if not self._diagnostics:
+			return
+
+		files = self.Files
+		print(f"[VHDL][WARNING] Design '{designName}' has {len(self._diagnostics)} diagnostic(s) in {len(files)} file(s):")
+		for diagnostics in files.values():
+			for diagnostic in diagnostics:
+				print(f"[VHDL][ERROR]   {diagnostic}")
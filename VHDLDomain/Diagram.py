@@ -0,0 +1,277 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module creates block diagrams of an architecture's instances and their signal connections.
+
+Diagrams are created as Graphviz DOT sources while a document is read and are identified by a hash of that source. At
+``env-updated`` (after reading, before writing), all diagrams without a rendered SVG in the cache directory are
+rendered by concurrent ``dot`` processes (one per CPU). Unchanged diagrams are never rendered again. At ``doctree-resolved``, the
+placeholder nodes are replaced by the cached SVG images.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from os import cpu_count, replace as os_replace
+from pathlib import Path
+from subprocess import run as subprocess_run, CalledProcessError, PIPE
+from typing import Dict, Iterable, List, Tuple, Optional as Nullable
+
+from docutils import nodes
+from pyTooling.Decorators import export
+from pyVHDLModel.Name import Name, OpenName
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+from VHDLDomain.Format import ModelFormatter
+
+logger = logging.getLogger(__name__)
+
+
+@export
+class pending_vhdl_diagram(nodes.General, nodes.Element):
+	"""
+	A placeholder for a rendered block diagram, which is replaced at ``doctree-resolved``.
+
+	The attributes ``hash`` and ``source`` hold the diagram's hash and its DOT source.
+	"""
+
+
+def _Quote(text: str) -> str:
+	return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _SignalName(actual) -> Nullable[Tuple[str, str]]:
+	"""Returns the normalized and displayed name of the signal connected by an actual, or ``None`` for expressions."""
+	if not isinstance(actual, Name) or isinstance(actual, OpenName):
+		return None
+
+	root = actual.Root
+	return root.NormalizedIdentifier, root.Identifier
+
+
+def _InstantiatedUnit(instance, formatter: ModelFormatter) -> str:
+	for attributeName in ("Entity", "Component", "Configuration"):
+		symbol = getattr(instance, attributeName, None)
+		if symbol is not None:
+			return formatter.Format(symbol)
+
+	return ""
+
+
+@export
+def CreateInstanceDiagram(architecture, ports: Iterable[str], formatter: ModelFormatter) -> Nullable[str]:
+	"""
+	Create a block diagram of all instances of an architecture.
+
+	Each instance is drawn as a box. Instances connected to the same signal are connected by an edge labeled with that
+	signal. Signals which are ports of the entity are drawn as port nodes.
+
+	:param architecture: The architecture.
+	:param ports:        Names of the entity's ports.
+	:param formatter:    Formatter used for the names of the instantiated units.
+	:returns:            The diagram as Graphviz DOT source, or ``None`` if the architecture has no instances.
+	"""
+	portNames = {port.lower(): port for port in ports}
+
+	lines = [
+		"digraph {",
+		"\trankdir=LR;",
+		'\tnode [shape=box, fontname="sans-serif", fontsize=10];',
+		'\tedge [fontname="sans-serif", fontsize=8, arrowhead=none];',
+	]
+
+	signals: Dict[str, Tuple[str, List[str]]] = {}
+	for index, instance in enumerate(architecture.IterateInstantiations()):
+		nodeName = f"i{index}"
+		lines.append(f'\t{nodeName} [label="{_Quote(instance.Label)}\\n{_Quote(_InstantiatedUnit(instance, formatter))}"];')
+
+		for association in instance.PortAssociations:
+			signalName = _SignalName(association.Actual)
+			if signalName is None:
+				continue
+
+			normalizedName, displayName = signalName
+			nodeNames = signals.setdefault(normalizedName, (displayName, []))[1]
+			if nodeName not in nodeNames:
+				nodeNames.append(nodeName)
+
+	if len(lines) == 4:
+		return None
+
+	for normalizedName, (displayName, nodeNames) in signals.items():
+		if normalizedName in portNames:
+			portNode = f"p_{normalizedName}"
+			lines.append(f'\t{portNode} [label="{_Quote(portNames[normalizedName])}", shape=cds];')
+			for nodeName in nodeNames:
+				lines.append(f"\t{portNode} -> {nodeName};")
+		else:
+			first = nodeNames[0]
+			for nodeName in nodeNames[1:]:
+				lines.append(f'\t{first} -> {nodeName} [label="{_Quote(displayName)}"];')
+
+	lines.append("}")
+	return "\n".join(lines) + "\n"
+
+
+@export
+def DiagramHash(source: str, command: str) -> str:
+	"""Returns the hash identifying a diagram rendered from a DOT source by a Graphviz command."""
+	hash = sha256(source.encode("utf-8"))
+	hash.update(f"\0{command}".encode("utf-8"))
+	return hash.hexdigest()
+
+
+@export
+class DiagramCache:
+	"""
+	Directory of rendered diagrams, one SVG file per diagram hash.
+
+	Files are written to a temporary file first and renamed afterwards, so a cached file is always complete.
+	"""
+
+	_directory: Path
+
+	def __init__(self, directory: Path) -> None:
+		self._directory = directory
+
+	def GetPath(self, hash: str) -> Path:
+		return self._directory / f"{hash}.svg"
+
+	def __contains__(self, hash: str) -> bool:
+		return self.GetPath(hash).exists()
+
+	def Get(self, hash: str) -> Nullable[str]:
+		"""Returns the rendered SVG of a diagram, or ``None`` if it's not rendered yet."""
+		try:
+			return self.GetPath(hash).read_text(encoding="utf-8")
+		except OSError:
+			return None
+
+	def Write(self, hash: str, svg: bytes) -> None:
+		self._directory.mkdir(parents=True, exist_ok=True)
+		cacheFile = self.GetPath(hash)
+		temporaryFile = cacheFile.with_name(f"{cacheFile.name}.tmp")
+		temporaryFile.write_bytes(svg)
+		os_replace(temporaryFile, cacheFile)
+
+
+def _GetCache(sphinxApplication: Sphinx) -> DiagramCache:
+	return DiagramCache(Path(sphinxApplication.doctreedir) / "vhdl-diagrams")
+
+
+def _Render(command: str, source: str) -> bytes:
+	completed = subprocess_run([command, "-Tsvg"], input=source.encode("utf-8"), stdout=PIPE, stderr=PIPE, check=True)
+	return completed.stdout
+
+
+@export
+def RenderDiagrams(sphinxApplication: Sphinx, env: BuildEnvironment) -> List[str]:
+	"""
+	Call back for Sphinx ``env-updated`` event.
+
+	Renders all diagrams of the environment, which are not in the diagram cache. Each diagram is rendered by a separate
+	``dot`` process and up to one process per CPU runs concurrently. The number of processes is independent of ``-j``,
+	because this callback runs in the main process after all documents were read, also in serial builds.
+
+	Diagrams are rendered here instead of while their documents are read: only after reading, all changed diagrams of the
+	build are known, so they are rendered in one concurrent batch, and a diagram contained in several documents (or read
+	by several parallel processes) is rendered only once.
+
+	A diagram, which can't be rendered, is reported as a Sphinx warning (thus failing builds with ``-W``) and its DOT
+	source is shown instead.
+
+	:param sphinxApplication: The Sphinx application.
+	:param env:               The build environment.
+	:returns:                 An empty list, as no document needs to be written again.
+	"""
+	cache = _GetCache(sphinxApplication)
+	command = sphinxApplication.config.vhdl_graphviz_dot
+
+	missing: Dict[str, str] = {}
+	for diagrams in env.domains["vhdl"].data["diagrams"].values():
+		for hash, source in diagrams.items():
+			if hash not in cache:
+				missing[hash] = source
+
+	if len(missing) == 0:
+		return []
+
+	def render(item: Tuple[str, str]) -> Tuple[str, Nullable[bytes], str]:
+		hash, source = item
+		try:
+			return hash, _Render(command, source), ""
+		except CalledProcessError as ex:
+			return hash, None, ex.stderr.decode("utf-8", errors="replace").strip()
+		except OSError as ex:
+			return hash, None, str(ex)
+
+	rendered = 0
+	with ThreadPoolExecutor(max_workers=min(len(missing), cpu_count() or 1)) as executor:
+		for hash, svg, error in executor.map(render, missing.items()):
+			if svg is None:
+				logger.warning(f"Can't render diagram with '{command}': {error}", type="vhdl", subtype="diagram")
+				continue
+
+			cache.Write(hash, svg)
+			rendered += 1
+
+	print(f"[VHDL] Rendered {rendered} of {len(missing)} changed diagrams.")
+	return []
+
+
+@export
+def ResolveDiagrams(sphinxApplication: Sphinx, doctree: nodes.document, docname: str) -> None:
+	"""
+	Call back for Sphinx ``doctree-resolved`` event.
+
+	Replaces all diagram placeholders of a document by the rendered SVG image for HTML output. For other output formats,
+	or if a diagram couldn't be rendered, the DOT source is shown instead.
+
+	:param sphinxApplication: The Sphinx application.
+	:param doctree:           The document's resolved doctree.
+	:param docname:           The document's name.
+	"""
+	cache = None
+	if sphinxApplication.builder.format == "html":
+		cache = _GetCache(sphinxApplication)
+
+	for placeholder in list(doctree.findall(pending_vhdl_diagram)):
+		svg = cache.Get(placeholder["hash"]) if cache is not None else None
+		if svg is not None and "<svg" in svg:
+			svg = svg[svg.index("<svg"):]
+			replacement = nodes.raw("", f'<div class="vhdl-diagram">{svg}</div>', format="html")
+		else:
+			replacement = nodes.literal_block(placeholder["source"], placeholder["source"], language="dot")
+
+		placeholder.replace_self(replacement)
@@ -34,31 +34,27 @@
 
 This module contains all the directives of the VHDL domain.
 """
-from enum import Flag, auto
+from html import escape
 from textwrap import dedent
-from typing import List, Dict, Tuple
+from typing import Any, Callable, Iterable, List, Dict, NamedTuple, Tuple, Union, Optional as Nullable
 
 from docutils import nodes
+from docutils.parsers.rst.directives import unchanged_required
 from docutils.nodes import Node, section, table, tgroup
+from sphinx.addnodes import only, pending_xref
 from sphinx.directives import ObjectDescription
-from sphinx.domains import Domain
 from pyTooling.Decorators import export
-from pyGHDL.dom.DesignUnit import Entity
+from pyGHDL.dom.DesignUnit import Entity, Package
 from pyGHDL.dom.InterfaceItem import GenericConstantInterfaceItem, PortSignalInterfaceItem
 
-
-@export
-class ParameterStyle(Flag):
-	Never = auto()
-	Table = auto()
-	Sections = auto()
-
-
-@export
-class ArchitecturesStyle(Flag):
-	Never = auto()
-	Multiple = auto()
-	Always = auto()
+from VHDLDomain.Dependency import DependencyEntry
+from VHDLDomain.Diagram import pending_vhdl_diagram, CreateInstanceDiagram, DiagramHash
+from VHDLDomain.Format import GetFormatter
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Option import ParameterStyle, ArchitecturesStyle, GroupingStyle, DependencyDirection, DependencyOptions, DesignOptions, EntityOptions, LibraryOptions, PackageOptions, DesignStatisticsOptions, directiveOptions, GetDefaults
+from VHDLDomain.Order import GetSortedDesign
+from VHDLDomain.SourcePage import SourcePageName, SourcePagesEnabled
+from VHDLDomain.Statistics import DesignStatistics
 
 
 @export
@@ -99,60 +95,545 @@ class BaseDirective(ObjectDescription):
 	# def __init__(self, *args, **kwargs):
 	# 	super().__init__(*args, **kwargs)
 
+	def GetOptions(self) -> NamedTuple:
+		"""
+		Returns the effective options of this directive.
+
+		Explicitly given options (already converted by ``option_spec``) are merged into the default options, which were
+		compiled from ``vhdl_defaults`` once at ``config-inited``.
+
+		:returns: The typed options object.
+		"""
+		directiveName = self.name.split(":")[1]
+		defaults = GetDefaults(self.env.config, directiveName)
+
+		return directiveOptions[directiveName].Merge(defaults, self.options)
+
+	def GetDesign(self, designName: Nullable[str] = None) -> Tuple[str, Any]:
+		"""
+		Returns the name and the analyzed model of the design described by this directive.
+
+		The design's name is given by a directive argument or option ``:design:``. It can be omitted, if exactly one design
+		is loaded.
+
+		:param designName:  Name of the design given as directive argument, or ``None``.
+		:returns:           A tuple of the design's name and the design.
+		:raises ValueError: If the design is unknown or the name was omitted, but multiple designs are loaded.
+		"""
+		designs = self.env.domains["vhdl"].Designs
+		if designName is None:
+			designName = self.options.get("design")
+		if designName is None:
+			if len(designs) != 1:
+				raise ValueError(f"'{self.name}' requires a design name, because {len(designs)} designs are loaded.")
+			designName = next(iter(designs))
+
+		try:
+			return designName, designs[designName]
+		except KeyError:
+			raise ValueError(f"Parameter to '{self.name}' is an unknown design '{designName}'.")
+
+	def NoteObject(self, name: str, displayName: str, objectType: str, anchor: str, priority: int = 1) -> None:
+		"""
+		Add a described object to the domain's object table (used for ``objects.inv`` and the search index).
+
+		:param name:        Fully qualified, normalized name of the object.
+		:param displayName: Name displayed in search results and inventories.
+		:param objectType:  Object type.
+		:param anchor:      Anchor of the object's description in the current document.
+		:param priority:    Search priority.
+		"""
+		self.env.domains["vhdl"].Objects.Add(name, displayName, objectType, self.env.docname, anchor, priority)
+
+	def NoteDesign(self, designName: str, design) -> None:
+		"""Record that the current document depends on all source files of a design."""
+		self.env.domains["vhdl"].Tracker.Add(self.env.docname, ("design", designName), design.SourceHashes.Design)
+
+	def NoteLibrary(self, designName: str, design, libraryName: str) -> None:
+		"""Record that the current document depends on the set of source files of a library."""
+		self.env.domains["vhdl"].Tracker.Add(self.env.docname, ("library", designName, libraryName), design.SourceHashes.GetLibrary(libraryName))
+
+	def NoteUnit(self, designName: str, design, kind: SourceLocationKind, name: str) -> None:
+		"""
+		Record that the current document describes a design unit and thus depends on the unit's source file.
+
+		:param designName: Name of the design.
+		:param design:     The design.
+		:param kind:       Kind of the design unit.
+		:param name:       Normalized, qualified name of the design unit.
+		"""
+		tracker = self.env.domains["vhdl"].Tracker
+		tracker.AddUnit(self.env.docname, designName, name)
+
+		span = design.SourceLocations.Get(kind, name)
+		if span is not None:
+			tracker.Add(self.env.docname, ("file", designName, span.Document), design.SourceHashes.GetFile(span.Document))
+
+	def CreateSourceLink(self, designName: str, locations: SourceLocationTable, kind: SourceLocationKind, name: str) -> Nullable[Node]:
+		"""
+		Create a ``[source]`` link to the highlighted source page of a language construct (HTML builders only).
+
+		:param designName: Name of the design.
+		:param locations:  Source location index of the design.
+		:param kind:       Kind of the language construct.
+		:param name:       Qualified, normalized name of the language construct.
+		:returns:          The link node, or ``None`` if the builder doesn't generate source pages or no location is known.
+		"""
+		if not SourcePagesEnabled(self.env.app):
+			return None
+
+		span = locations.Get(kind, name)
+		if span is None:
+			return None
+
+		reference = pending_xref(
+			"",
+			nodes.inline(text="[source]", classes=["viewcode-link"]),
+			reftype="source",
+			refdomain="vhdl",
+			refexplicit=False,
+			reftarget=SourcePageName(designName, span.Document),
+			refid=SourceLocationTable.Anchor(kind, name),
+			refdoc=self.env.docname
+		)
+
+		return only("", nodes.paragraph("", "", reference), expr="html")
+
+	def _NoteInterfaceItems(self, unitName: str, anchorPrefix: str, objectType: str, item) -> List[str]:
+		identifiers = getattr(item, "Identifiers", None) or (item.Identifier, )
+		normalizedIdentifiers = getattr(item, "NormalizedIdentifiers", None) or (item.NormalizedIdentifier, )
+
+		anchors = []
+		for identifier, normalizedIdentifier in zip(identifiers, normalizedIdentifiers):
+			anchor = f"{anchorPrefix}-{objectType}-{normalizedIdentifier}"
+			self.NoteObject(f"{unitName}.{normalizedIdentifier}", identifier, objectType, anchor, priority=2)
+			anchors.append(anchor)
+
+		return anchors
+
+	@staticmethod
+	def _GroupInterfaceItems(items: Iterable) -> Dict[str, List]:
+		"""
+		Group interface items by the prefix of their (first) identifier up to the first underscore, e.g. ``axi_*``.
+
+		Items with a unique prefix or without underscore are collected in a group with an empty name.
+		"""
+		prefixes: Dict[str, List] = {}
+		for item in items:
+			identifier = (getattr(item, "Identifiers", None) or (item.Identifier, ))[0]
+			prefix = identifier.split("_", 1)[0] if "_" in identifier else ""
+			prefixes.setdefault(prefix.lower(), []).append(item)
+
+		groups: Dict[str, List] = {}
+		for prefix, groupItems in prefixes.items():
+			if prefix == "" or len(groupItems) == 1:
+				groups.setdefault("", []).extend(groupItems)
+			else:
+				groups[prefix] = groupItems
+
+		return groups
+
+	def _CreateCompactTable(self, unitName: str, anchorPrefix: str, objectType: str, items: Iterable, columns: Tuple[str, ...], cells: Callable[[Any], Tuple[str, ...]]) -> List[Node]:
+		"""
+		Create collapsible groups of interface items (see :meth:`_GroupInterfaceItems`).
+
+		For HTML, all groups are rendered as a single raw HTML node of ``<details>`` elements, thus the number of doctree
+		nodes doesn't grow with the number of items. Other builders get one paragraph per group listing its items; the
+		paragraph carries the anchors of all its items (noted in the object table), so references resolve in every output
+		format.
+
+		:param unitName:     Qualified, normalized name of the design unit.
+		:param anchorPrefix: Prefix of anchors.
+		:param objectType:   Object type of the interface items (``generic`` or ``port``).
+		:param items:        Interface items.
+		:param columns:      Column titles.
+		:param cells:        Function returning the cell texts of an item (first cell: names).
+		:returns:            List of nodes.
+		"""
+		header = "".join(f"<th class=\"head\">{escape(column)}</th>" for column in columns)
+
+		html = []
+		paragraphs = []
+		for groupName, groupItems in self._GroupInterfaceItems(items).items():
+			label = f"{groupName}_*" if groupName else "Other"
+			html.append(
+				f"<details class=\"vhdl-interface-group\"{' open' if not groupName else ''}>"
+				f"<summary>{escape(label)} ({len(groupItems)})</summary>"
+				f"<table class=\"docutils vhdl vhdl-{objectType}-table vhdl-compact-table\"><thead><tr>{header}</tr></thead><tbody>"
+			)
+
+			groupAnchors = []
+			texts = []
+			for item in groupItems:
+				anchors = self._NoteInterfaceItems(unitName, anchorPrefix, objectType, item)
+				itemCells = cells(item)
+				extraAnchors = "".join(f"<span id=\"{escape(anchor)}\"></span>" for anchor in anchors[1:])
+				html.append(
+					f"<tr id=\"{escape(anchors[0])}\"><td>{extraAnchors}{escape(itemCells[0])}</td>" +
+					"".join(f"<td>{escape(cell)}</td>" for cell in itemCells[1:]) +
+					"</tr>"
+				)
+				groupAnchors.extend(anchors)
+				texts.append(" ".join(cell for cell in itemCells if cell))
+
+			html.append("</tbody></table></details>")
+			paragraphs.append(nodes.paragraph(text=f"{label}: {'; '.join(texts)}", ids=groupAnchors))
+
+		return [
+			only("", nodes.raw("", "".join(html), format="html"), expr="html"),
+			only("", *paragraphs, expr="not html")
+		]
+
+	def _PrepareTable(self, columns: Dict[str, int], classes: List[str]) -> Tuple[table, tgroup]:
+		tableGroup = nodes.tgroup(cols=(len(columns)))
+		table = nodes.table("", tableGroup, classes=classes)
+
+		tableRow = nodes.row()
+		for columnTitle, width in columns.items():
+			tableGroup += nodes.colspec(colwidth=width)
+			tableRow += nodes.entry("", nodes.paragraph(text=columnTitle))
+
+		tableGroup += nodes.thead("", tableRow)
+
+		return table, tableGroup
+
+	def CreateGenericSection(self, entity: Union[Entity, Package], style: ParameterStyle) -> section:
+		unitName = f"{entity.Library.NormalizedIdentifier}.{entity.NormalizedIdentifier}"
+		formatter = GetFormatter(self.env.config)
+		content = [
+			nodes.title(text="Generics")
+		]
+
+		if True:
+			content.append(nodes.paragraph(text="list of all generics"))
+
+		if style is ParameterStyle.Table:
+			table, tableGroup = self._PrepareTable(
+				columns={
+					"Generic Name": 2,
+					"Type": 1,
+					"Default Value": 4,
+				},
+				classes=["vhdl", "vhdl-generic-table"]
+			)
+
+			tableBody = nodes.tbody()
+			tableGroup += tableBody
+
+			for generic in entity.GenericItems:
+				cellGenericName = nodes.entry()
+				cellGenericType = nodes.entry()
+				cellDefaultValue = nodes.entry()
+				tableBody += nodes.row("", cellGenericName, cellGenericType, cellDefaultValue, ids=self._NoteInterfaceItems(unitName, entity.NormalizedIdentifier, "generic", generic))
+
+				if isinstance(generic, GenericConstantInterfaceItem):
+					cellGenericName += nodes.paragraph(text=", ".join(generic.Identifiers))
+					cellGenericType += nodes.paragraph(text=formatter.Format(generic.Subtype))
+					if generic.DefaultExpression is not None:
+						cellDefaultValue += nodes.paragraph(text=formatter.Format(generic.DefaultExpression))
+
+			content.append(table)
+		elif style is ParameterStyle.Sections:
+			for generic in entity.GenericItems:
+				if isinstance(generic, GenericConstantInterfaceItem):
+					genericSection = nodes.section(ids=self._NoteInterfaceItems(unitName, entity.NormalizedIdentifier, "generic", generic))
+					genericSection.append(nodes.title(text=", ".join(generic.Identifiers)))
+					genericSection.append(nodes.paragraph(text=generic.Documentation))
+
+					content.append(genericSection)
+		elif style is ParameterStyle.Compact:
+			def genericCells(generic) -> Tuple[str, ...]:
+				if isinstance(generic, GenericConstantInterfaceItem):
+					return ", ".join(generic.Identifiers), formatter.Format(generic.Subtype), formatter.Format(generic.DefaultExpression)
+				return generic.Identifier, "", ""
+
+			content.extend(self._CreateCompactTable(unitName, entity.NormalizedIdentifier, "generic", entity.GenericItems, ("Generic Name", "Type", "Default Value"), genericCells))
+
+		section = nodes.section(
+			ids=[f"{entity.NormalizedIdentifier}-generics"],
+			classes=["vhdl", "vhdl-entity-generic-section"]
+		)
+		section.extend(content)
+
+		return section
 
 @export
 class DescribeDesign(BaseDirective):
 	"""
 	This directive will be replaced by the description of a VHDL design.
+
+	Source files are grouped by library or directory. Each source file is summarized by a link to its highlighted source
+	page, its design units and its documentation shortened to at most ``documentation`` characters, so the page size
+	is bounded for large designs.
 	"""
 
 	has_content = False
 	required_arguments = 0
-	optional_arguments = 0
+	optional_arguments = 1
+
+	option_spec = directiveOptions["describedesign"].OptionSpec
+
+	@staticmethod
+	def ShortenDocumentation(documentation: Nullable[str], maxLength: int) -> str:
+		"""Shorten documentation to at most ``maxLength`` characters at a word boundary."""
+		if documentation is None or maxLength == 0:
+			return ""
+
+		documentation = " ".join(documentation.split())
+		if len(documentation) <= maxLength:
+			return documentation
+
+		return documentation[:maxLength - 1].rsplit(" ", 1)[0] + "\u2026"
+
+	def CreateDocumentItem(self, designName: str, document, options: DesignOptions) -> nodes.list_item:
+		shortPath = document.ShortPath.as_posix()
+		anchor = nodes.make_id(f"{designName}-{shortPath}")
+		self.NoteObject(f"{designName.lower()}.{shortPath.lower()}", f"{designName}.{shortPath}", "document", anchor)
+		designUnits = ", ".join(designUnit.Identifier for designUnit in document.DesignUnits)
+
+		def createSummary(path: Node) -> nodes.paragraph:
+			summary = nodes.paragraph("", "", path)
+			if designUnits:
+				summary += nodes.Text(f" \u2013 {designUnits}")
+			return summary
+
+		# The link to the source page is kept for HTML only, as doctrees can be reused by other builders.
+		item = nodes.list_item("", ids=[anchor])
+		if SourcePagesEnabled(self.env.app):
+			reference = pending_xref(
+				"",
+				nodes.literal(text=shortPath),
+				reftype="source",
+				refdomain="vhdl",
+				refexplicit=False,
+				reftarget=SourcePageName(designName, shortPath),
+				refid="",
+				refdoc=self.env.docname
+			)
+			item += only("", createSummary(reference), expr="html")
+			item += only("", createSummary(nodes.literal(text=shortPath)), expr="not html")
+		else:
+			item += createSummary(nodes.literal(text=shortPath))
+
+		documentation = self.ShortenDocumentation(document.Documentation, options.Documentation)
+		if documentation:
+			item += nodes.paragraph(text=documentation)
+
+		return item
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
+		options: DesignOptions = self.GetOptions()
+
+		designName, design = self.GetDesign(self.arguments[0].strip() if len(self.arguments) == 1 else None)
+		self.NoteDesign(designName, design)
+
+		designAnchor = nodes.make_id(f"{designName}-design")
+		self.NoteObject(designName.lower(), designName, "design", designAnchor)
+
+		groups: Dict[str, List] = {}
+		for document in GetSortedDesign(design).Documents:
+			if options.GroupBy is GroupingStyle.Library:
+				designUnits = document.DesignUnits
+				groupName = designUnits[0].Library.Identifier if len(designUnits) > 0 else ""
+			elif options.GroupBy is GroupingStyle.Directory:
+				groupName = document.ShortPath.parent.as_posix()
+			else:
+				groupName = ""
+
+			groups.setdefault(groupName, []).append(document)
+
+		content = [nodes.target("", "", ids=[designAnchor])]
+		for groupName in sorted(groups, key=str.lower):
+			bulletList = nodes.bullet_list("", *(self.CreateDocumentItem(designName, document, options) for document in groups[groupName]))
+			if options.GroupBy is GroupingStyle.Never:
+				content.append(bulletList)
+				continue
+
+			section = nodes.section(
+				"",
+				nodes.title(text=groupName if groupName not in ("", ".") else "(none)"),
+				bulletList,
+				ids=[nodes.make_id(f"{designName}-{groupName}-files")],
+				classes=["vhdl", "vhdl-design-group-section"]
+			)
+			content.append(section)
 
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
+		return content
 
-		paragraph = nodes.paragraph(text="Describe design")
 
-		items = []
-		for document in design.Documents:
-			term = nodes.term(text=f"{document.ShortPath}")
-			description = nodes.paragraph(text=f"{document.Documentation}")
-			description = nodes.literal_block(text=f"{document.Documentation}")
-			definition = nodes.definition("", description)
+@export
+class DescribeDesignStatistics(BaseDirective):
+	"""
+	This directive will be replaced by statistics of a VHDL design.
+
+	A table lists per library the number of entities, architectures, packages, ports, generics, source files and lines.
+	A second table lists the top-N entities sorted by a column (option ``sortby``). Statistics were collected once while
+	loading the design.
+	"""
+
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 1
+
+	option_spec = directiveOptions["designstats"].OptionSpec
+
+	def CreateLibraryTable(self, statistics: DesignStatistics) -> table:
+		columns = ("Entities", "Architectures", "Packages", "Ports", "Generics", "Files", "Lines", "CodeLines", "CommentLines")
+		table, tableGroup = self._PrepareTable(
+			columns={
+				"Library": 3,
+				"Entities": 1,
+				"Architectures": 1,
+				"Packages": 1,
+				"Ports": 1,
+				"Generics": 1,
+				"Files": 1,
+				"Lines": 1,
+				"Code": 1,
+				"Comments": 1,
+				"Comment Ratio": 1,
+			},
+			classes=["vhdl", "vhdl-statistics-table"]
+		)
+
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		for row in (*statistics.IterateLibraries(), statistics.Total):
+			tableRow = nodes.row()
+			tableRow += nodes.entry("", nodes.paragraph(text=row.Library if row.Library else "Total"))
+			for column in columns:
+				tableRow += nodes.entry("", nodes.paragraph(text=str(getattr(row, column))))
+			tableRow += nodes.entry("", nodes.paragraph(text=f"{row.CommentRatio:.1%}"))
+			tableBody += tableRow
+
+		return table
+
+	def CreateTopEntitiesTable(self, statistics: DesignStatistics, options: DesignStatisticsOptions) -> table:
+		columns = ("Architectures", "Ports", "Generics", "Lines")
+		table, tableGroup = self._PrepareTable(
+			columns={
+				"Entity": 3,
+				**{column: 1 for column in columns}
+			},
+			classes=["vhdl", "vhdl-statistics-table"]
+		)
 
-			items.append(nodes.definition_list_item("", term, definition))
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
 
-		definitionList = nodes.definition_list("", *items)
+		for row in statistics.TopEntities(options.SortBy, options.Top):
+			tableRow = nodes.row()
+			tableRow += nodes.entry("", nodes.paragraph(text=f"{row.Library}.{row.Entity}"))
+			for column in columns:
+				tableRow += nodes.entry("", nodes.paragraph(text=str(getattr(row, column))))
+			tableBody += tableRow
 
-		return [paragraph, definitionList]
+		return table
+
+	def run(self) -> List[Node]:
+		options: DesignStatisticsOptions = self.GetOptions()
+
+		designName, design = self.GetDesign(self.arguments[0].strip() if len(self.arguments) == 1 else None)
+		self.NoteDesign(designName, design)
+
+		content = [
+			nodes.title(text=f"Statistics of {designName}"),
+			self.CreateLibraryTable(design.Statistics)
+		]
+
+		if options.Top > 0:
+			topSection = nodes.section(
+				"",
+				nodes.title(text=f"Top {options.Top} Entities by {options.SortBy}"),
+				self.CreateTopEntitiesTable(design.Statistics, options),
+				ids=[f"{nodes.make_id(designName)}-statistics-top"],
+				classes=["vhdl", "vhdl-statistics-top-section"]
+			)
+			content.append(topSection)
+
+		section = nodes.section(
+			ids=[f"{nodes.make_id(designName)}-statistics"],
+			classes=["vhdl", "vhdl-statistics-section"]
+		)
+		section.extend(content)
+
+		return [section]
 
 
 @export
-class DescribeLibrary(BaseDirective):
+class DescribeDependencies(BaseDirective):
 	"""
-	This directive will be replaced by the description of a VHDL library.
+	This directive will be replaced by the dependencies of a VHDL library or design unit.
+
+	The first argument is the unit's name (e.g. ``lib.counter`` or ``lib.counter(rtl)``), the optional second argument is
+	the design's name. Lists are taken from the closures precomputed after analysis, or walk at most ``depth`` levels.
 	"""
 
 	has_content = False
-	required_arguments = 0
-	optional_arguments = 0
+	required_arguments = 1
+	optional_arguments = 1
+
+	option_spec = directiveOptions["dependencies"].OptionSpec
+
+	def CreateDependencyTable(self, entries: List[DependencyEntry], depth: int) -> table:
+		columns = {"Unit": 3, "Kind": 1}
+		if depth > 0:
+			columns["Depth"] = 1
+
+		table, tableGroup = self._PrepareTable(columns=columns, classes=["vhdl", "vhdl-dependency-table"])
+
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		for entry in entries:
+			tableRow = nodes.row()
+			tableRow += nodes.entry("", nodes.paragraph(text=entry.DisplayName))
+			tableRow += nodes.entry("", nodes.paragraph(text=entry.Kind))
+			if depth > 0:
+				tableRow += nodes.entry("", nodes.paragraph(text=str(entry.Depth)))
+			tableBody += tableRow
+
+		return table
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
+		options: DependencyOptions = self.GetOptions()
 
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
+		unitName = self.arguments[0].strip().lower()
+		designName, design = self.GetDesign(self.arguments[1].strip() if len(self.arguments) == 2 else None)
+		self.NoteDesign(designName, design)
 
-		paragraph = nodes.paragraph(text="Describe library")
+		dependencies = design.Dependencies
+		if unitName not in dependencies:
+			raise ValueError(f"Parameter to 'vhdl:dependencies' is an unknown library or design unit '{unitName}'.")
 
-		return [paragraph]
+		sectionID = nodes.make_id(f"{unitName}-dependencies")
+		content = [
+			nodes.title(text=f"Dependencies of {self.arguments[0].strip()}")
+		]
+
+		lists = (
+			(DependencyDirection.Uses, "Uses", dependencies.Dependencies),
+			(DependencyDirection.UsedBy, "Used by", dependencies.Dependents),
+		)
+		for direction, title, query in lists:
+			if direction not in options.Direction:
+				continue
+
+			entries = query(unitName, options.Depth, options.Predefined)
+			content.append(nodes.rubric(text=title))
+			if len(entries) == 0:
+				content.append(nodes.paragraph(text="None."))
+			else:
+				content.append(self.CreateDependencyTable(entries, options.Depth))
+
+		section = nodes.section(
+			ids=[sectionID],
+			classes=["vhdl", "vhdl-dependencies-section"]
+		)
+		section.extend(content)
+
+		return [section]
 
 
 @export
@@ -166,13 +647,6 @@ class DescribeDocument(BaseDirective):
 	optional_arguments = 0
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
-
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-
-
 		paragraph = nodes.paragraph(text="Describe document")
 
 		return [paragraph]
@@ -188,17 +662,9 @@ class DescribeContext(BaseDirective):
 	required_arguments = 0
 	optional_arguments = 1
 
-	option_spec = {
-		"referencedby":  strip,
-	}
+	option_spec = directiveOptions["describecontext"].OptionSpec
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
-
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-
 		paragraph = nodes.paragraph(text="Describe context")
 
 		return [paragraph]
@@ -214,25 +680,7 @@ class DescribeEntity(BaseDirective):
 	required_arguments = 0
 	optional_arguments = 4
 
-	option_spec = {
-		"genericlist":   strip,
-		"portlist":      strip,
-		"architectures": strip,
-		"referencedby":  strip,
-	}
-
-	def _PrepareTable(self, columns: Dict[str, int], classes: List[str]) -> Tuple[table, tgroup]:
-		tableGroup = nodes.tgroup(cols=(len(columns)))
-		table = nodes.table("", tableGroup, classes=classes)
-
-		tableRow = nodes.row()
-		for columnTitle, width in columns.items():
-			tableGroup += nodes.colspec(colwidth=width)
-			tableRow += nodes.entry("", nodes.paragraph(text=columnTitle))
-
-		tableGroup += nodes.thead("", tableRow)
-
-		return table, tableGroup
+	option_spec = {**directiveOptions["describeentity"].OptionSpec, "design": unchanged_required}
 
 	def CreateDefinitionSection(self, entity: Entity) -> section:
 		title = nodes.title(text="Definition")
@@ -258,58 +706,9 @@ class DescribeEntity(BaseDirective):
 
 		return section
 
-	def CreateGenericSection(self, entity: Entity, style: ParameterStyle) -> section:
-		content = [
-			nodes.title(text="Generics")
-		]
-
-		if True:
-			content.append(nodes.paragraph(text="list of all generics"))
-
-		if style is ParameterStyle.Table:
-			table, tableGroup = self._PrepareTable(
-				columns={
-					"Generic Name": 2,
-					"Type": 1,
-					"Default Value": 4,
-				},
-				classes=["vhdl", "vhdl-generic-table"]
-			)
-
-			tableBody = nodes.tbody()
-			tableGroup += tableBody
-
-			for generic in entity.GenericItems:
-				cellGenericName = nodes.entry()
-				cellGenericType = nodes.entry()
-				cellDefaultValue = nodes.entry()
-				tableBody += nodes.row("", cellGenericName, cellGenericType, cellDefaultValue)
-
-				if isinstance(generic, GenericConstantInterfaceItem):
-					cellGenericName += nodes.paragraph(text=", ".join(generic.Identifiers))
-					cellGenericType += nodes.paragraph(text=generic.Documentation)
-					if generic.DefaultExpression is not None:
-						cellDefaultValue += nodes.paragraph(text="??")  # str(generic.DefaultExpression))
-
-			content.append(table)
-		elif style is ParameterStyle.Sections:
-			for generic in entity.GenericItems:
-				if isinstance(generic, GenericConstantInterfaceItem):
-					genericSection = nodes.section(ids=[f"{entity.NormalizedIdentifier}-generic-{nID}" for nID in generic.NormalizedIdentifiers])
-					genericSection.append(nodes.title(text=", ".join(generic.Identifiers)))
-					genericSection.append(nodes.paragraph(text=generic.Documentation))
-
-					content.append(genericSection)
-
-		section = nodes.section(
-			ids=[f"{entity.NormalizedIdentifier}-generics"],
-			classes=["vhdl", "vhdl-entity-generic-section"]
-		)
-		section.extend(content)
-
-		return section
-
 	def CreatePortSection(self, entity: Entity, style: ParameterStyle) -> section:
+		unitName = f"{entity.Library.NormalizedIdentifier}.{entity.NormalizedIdentifier}"
+		formatter = GetFormatter(self.env.config)
 		content = [
 			nodes.title(text="Ports")
 		]
@@ -336,24 +735,31 @@ class DescribeEntity(BaseDirective):
 				cellPortDirection = nodes.entry()
 				cellPortType = nodes.entry()
 				cellDefaultValue = nodes.entry()
-				tableBody += nodes.row("", cellPortName, cellPortDirection, cellPortType, cellDefaultValue)
+				tableBody += nodes.row("", cellPortName, cellPortDirection, cellPortType, cellDefaultValue, ids=self._NoteInterfaceItems(unitName, entity.NormalizedIdentifier, "port", port))
 
 				if isinstance(port, PortSignalInterfaceItem):
 					cellPortName += nodes.paragraph(text=", ".join(port.Identifiers))
 					cellPortDirection += nodes.paragraph(text=str(port.Mode))
-					cellPortType += nodes.paragraph(text=port.Documentation)
+					cellPortType += nodes.paragraph(text=formatter.Format(port.Subtype))
 					if port.DefaultExpression is not None:
-						cellDefaultValue += nodes.paragraph(text=str(port.DefaultExpression))
+						cellDefaultValue += nodes.paragraph(text=formatter.Format(port.DefaultExpression))
 
 			content.append(table)
 		elif style is ParameterStyle.Sections:
 			for port in entity.PortItems:
 				if isinstance(port, PortSignalInterfaceItem):
-					portSection = nodes.section(ids=[f"{entity.NormalizedIdentifier}-port-{nID}" for nID in port.NormalizedIdentifiers])
+					portSection = nodes.section(ids=self._NoteInterfaceItems(unitName, entity.NormalizedIdentifier, "port", port))
 					portSection.append(nodes.title(text=", ".join(port.Identifiers)))
 					portSection.append(nodes.paragraph(text=port.Documentation))
 
 					content.append(portSection)
+		elif style is ParameterStyle.Compact:
+			def portCells(port) -> Tuple[str, ...]:
+				if isinstance(port, PortSignalInterfaceItem):
+					return ", ".join(port.Identifiers), str(port.Mode), formatter.Format(port.Subtype), formatter.Format(port.DefaultExpression)
+				return ", ".join(port.Identifiers), "", "", ""
+
+			content.extend(self._CreateCompactTable(unitName, entity.NormalizedIdentifier, "port", entity.PortItems, ("Port Name", "Direction", "Type", "Default Value"), portCells))
 
 		section = nodes.section(
 			ids=[f"{entity.NormalizedIdentifier}-ports"],
@@ -363,9 +769,9 @@ class DescribeEntity(BaseDirective):
 
 		return section
 
-	def CreateArchitectureSection(self, entity: Entity) -> section:
+	def CreateArchitectureSection(self, design, entity: Entity) -> section:
 		title = nodes.title(text="Architectures")
-		paragraph = nodes.paragraph(text=", ".join(entity.Architectures))
+		paragraph = nodes.paragraph(text=", ".join(architecture.Identifier for architecture in GetSortedDesign(design).Architectures(entity)))
 		section = nodes.section(
 			"",
 			title,
@@ -389,121 +795,76 @@ class DescribeEntity(BaseDirective):
 
 		return section
 
-	def CreateInnerHierarchySection(self, entity: Entity) -> section:
-		title = nodes.title(text="Inner Hierarchy")
-		paragraph = nodes.paragraph(text="diagram of inner instances")
+	def CreateInnerHierarchySection(self, design, entity: Entity) -> section:
 		section = nodes.section(
 			"",
-			title,
-			paragraph,
+			nodes.title(text="Inner Hierarchy"),
 			ids=[f"{entity.NormalizedIdentifier}-hierarchy"],
 			classes=["vhdl", "vhdl-entity-innerhierarchy-section"]
 		)
 
-		return section
+		ports = [identifier for port in entity.PortItems for identifier in port.Identifiers]
+		formatter = GetFormatter(self.env.config)
+		command = self.env.config.vhdl_graphviz_dot
+		diagrams: Dict[str, str] = self.env.domains["vhdl"].data["diagrams"].setdefault(self.env.docname, {})
 
-	def ParseParameterStyleOption(self, optionName: str) -> ParameterStyle:
-		try:
-			option = self.options[optionName]
-		except KeyError:
-			try:
-				option = self.defaultValues[optionName]
-			except KeyError:
-				return ParameterStyle.Table
-
-		if option == "never":
-			return ParameterStyle.Never
-		elif option == "table":
-			return ParameterStyle.Table
-		elif option == "sections":
-			return ParameterStyle.Sections
-		else:
-			raise ValueError(f"value '{option}' is not in list of choices: never, table, sections.")
+		for architecture in GetSortedDesign(design).Architectures(entity):
+			source = CreateInstanceDiagram(architecture, ports, formatter)
+			if source is None:
+				continue
 
-	def ParseArchitecturesStyleOption(self, optionName: str) -> ArchitecturesStyle:
-		try:
-			option = self.options[optionName]
-		except KeyError:
-			try:
-				option = self.defaultValues[optionName]
-			except KeyError:
-				return ArchitecturesStyle.Multiple
-
-		if option == "never":
-			return ArchitecturesStyle.Never
-		elif option == "multiple":
-			return ArchitecturesStyle.Multiple
-		elif option == "always":
-			return ArchitecturesStyle.Always
-		else:
-			raise ValueError(f"value '{option}' is not in list of choices: never, multiple, always.")
+			hash = DiagramHash(source, command)
+			diagrams[hash] = source
 
-	def ParseBooleanOption(self, optionName: str, default: bool) -> bool:
-		try:
-			option = self.options[optionName]
-		except KeyError:
-			try:
-				option = self.defaultValues[optionName]
-			except KeyError:
-				return default
-
-		if option in ("yes", "true"):
-			return True
-		elif option in ("no", "false"):
-			return False
-		else:
-			raise ValueError(f"Value '{option}' not supported for a boolean value (yes/true, no/false).")
+			section.append(nodes.rubric(text=f"Architecture {architecture.Identifier}"))
+			section.append(pending_vhdl_diagram("", hash=hash, source=source))
 
-	def run(self) -> List[Node]:
-		from VHDLDomain import Design
+		if len(section) == 1:
+			section.append(nodes.paragraph(text="No inner instances."))
 
-		if len(self.arguments) == 1:
-			try:
-				libraryName, entityName = self.arguments[0].split(".")
-			except ValueError:
-				raise ValueError(f"Parameter to 'vhdl:describeentity' has incorrect format.")
-		else:
-			raise ValueError(f"Parameter to 'vhdl:describeentity' directive has too many content lines ({len(self.arguments)}).")
+		return section
 
-		# TODO: Can this be done in an __init__ or so?
-		self.directiveName = self.name.split(":")[1]
-		self.defaultValues = self.env.config.vhdl_defaults[self.directiveName]
+	def CreateEntitySection(self, designName: str, design, entity: Entity, options: Union[EntityOptions, LibraryOptions]) -> section:
+		self.NoteObject(f"{entity.Library.NormalizedIdentifier}.{entity.NormalizedIdentifier}", f"{entity.Library.Identifier}.{entity.Identifier}", "entity", entity.NormalizedIdentifier)
 
-		optionDefinition = self.ParseBooleanOption("definition", True)
-		optionGenerics = self.ParseParameterStyleOption("genericlist")
-		optionPorts = self.ParseParameterStyleOption("portlist")
-		optionArchitectures = self.ParseArchitecturesStyleOption("architectures")
-		optionReferencedBy = self.ParseBooleanOption("referencedby", True)
-		optionHierarchy = self.ParseBooleanOption("hierarchy", True)
+		showArchitectures = (
+			options.Architectures is ArchitecturesStyle.Always or
+			(options.Architectures is ArchitecturesStyle.Multiple and len(entity.Architectures) > 1)
+		)
 
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-		library = design.GetLibrary(libraryName.lower())
-		entity = library.Entities[entityName.lower()]
+		# Architectures are described within their entity's section (or its architecture section, if shown).
+		unitName = f"{entity.Library.NormalizedIdentifier}.{entity.NormalizedIdentifier}"
+		architectureAnchor = f"{entity.NormalizedIdentifier}-architectures" if showArchitectures else entity.NormalizedIdentifier
+		self.NoteUnit(designName, design, SourceLocationKind.Entity, unitName)
+		for architectureName, architecture in entity.Library.Architectures.get(entity.NormalizedIdentifier, {}).items():
+			self.NoteObject(f"{unitName}({architectureName})", f"{entity.Library.Identifier}.{entity.Identifier}({architecture.Identifier})", "architecture", architectureAnchor)
+			self.NoteUnit(designName, design, SourceLocationKind.Architecture, f"{unitName}({architectureName})")
 
 		content = [
 			nodes.title(text=entity.Identifier),
 			nodes.paragraph(text=entity.Documentation)
 		]
 
-		if optionDefinition:
+		sourceLink = self.CreateSourceLink(designName, design.SourceLocations, SourceLocationKind.Entity, f"{entity.Library.NormalizedIdentifier}.{entity.NormalizedIdentifier}")
+		if sourceLink is not None:
+			content.append(sourceLink)
+
+		if options.Definition:
 			content.append(self.CreateDefinitionSection(entity))
 
-		if optionGenerics is not ParameterStyle.Never:
-			content.append(self.CreateGenericSection(entity, optionGenerics))
-		if optionPorts is not ParameterStyle.Never:
-			content.append(self.CreatePortSection(entity, optionPorts))
+		if options.Generics is not ParameterStyle.Never:
+			content.append(self.CreateGenericSection(entity, options.Generics))
+		if options.Ports is not ParameterStyle.Never:
+			content.append(self.CreatePortSection(entity, options.Ports))
 
-		if (optionArchitectures is ArchitecturesStyle.Always or
-			(optionArchitectures is ArchitecturesStyle.Multiple and len(entity.Architectures) > 1)):
-			content.append(self.CreateArchitectureSection(entity))
+		if showArchitectures:
+			content.append(self.CreateArchitectureSection(design, entity))
 
-		if optionReferencedBy:
+		if options.ReferencedBy:
 			content.append(self.CreateReferencedBySection(entity))
 
-		if optionHierarchy:
-			content.append(self.CreateInnerHierarchySection(entity))
+		if options.Hierarchy:
+			content.append(self.CreateInnerHierarchySection(design, entity))
 
 		entitySection = nodes.section(
 			ids=[entity.NormalizedIdentifier],
@@ -511,7 +872,25 @@ class DescribeEntity(BaseDirective):
 		)
 		entitySection.extend(content)
 
-		return [entitySection]
+		return entitySection
+
+	def run(self) -> List[Node]:
+		if len(self.arguments) == 1:
+			try:
+				libraryName, entityName = self.arguments[0].split(".")
+			except ValueError:
+				raise ValueError(f"Parameter to 'vhdl:describeentity' has incorrect format.")
+		else:
+			raise ValueError(f"Parameter to 'vhdl:describeentity' directive has too many content lines ({len(self.arguments)}).")
+
+		options: EntityOptions = self.GetOptions()
+
+		designName, design = self.GetDesign()
+		entity = design.Units.GetUnit(libraryName, entityName)
+		if not isinstance(entity, Entity):
+			raise ValueError(f"Parameter to 'vhdl:describeentity' is an unknown entity '{self.arguments[0]}'.")
+
+		return [self.CreateEntitySection(designName, design, entity, options)]
 
 
 @export
@@ -525,12 +904,6 @@ class DescribeArchitecture(BaseDirective):
 	optional_arguments = 0
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
-
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-
 		paragraph = nodes.paragraph(text="Describe architecture")
 
 		return [paragraph]
@@ -546,21 +919,99 @@ class DescribePackage(BaseDirective):
 	required_arguments = 0
 	optional_arguments = 2
 
-	option_spec = {
-		"genericlist":   strip,
-		"referencedby":  strip,
-	}
+	option_spec = {**directiveOptions["describepackage"].OptionSpec, "design": unchanged_required}
+
+	def CreatePackageSection(self, designName: str, design, package: Package, genericStyle: ParameterStyle) -> section:
+		self.NoteObject(f"{package.Library.NormalizedIdentifier}.{package.NormalizedIdentifier}", f"{package.Library.Identifier}.{package.Identifier}", "package", package.NormalizedIdentifier)
+		self.NoteUnit(designName, design, SourceLocationKind.Package, f"{package.Library.NormalizedIdentifier}.{package.NormalizedIdentifier}")
+
+		content = [
+			nodes.title(text=package.Identifier),
+			nodes.paragraph(text=package.Documentation)
+		]
+
+		sourceLink = self.CreateSourceLink(designName, design.SourceLocations, SourceLocationKind.Package, f"{package.Library.NormalizedIdentifier}.{package.NormalizedIdentifier}")
+		if sourceLink is not None:
+			content.append(sourceLink)
+
+		if genericStyle is not ParameterStyle.Never and len(package.GenericItems) > 0:
+			content.append(self.CreateGenericSection(package, genericStyle))
+
+		packageSection = nodes.section(
+			ids=[package.NormalizedIdentifier],
+			classes=["vhdl", "vhdl-package-section"]
+		)
+		packageSection.extend(content)
+
+		return packageSection
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
+		if len(self.arguments) == 1:
+			try:
+				libraryName, packageName = self.arguments[0].split(".")
+			except ValueError:
+				raise ValueError(f"Parameter to 'vhdl:describepackage' has incorrect format.")
+		else:
+			raise ValueError(f"Parameter to 'vhdl:describepackage' directive has too many content lines ({len(self.arguments)}).")
 
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
+		options: PackageOptions = self.GetOptions()
 
-		paragraph = nodes.paragraph(text="Describe package")
+		designName, design = self.GetDesign()
+		package = design.Units.GetUnit(libraryName, packageName)
+		if not isinstance(package, Package):
+			raise ValueError(f"Parameter to 'vhdl:describepackage' is an unknown package '{self.arguments[0]}'.")
 
-		return [paragraph]
+		return [self.CreatePackageSection(designName, design, package, options.Generics)]
+
+
+@export
+class DescribeLibrary(DescribeEntity, DescribePackage):
+	"""
+	This directive will be replaced by the description of a VHDL library.
+
+	All entities and packages of the library are described in one pass. Options are merged once and apply to all
+	entities. Defaults are taken from ``vhdl_defaults["describeentity"]`` overridden by
+	``vhdl_defaults["describelibrary"]``.
+	"""
+
+	has_content = False
+	required_arguments = 1
+	optional_arguments = 0
+
+	option_spec = {**directiveOptions["describelibrary"].OptionSpec, "design": unchanged_required}
+
+	def run(self) -> List[Node]:
+		libraryName = self.arguments[0].strip()
+
+		options: LibraryOptions = self.GetOptions()
+
+		designName, design = self.GetDesign()
+		library = design.Units.GetLibrary(libraryName)
+		if library is None:
+			raise ValueError(f"Parameter to 'vhdl:describelibrary' is an unknown library '{libraryName}'.")
+
+		self.NoteObject(library.NormalizedIdentifier, library.Identifier, "library", library.NormalizedIdentifier)
+		self.NoteLibrary(designName, design, library.NormalizedIdentifier)
+
+		content = [
+			nodes.title(text=library.Identifier)
+		]
+
+		sortedDesign = GetSortedDesign(design)
+		for entity in sortedDesign.Entities(library):
+			content.append(self.CreateEntitySection(designName, design, entity, options))
+
+		if options.Packages:
+			for package in sortedDesign.Packages(library):
+				content.append(self.CreatePackageSection(designName, design, package, options.Generics))
+
+		librarySection = nodes.section(
+			ids=[library.NormalizedIdentifier],
+			classes=["vhdl", "vhdl-library-section"]
+		)
+		librarySection.extend(content)
+
+		return [librarySection]
 
 
 @export
@@ -574,12 +1025,6 @@ class DescribePackageBody(BaseDirective):
 	optional_arguments = 0
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
-
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-
 		paragraph = nodes.paragraph(text="Describe package body")
 
 		return [paragraph]
@@ -595,17 +1040,9 @@ class DescribeConfiguration(BaseDirective):
 	required_arguments = 0
 	optional_arguments = 1
 
-	option_spec = {
-		"referencedby":  strip,
-	}
+	option_spec = directiveOptions["describeconfiguration"].OptionSpec
 
 	def run(self) -> List[Node]:
-		from VHDLDomain import Design
-
-		vhdlDomain: Domain = self.env.domains["vhdl"]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-		design = designs["StopWatch"]
-
 		paragraph = nodes.paragraph(text="Describe configuration")
 
 		return [paragraph]
@@ -0,0 +1,246 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains a formatter converting pyVHDLModel expressions and subtype indications back into VHDL code.
+
+Formatted texts are memoized per model node (by identity), because constant expressions and subtype indications are
+shared by many interface items, e.g. a ``DATA_BITS`` generic used in hundreds of port declarations.
+"""
+from typing import Any, Callable, Dict, Tuple
+
+from pyTooling.Decorators import export
+from pyVHDLModel.Expression import BinaryExpression, UnaryExpression, TernaryExpression, QualifiedExpression, Aggregate
+from pyVHDLModel.Expression import SimpleAggregateElement, IndexedAggregateElement, RangedAggregateElement
+from pyVHDLModel.Expression import NamedAggregateElement, OthersAggregateElement, StringLiteral, BitStringLiteral
+from pyVHDLModel.Expression import SubtypeAllocation, QualifiedExpressionAllocation
+from pyVHDLModel.Name import SimpleName, SelectedName, AttributeName, AllName, IndexedName, ParenthesisName
+from sphinx.config import Config
+
+_configAttribute = "_vhdlFormatter"
+
+
+@export
+class ModelFormatter:
+	"""
+	Formats pyVHDLModel expressions, names and subtype indications as VHDL code.
+
+	Each formatted node is cached by identity together with a reference to the node, so a cached entry can't be confused
+	with a later node reusing the same ``id``. Nested nodes are formatted through the cache, too.
+	"""
+
+	_cache:    Dict[int, Tuple[Any, str]]
+	_handlers: Dict[type, Callable[["ModelFormatter", Any], str]]
+	_hits:     int
+	_misses:   int
+
+	def __init__(self) -> None:
+		self._cache = {}
+		self._handlers = {}
+		self._hits = 0
+		self._misses = 0
+
+	@property
+	def Hits(self) -> int:
+		return self._hits
+
+	@property
+	def Misses(self) -> int:
+		return self._misses
+
+	def Format(self, node: Any) -> str:
+		"""
+		Format an expression, name or subtype indication.
+
+		:param node: A pyVHDLModel node or ``None``.
+		:returns:    VHDL code (empty for ``None``).
+		"""
+		if node is None:
+			return ""
+
+		try:
+			cachedNode, text = self._cache[id(node)]
+			if cachedNode is node:
+				self._hits += 1
+				return text
+		except KeyError:
+			pass
+
+		self._misses += 1
+		text = self._GetHandler(type(node))(self, node)
+		self._cache[id(node)] = (node, text)
+
+		return text
+
+	def _GetHandler(self, nodeClass: type) -> Callable[["ModelFormatter", Any], str]:
+		try:
+			return self._handlers[nodeClass]
+		except KeyError:
+			pass
+
+		for baseClass in nodeClass.__mro__:
+			if baseClass in _handlers:
+				handler = _handlers[baseClass]
+				break
+		else:
+			handler = ModelFormatter._FormatOther
+
+		self._handlers[nodeClass] = handler
+		return handler
+
+	def _FormatOther(self, node: Any) -> str:
+		try:
+			return str(node)
+		except Exception:  # pyVHDLModel's __str__ implementations may access missing fields.
+			return "…"
+
+	def _FormatBinary(self, node: BinaryExpression) -> str:
+		left, middle, right = node._FORMAT
+		return f"{left}{self.Format(node.LeftOperand)}{middle}{self.Format(node.RightOperand)}{right}"
+
+	def _FormatUnary(self, node: UnaryExpression) -> str:
+		try:
+			before, after = node._FORMAT
+		except AttributeError:
+			return self._FormatOther(node)
+		return f"{before}{self.Format(node.Operand)}{after}"
+
+	def _FormatTernary(self, node: TernaryExpression) -> str:
+		first, second, third, last = node._FORMAT
+		return f"{first}{self.Format(node.FirstOperand)}{second}{self.Format(node.SecondOperand)}{third}{self.Format(node.ThirdOperand)}{last}"
+
+	def _FormatQualified(self, node: QualifiedExpression) -> str:
+		operand = self.Format(node.Operand)
+		if not isinstance(node.Operand, Aggregate):
+			operand = f"({operand})"
+		return f"{self.Format(node.Subtyped)}'{operand}"
+
+	def _FormatAggregate(self, node: Aggregate) -> str:
+		return f"({', '.join(self.Format(element) for element in node.Elements)})"
+
+	def _FormatSimpleElement(self, node: SimpleAggregateElement) -> str:
+		return self.Format(node.Expression)
+
+	def _FormatIndexedElement(self, node: IndexedAggregateElement) -> str:
+		return f"{self.Format(node.Index)} => {self.Format(node.Expression)}"
+
+	def _FormatRangedElement(self, node: RangedAggregateElement) -> str:
+		return f"{self.Format(node.Range)} => {self.Format(node.Expression)}"
+
+	def _FormatNamedElement(self, node: NamedAggregateElement) -> str:
+		return f"{self.Format(node.Name)} => {self.Format(node.Expression)}"
+
+	def _FormatOthersElement(self, node: OthersAggregateElement) -> str:
+		return f"others => {self.Format(node.Expression)}"
+
+	def _FormatString(self, node: StringLiteral) -> str:
+		return "\"" + node.Value.replace("\"", "\"\"") + "\""
+
+	def _FormatBitString(self, node: BitStringLiteral) -> str:
+		# The base (e.g. ``x``, ``16sx``) is provided by frontends recording it; pyVHDLModel itself stores the value only.
+		base = getattr(node, "Base", None)
+		if base is None:
+			base = ""
+		elif not isinstance(base, str):
+			base = base.name
+
+		return f"{base}\"{node.Value}\""
+
+	def _FormatSubtypeAllocation(self, node: SubtypeAllocation) -> str:
+		return f"new {self.Format(node.Subtype)}"
+
+	def _FormatQualifiedAllocation(self, node: QualifiedExpressionAllocation) -> str:
+		return f"new {self.Format(node.QualifiedExpression)}"
+
+	def _FormatSimpleName(self, node: SimpleName) -> str:
+		constraints = getattr(node, "Constraints", None)
+		if constraints:
+			return f"{node.Identifier}({', '.join(self.Format(constraint) for constraint in constraints)})"
+		return node.Identifier
+
+	def _FormatSelectedName(self, node: SelectedName) -> str:
+		return f"{self.Format(node.Prefix)}.{node.Identifier}"
+
+	def _FormatAttributeName(self, node: AttributeName) -> str:
+		return f"{self.Format(node.Prefix)}'{node.Identifier}"
+
+	def _FormatAllName(self, node: AllName) -> str:
+		return f"{self.Format(node.Prefix)}.all"
+
+	def _FormatIndexedName(self, node: IndexedName) -> str:
+		return f"{self.Format(node.Prefix)}({', '.join(self.Format(index) for index in node.Indices)})"
+
+	def _FormatParenthesisName(self, node: ParenthesisName) -> str:
+		return f"{self.Format(node.Prefix)}({', '.join(self.Format(association) for association in node.Associations)})"
+
+
+_handlers: Dict[type, Callable[[ModelFormatter, Any], str]] = {
+	BinaryExpression:              ModelFormatter._FormatBinary,
+	UnaryExpression:               ModelFormatter._FormatUnary,
+	TernaryExpression:             ModelFormatter._FormatTernary,
+	QualifiedExpression:           ModelFormatter._FormatQualified,
+	Aggregate:                     ModelFormatter._FormatAggregate,
+	SimpleAggregateElement:        ModelFormatter._FormatSimpleElement,
+	IndexedAggregateElement:       ModelFormatter._FormatIndexedElement,
+	RangedAggregateElement:        ModelFormatter._FormatRangedElement,
+	NamedAggregateElement:         ModelFormatter._FormatNamedElement,
+	OthersAggregateElement:        ModelFormatter._FormatOthersElement,
+	StringLiteral:                 ModelFormatter._FormatString,
+	BitStringLiteral:              ModelFormatter._FormatBitString,
+	SubtypeAllocation:             ModelFormatter._FormatSubtypeAllocation,
+	QualifiedExpressionAllocation: ModelFormatter._FormatQualifiedAllocation,
+	SimpleName:                    ModelFormatter._FormatSimpleName,
+	SelectedName:                  ModelFormatter._FormatSelectedName,
+	AttributeName:                 ModelFormatter._FormatAttributeName,
+	AllName:                       ModelFormatter._FormatAllName,
+	IndexedName:                   ModelFormatter._FormatIndexedName,
+	ParenthesisName:               ModelFormatter._FormatParenthesisName,
+}  #: Format methods per pyVHDLModel base class (the most derived class in a node's MRO wins).
+
+
+@export
+def GetFormatter(config: Config) -> ModelFormatter:
+	"""
+	Returns the formatter of the current build, which is created on first use.
+
+	The formatter is attached to the configuration object, so it lives for one build (per process) and isn't pickled.
+
+	:param config: The Sphinx configuration.
+	:returns:      The formatter.
+	"""
+	try:
+		return getattr(config, _configAttribute)
+	except AttributeError:
+		formatter = ModelFormatter()
+		setattr(config, _configAttribute, formatter)
+		return formatter
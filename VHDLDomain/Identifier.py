@@ -0,0 +1,154 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains a design-wide table of interned identifiers and a lookup table of libraries and design units keyed
+by identifier IDs.
+
+VHDL identifiers are case-insensitive. The identifier table maps each identifier to an integer ID once. Besides the
+normalized (lower case) form, every spelling interned from the sources is stored as an alias, so repeated lookups of
+the same spelling don't lower-case the string again. Lookups (e.g. of names written in cross-references) don't add
+aliases, so the table doesn't grow with every spelling used in the documentation. Qualified names are tuples of IDs,
+which are cheap to hash and compare.
+"""
+from typing import Dict, List, Tuple, Optional as Nullable
+
+from pyTooling.Decorators import export
+
+
+@export
+class IdentifierTable:
+	"""Interned, case-insensitive identifiers of a design."""
+
+	_ids:   Dict[str, int]
+	_names: List[str]
+
+	def __init__(self) -> None:
+		self._ids = {}
+		self._names = []
+
+	def __len__(self) -> int:
+		return len(self._names)
+
+	def Intern(self, identifier: str) -> int:
+		"""Returns the ID of an identifier. Unknown identifiers are added."""
+		try:
+			return self._ids[identifier]
+		except KeyError:
+			pass
+
+		normalized = identifier.lower()
+		id = self._ids.get(normalized)
+		if id is None:
+			id = len(self._names)
+			self._names.append(normalized)
+			self._ids[normalized] = id
+
+		self._ids[identifier] = id
+		return id
+
+	def Lookup(self, identifier: str) -> Nullable[int]:
+		"""Returns the ID of an identifier, or ``None`` if the identifier isn't used in the design."""
+		try:
+			return self._ids[identifier]
+		except KeyError:
+			return self._ids.get(identifier.lower())
+
+	def Name(self, id: int) -> str:
+		"""Returns the normalized identifier of an ID."""
+		return self._names[id]
+
+	def InternQualified(self, name: str) -> Tuple[int, ...]:
+		"""Returns the IDs of a dot-separated name (e.g. ``lib.pkg.func``). Unknown identifiers are added."""
+		return tuple(self.Intern(part) for part in name.split("."))
+
+	def LookupQualified(self, name: str) -> Nullable[Tuple[int, ...]]:
+		"""Returns the IDs of a dot-separated name, or ``None`` if any part isn't used in the design."""
+		ids = []
+		for part in name.split("."):
+			id = self.Lookup(part)
+			if id is None:
+				return None
+			ids.append(id)
+
+		return tuple(ids)
+
+
+@export
+class DesignUnitTable:
+	"""
+	Libraries and primary design units of a design keyed by identifier IDs.
+
+	The table is built once after analysis and replaces per-call lower-casing of names in dictionary lookups.
+	"""
+
+	_identifiers: IdentifierTable
+	_libraries:   Dict[int, "Library"]
+	_units:       Dict[Tuple[int, int], "DesignUnit"]
+
+	def __init__(self, identifiers: IdentifierTable) -> None:
+		self._identifiers = identifiers
+		self._libraries = {}
+		self._units = {}
+
+	def __len__(self) -> int:
+		return len(self._units)
+
+	def AddDesign(self, design) -> None:
+		"""
+		Add all libraries and their entities, packages, contexts and configurations.
+
+		:param design: An analyzed design.
+		"""
+		intern = self._identifiers.Intern
+		for library in design.Libraries.values():
+			libraryID = intern(library.Identifier)
+			self._libraries[libraryID] = library
+
+			for units in (library.Entities, library.Packages, library.Contexts, library.Configurations):
+				for unit in units.values():
+					self._units[(libraryID, intern(unit.Identifier))] = unit
+
+	def GetLibrary(self, libraryName: str) -> Nullable["Library"]:
+		"""Returns a library by name (case-insensitive), or ``None``."""
+		libraryID = self._identifiers.Lookup(libraryName)
+		return self._libraries.get(libraryID) if libraryID is not None else None
+
+	def GetUnit(self, libraryName: str, unitName: str) -> Nullable["DesignUnit"]:
+		"""Returns a primary design unit by library and unit name (case-insensitive), or ``None``."""
+		libraryID = self._identifiers.Lookup(libraryName)
+		unitID = self._identifiers.Lookup(unitName)
+		if libraryID is None or unitID is None:
+			return None
+
+		return self._units.get((libraryID, unitID))
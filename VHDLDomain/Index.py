@@ -41,6 +41,9 @@ from pyTooling.Decorators import export
 from pyVHDLModel import DesignUnitKind
 from sphinx.domains import Index, IndexEntry
 
+from VHDLDomain.Order import GetSortedDesign
+from VHDLDomain.Stub import StubDocumentName
+
 
 @export
 class BaseIndex(Index):
@@ -60,26 +63,29 @@ class LibraryIndex(BaseIndex):
 	def generate(self, docnames: Iterable[str] = None) -> Tuple[List[Tuple[str, List[IndexEntry]]], bool]:
 		result: List[Tuple[str, List[IndexEntry]]] = []
 
-		designs: Dict[str, Design] = self.domain.data["designs"]
-		design = designs["StopWatch"]
-		for library in design.Libraries.values():
-			entries = []
-			for entity in library.Entities.values():
-				entryName = entity.Identifier
-				entryKind = 0 if len(entity.Architectures) == 1 else 1
-				document = f"{entity.Library.Identifier}/{entity.Identifier}"
-				link = f"{entity.Library.Identifier}-{entity.Identifier}"
-				entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
-				if entryKind == 1:
-					for architecture in entity.Architectures.values():
-						architectureName = architecture.Identifier
-						architectureKind = 2
-						doc = f"{entity.Library.Identifier}/{entity.Identifier}-{architecture.Identifier}"
-						lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
-						entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
-
-			group = (library.Identifier, entries)
-			result.append(group)
+		stubDirectory: str = self.domain.env.config.vhdl_stub_directory or ""
+		designs: Dict[str, Design] = self.domain.Catalogs
+		for designName in sorted(designs):
+			sortedDesign = GetSortedDesign(designs[designName])
+			stubDesignName = designName if len(designs) > 1 else None
+			for library in sortedDesign.Libraries:
+				entries = []
+				for entity in sortedDesign.Entities(library):
+					entryName = entity.Identifier
+					entryKind = 0 if len(entity.Architectures) == 1 else 1
+					document = StubDocumentName(stubDirectory, entity.Library.Identifier, entity.Identifier, stubDesignName)
+					link = f"{entity.Library.Identifier}-{entity.Identifier}"
+					entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
+					if entryKind == 1:
+						for architecture in sortedDesign.Architectures(entity):
+							architectureName = architecture.Identifier
+							architectureKind = 2
+							doc = document
+							lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
+							entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
+
+				group = (library.Identifier, entries)
+				result.append(group)
 
 		return result, True
 
@@ -97,26 +103,29 @@ class DocumentIndex(BaseIndex):
 	def generate(self, docnames: Iterable[str] = None) -> Tuple[List[Tuple[str, List[IndexEntry]]], bool]:
 		result: List[Tuple[str, List[IndexEntry]]] = []
 
-		designs: Dict[str, Design] = self.domain.data["designs"]
-		design = designs["StopWatch"]
-		for library in design.Libraries.values():
-			entries = []
-			for entity in library.Entities.values():
-				entryName = entity.Identifier
-				entryKind = 0 if len(entity.Architectures) == 1 else 1
-				document = f"{entity.Library.Identifier}/{entity.Identifier}"
-				link = f"{entity.Library.Identifier}-{entity.Identifier}"
-				entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
-				if entryKind == 1:
-					for architecture in entity.Architectures.values():
-						architectureName = architecture.Identifier
-						architectureKind = 2
-						doc = f"{entity.Library.Identifier}/{entity.Identifier}-{architecture.Identifier}"
-						lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
-						entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
-
-			group = (library.Identifier, entries)
-			result.append(group)
+		stubDirectory: str = self.domain.env.config.vhdl_stub_directory or ""
+		designs: Dict[str, Design] = self.domain.Catalogs
+		for designName in sorted(designs):
+			sortedDesign = GetSortedDesign(designs[designName])
+			stubDesignName = designName if len(designs) > 1 else None
+			for library in sortedDesign.Libraries:
+				entries = []
+				for entity in sortedDesign.Entities(library):
+					entryName = entity.Identifier
+					entryKind = 0 if len(entity.Architectures) == 1 else 1
+					document = StubDocumentName(stubDirectory, entity.Library.Identifier, entity.Identifier, stubDesignName)
+					link = f"{entity.Library.Identifier}-{entity.Identifier}"
+					entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
+					if entryKind == 1:
+						for architecture in sortedDesign.Architectures(entity):
+							architectureName = architecture.Identifier
+							architectureKind = 2
+							doc = document
+							lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
+							entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
+
+				group = (library.Identifier, entries)
+				result.append(group)
 
 		return result, True
 
@@ -134,26 +143,29 @@ class ComponentIndex(BaseIndex):
 	def generate(self, docnames: Iterable[str] = None) -> Tuple[List[Tuple[str, List[IndexEntry]]], bool]:
 		result: List[Tuple[str, List[IndexEntry]]] = []
 
-		designs: Dict[str, Design] = self.domain.data["designs"]
-		design = designs["StopWatch"]
-		for library in design.Libraries.values():
-			entries = []
-			for entity in library.Entities.values():
-				entryName = entity.Identifier
-				entryKind = 0 if len(entity.Architectures) == 1 else 1
-				document = f"{entity.Library.Identifier}/{entity.Identifier}"
-				link = f"{entity.Library.Identifier}-{entity.Identifier}"
-				entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
-				if entryKind == 1:
-					for architecture in entity.Architectures.values():
-						architectureName = architecture.Identifier
-						architectureKind = 2
-						doc = f"{entity.Library.Identifier}/{entity.Identifier}-{architecture.Identifier}"
-						lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
-						entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
-
-			group = (library.Identifier, entries)
-			result.append(group)
+		stubDirectory: str = self.domain.env.config.vhdl_stub_directory or ""
+		designs: Dict[str, Design] = self.domain.Catalogs
+		for designName in sorted(designs):
+			sortedDesign = GetSortedDesign(designs[designName])
+			stubDesignName = designName if len(designs) > 1 else None
+			for library in sortedDesign.Libraries:
+				entries = []
+				for entity in sortedDesign.Entities(library):
+					entryName = entity.Identifier
+					entryKind = 0 if len(entity.Architectures) == 1 else 1
+					document = StubDocumentName(stubDirectory, entity.Library.Identifier, entity.Identifier, stubDesignName)
+					link = f"{entity.Library.Identifier}-{entity.Identifier}"
+					entries.append((entryName, entryKind, document, link, document, "", entity.Documentation))
+					if entryKind == 1:
+						for architecture in sortedDesign.Architectures(entity):
+							architectureName = architecture.Identifier
+							architectureKind = 2
+							doc = document
+							lnk = f"{entity.Library.Identifier}-{entity.Identifier}-{architecture.Identifier}"
+							entries.append((architectureName, architectureKind, doc, lnk, doc, "", architecture.Documentation))
+
+				group = (library.Identifier, entries)
+				result.append(group)
 
 		return result, True
 
@@ -171,19 +183,22 @@ class PackageIndex(BaseIndex):
 	def generate(self, docnames: Iterable[str] = None) -> Tuple[List[Tuple[str, List[IndexEntry]]], bool]:
 		result: List[Tuple[str, List[IndexEntry]]] = []
 
-		designs: Dict[str, Design] = self.domain.data["designs"]
-		design = designs["StopWatch"]
-		for library in design.Libraries.values():
-			entries = []
-			for package in library.Packages.values():
-				entryName = package.Identifier
-				entryKind = 0
-				document = f"{package.Library.Identifier}/{package.Identifier}"
-				link = f"{package.Library.Identifier}-{package.Identifier}"
-				entries.append((entryName, entryKind, document, link, document, "", package.Documentation))
-
-			group = (library.Identifier, entries)
-			result.append(group)
+		stubDirectory: str = self.domain.env.config.vhdl_stub_directory or ""
+		designs: Dict[str, Design] = self.domain.Catalogs
+		for designName in sorted(designs):
+			sortedDesign = GetSortedDesign(designs[designName])
+			stubDesignName = designName if len(designs) > 1 else None
+			for library in sortedDesign.Libraries:
+				entries = []
+				for package in sortedDesign.Packages(library):
+					entryName = package.Identifier
+					entryKind = 0
+					document = StubDocumentName(stubDirectory, package.Library.Identifier, package.Identifier, stubDesignName)
+					link = f"{package.Library.Identifier}-{package.Identifier}"
+					entries.append((entryName, entryKind, document, link, document, "", package.Documentation))
+
+				group = (library.Identifier, entries)
+				result.append(group)
 
 		return result, True
 
@@ -0,0 +1,288 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains the object table of documented VHDL objects, which is written into ``objects.inv``, and the
+index of external VHDL inventories used to resolve references to objects documented in other Sphinx projects.
+"""
+from hashlib import sha256
+from io import BytesIO
+from os import replace as os_replace
+from pathlib import Path
+from pickle import dump, load, HIGHEST_PROTOCOL, UnpicklingError
+from posixpath import join as posix_join
+from typing import Dict, Generator, List, NamedTuple, Optional as Nullable, Tuple, Union
+from zlib import error as ZLibError
+
+from pyTooling.Decorators import export
+from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.errors import ConfigError
+from sphinx.util.inventory import InventoryFile
+
+
+@export
+class ObjectEntry(NamedTuple):
+	"""An entry of the object table as expected by :meth:`sphinx.domains.Domain.get_objects`."""
+	Name:        str  #: Fully qualified, normalized name, e.g. ``lib_utilities.counter.clock``.
+	DisplayName: str  #: Name displayed in search results and inventories.
+	Type:        str  #: Object type (key in :attr:`VHDLDomain.object_types`).
+	DocName:     str  #: Document describing the object.
+	Anchor:      str  #: Anchor of the object's description in that document.
+	Priority:    int  #: Search priority: 0 important, 1 default, 2 unimportant, -1 hidden.
+
+
+@export
+class ObjectTable:
+	"""
+	Flat table of all documented VHDL objects.
+
+	Directives add an entry per described object while a document is read. Entries are grouped by document name only, so
+	outdated documents can be removed and parallel read results can be merged without touching other entries. Writing an
+	inventory iterates the table as is, without walking the analyzed designs.
+	"""
+
+	_entries: Dict[str, List[ObjectEntry]]
+	_index:   Nullable[Dict[str, Dict[Tuple[str, str], ObjectEntry]]]
+
+	def __init__(self) -> None:
+		self._entries = {}
+		self._index = None
+
+	def __getstate__(self) -> Dict:
+		return {"_entries": self._entries}
+
+	def __setstate__(self, state: Dict) -> None:
+		self._entries = state["_entries"]
+		self._index = None
+
+	def __len__(self) -> int:
+		return sum(len(entries) for entries in self._entries.values())
+
+	def __iter__(self) -> Generator[ObjectEntry, None, None]:
+		for entries in self._entries.values():
+			yield from entries
+
+	def Add(self, name: str, displayName: str, objectType: str, docName: str, anchor: str, priority: int = 1) -> None:
+		"""Add an object described in document ``docName``."""
+		try:
+			entries = self._entries[docName]
+		except KeyError:
+			entries = self._entries[docName] = []
+
+		entries.append(ObjectEntry(name, displayName, objectType, docName, anchor, priority))
+		self._index = None
+
+	def ClearDocument(self, docName: str) -> None:
+		"""Remove all objects described in document ``docName``."""
+		self._entries.pop(docName, None)
+		self._index = None
+
+	def MergeDocuments(self, other: "ObjectTable", docNames: set) -> None:
+		"""Copy all objects described in ``docNames`` from another table (e.g. of a parallel reader process)."""
+		for docName in docNames:
+			try:
+				self._entries[docName] = other._entries[docName]
+			except KeyError:
+				pass
+
+		self._index = None
+
+	def GetLibrary(self, libraryName: str) -> Dict[Tuple[str, str], ObjectEntry]:
+		"""
+		Returns all objects of a library as a dictionary of (object type, normalized name) to entries.
+
+		The index is built once after the table was modified, so many lookups can be grouped per library.
+
+		:param libraryName: Normalized name of the library.
+		:returns:           Dictionary of objects in that library (empty, if the library is unknown).
+		"""
+		if self._index is None:
+			index: Dict[str, Dict[Tuple[str, str], ObjectEntry]] = {}
+			for entry in self:
+				library = entry.Name.split(".", 1)[0]
+				index.setdefault(library, {}).setdefault((entry.Type, entry.Name), entry)
+			self._index = index
+
+		return self._index.get(libraryName, {})
+
+	def Get(self, objectType: str, name: str) -> Nullable[ObjectEntry]:
+		"""Returns a documented object by object type and fully qualified name (case-insensitive), or ``None``."""
+		name = name.lower()
+		return self.GetLibrary(name.split(".", 1)[0]).get((objectType, name))
+
+
+@export
+class ExternalObject(NamedTuple):
+	"""A VHDL object documented in another Sphinx project."""
+	Project:     str  #: Name of the external project.
+	URI:         str  #: Absolute URI of the object's description.
+	DisplayName: str  #: Display name, or ``-`` if it equals the name.
+
+
+@export
+class ExternalInventory:
+	"""
+	A hash index of VHDL objects loaded from external Sphinx inventories (``objects.inv``).
+
+	Inventories are read from local files (e.g. a local mirror of other projects' documentation). Only entries of the
+	VHDL domain are kept. The parsed entries of each inventory are cached on disk per SHA-256 hash of the inventory file,
+	so unchanged inventories are not decompressed and parsed again. If several inventories contain an object, the
+	inventory configured first wins.
+	"""
+
+	_cacheDirectory: Nullable[Path]
+	_objects:        Dict[Tuple[str, str], ExternalObject]
+
+	def __init__(self, cacheDirectory: Nullable[Path] = None) -> None:
+		"""
+		Initializes an empty inventory index.
+
+		:param cacheDirectory: Directory for parsed inventories, or ``None`` to disable the cache.
+		"""
+		self._cacheDirectory = cacheDirectory
+		self._objects = {}
+
+	def __len__(self) -> int:
+		return len(self._objects)
+
+	@staticmethod
+	def Parse(content: bytes, baseURI: str) -> Dict[Tuple[str, str], ExternalObject]:
+		"""
+		Parse the VHDL entries of an inventory.
+
+		:param content: Content of an ``objects.inv`` file.
+		:param baseURI: Base URI of the external documentation.
+		:returns:       Dictionary of (object type, normalized name) to external objects.
+		"""
+		inventory = InventoryFile.load(BytesIO(content), baseURI, posix_join)
+
+		objects = {}
+		for inventoryType, entries in inventory.items():
+			domainName, objectType = inventoryType.split(":", 1)
+			if domainName != "vhdl":
+				continue
+
+			for name, (project, _, uri, displayName) in entries.items():
+				objects[(objectType, name.lower())] = ExternalObject(project, uri, displayName)
+
+		return objects
+
+	def Load(self, path: Path, baseURI: str) -> int:
+		"""
+		Add the VHDL entries of an inventory file.
+
+		:param path:    Path to a local ``objects.inv`` file.
+		:param baseURI: Base URI of the external documentation.
+		:returns:       Number of VHDL entries in that inventory.
+		"""
+		content = path.read_bytes()
+		hash = sha256(content)
+		hash.update(f"\0{baseURI}".encode("utf-8"))
+
+		objects = None
+		cacheFile = None
+		if self._cacheDirectory is not None:
+			cacheFile = self._cacheDirectory / f"{hash.hexdigest()}.pickle"
+			try:
+				with cacheFile.open("rb") as fileHandle:
+					objects = load(fileHandle)
+			except (OSError, ValueError, UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError):
+				objects = None
+
+		if objects is None:
+			objects = self.Parse(content, baseURI)
+			if cacheFile is not None:
+				temporaryFile = cacheFile.with_name(f"{cacheFile.name}.tmp")
+				try:
+					self._cacheDirectory.mkdir(parents=True, exist_ok=True)
+					with temporaryFile.open("wb") as fileHandle:
+						dump(objects, fileHandle, protocol=HIGHEST_PROTOCOL)
+					os_replace(temporaryFile, cacheFile)
+				except OSError as ex:
+					print(f"[VHDL][WARNING] Can't cache inventory '{path}': {ex}")
+
+		for key, externalObject in objects.items():
+			self._objects.setdefault(key, externalObject)
+
+		return len(objects)
+
+	def Get(self, objectType: str, name: str) -> Nullable[ExternalObject]:
+		"""
+		Look up an external object.
+
+		:param objectType: Object type, e.g. ``entity``.
+		:param name:       Fully qualified name (case-insensitive).
+		:returns:          The external object, or ``None`` if it's unknown.
+		"""
+		return self._objects.get((objectType, name.lower()))
+
+
+@export
+def LoadExternalInventories(sphinxApplication: Sphinx) -> None:
+	"""
+	Call back for Sphinx ``builder-inited`` event.
+
+	Loads all inventories configured in ``vhdl_inventories``. Each entry maps a project name to a tuple of base URI and
+	path to a local inventory file (relative to the directory containing :file:`conf.py`).
+
+	:param sphinxApplication: The Sphinx application.
+	"""
+	config = sphinxApplication.config
+	inventory = ExternalInventory(Path(sphinxApplication.doctreedir) / "vhdl-inventories")
+	config._vhdlExternalInventory = inventory
+
+	inventories: Dict[str, Tuple[str, Union[str, Path]]] = config.vhdl_inventories
+	for projectName, entry in inventories.items():
+		try:
+			baseURI, inventoryPath = entry
+		except (TypeError, ValueError):
+			raise ConfigError(f"vhdl_inventories['{projectName}'] must be a tuple of base URI and inventory path.")
+
+		path = Path(sphinxApplication.confdir) / inventoryPath
+		try:
+			count = inventory.Load(path, baseURI)
+		except (OSError, ValueError, ZLibError) as ex:
+			print(f"[VHDL][WARNING] Can't load inventory '{path}' of '{projectName}': {ex}")
+			continue
+
+		print(f"[VHDL] Loaded {count} VHDL objects from inventory of '{projectName}'.")
+
+
+@export
+def GetExternalInventory(config: Config) -> ExternalInventory:
+	"""Returns the external inventory index loaded at ``builder-inited`` (empty, if not loaded)."""
+	try:
+		return config._vhdlExternalInventory
+	except AttributeError:
+		return ExternalInventory()
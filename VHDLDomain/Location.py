@@ -0,0 +1,309 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains the source location index of the VHDL domain.
+
+Source locations (file, line and column) of design units, subprograms and their parameters, types, components,
+constants, generics and ports are captured once while parsing, because positions can only be computed while the VHDL sources are loaded into GHDL.
+"""
+from array import array
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Iterable, Generator, Optional as Nullable, Tuple
+
+from pyTooling.Decorators import export
+from pyVHDLModel.DesignUnit import Entity, Architecture, Package, PackageBody, Context, Configuration, Component
+from pyVHDLModel.Object import BaseConstant
+from pyVHDLModel.Subprogram import Function, Procedure
+from pyVHDLModel.Type import BaseType
+
+
+@export
+class SourceLocationKind(IntEnum):
+	"""Kind of a VHDL language construct with a source location."""
+	Entity =        0
+	Architecture =  1
+	Package =       2
+	PackageBody =   3
+	Context =       4
+	Configuration = 5
+	Function =      6
+	Procedure =     7
+	Generic =       8
+	Port =          9
+	Type =          10
+	Component =     11
+	Constant =      12
+	Parameter =     13
+
+	def __str__(self) -> str:
+		return self.name.lower()
+
+
+@export
+def OverloadName(name: str, overload: int) -> str:
+	"""
+	Returns the name of an overloaded subprogram in the source location index.
+
+	The first overload uses the subprogram's qualified name, further overloads append their number in order of
+	declaration, e.g. ``lib.pkg.to_slv-2``. A hyphen can't occur in a VHDL identifier, thus names can't collide.
+
+	:param name:     Qualified, normalized name of the subprogram.
+	:param overload: Number of the overload in order of declaration (starting at 1).
+	:returns:        The name in the source location index.
+	"""
+	return name if overload == 1 else f"{name}-{overload}"
+
+
+@export
+class SourceSpan(NamedTuple):
+	"""A line range within a VHDL source file."""
+	Document:  str  #: Path of the source file relative to the design's base directory.
+	Line:      int  #: First line (1-based).
+	Column:    int  #: Column in the first line (1-based).
+	EndLine:   int  #: Last line (1-based, inclusive).
+
+
+_designUnitKinds = (
+	(Entity,        SourceLocationKind.Entity),
+	(Architecture,  SourceLocationKind.Architecture),
+	(PackageBody,   SourceLocationKind.PackageBody),
+	(Package,       SourceLocationKind.Package),
+	(Context,       SourceLocationKind.Context),
+	(Configuration, SourceLocationKind.Configuration),
+)
+
+
+@export
+class SourceLocationTable:
+	"""
+	A compact, array-backed table of source locations.
+
+	Each row stores kind, document index, line, column and end line in parallel :py:class:`array.array` columns. Rows are
+	addressed by kind and a qualified, normalized name like ``lib_utilities.counter``, ``lib_utilities.counter.clock``
+	(port or generic), ``lib_utilities.counter(rtl)`` (architecture) or ``lib_utilities.pkg.to_slv-2.value`` (parameter of
+	the second overload).
+	"""
+	_documents:      List[str]
+	_documentIndex:  Dict[str, int]
+	_documentRows:   List[array]
+	_keys:           Dict[Tuple[int, str], int]
+	_names:          List[str]
+
+	_kindColumn:     array
+	_documentColumn: array
+	_lineColumn:     array
+	_columnColumn:   array
+	_endLineColumn:  array
+
+	def __init__(self):
+		self._documents = []
+		self._documentIndex = {}
+		self._documentRows = []
+		self._keys = {}
+		self._names = []
+
+		self._kindColumn =     array("B")
+		self._documentColumn = array("I")
+		self._lineColumn =     array("I")
+		self._columnColumn =   array("I")
+		self._endLineColumn =  array("I")
+
+	def __len__(self) -> int:
+		return len(self._kindColumn)
+
+	@property
+	def Documents(self) -> List[str]:
+		return self._documents
+
+	def _GetDocumentIndex(self, document: str) -> int:
+		try:
+			return self._documentIndex[document]
+		except KeyError:
+			index = len(self._documents)
+			self._documents.append(document)
+			self._documentIndex[document] = index
+			self._documentRows.append(array("I"))
+			return index
+
+	def Add(self, kind: SourceLocationKind, name: str, document: str, line: int, column: int, endLine: int) -> int:
+		"""
+		Add a source location.
+
+		If a location for the same kind and name exists, the first location is kept. Overloaded subprograms are numbered
+		with :func:`OverloadName`.
+
+		:param kind:     Kind of the language construct.
+		:param name:     Qualified, normalized name.
+		:param document: Path of the source file relative to the design's base directory.
+		:param line:     First line.
+		:param column:   Column in the first line.
+		:param endLine:  Last line.
+		:returns:        Row index of the source location.
+		"""
+		key = (kind, name)
+		try:
+			return self._keys[key]
+		except KeyError:
+			pass
+
+		row = len(self._kindColumn)
+		documentIndex = self._GetDocumentIndex(document)
+		self._kindColumn.append(kind)
+		self._documentColumn.append(documentIndex)
+		self._lineColumn.append(line)
+		self._columnColumn.append(column)
+		self._endLineColumn.append(max(line, endLine))
+		self._keys[key] = row
+		self._names.append(name)
+		self._documentRows[documentIndex].append(row)
+
+		return row
+
+	def _Row(self, row: int) -> SourceSpan:
+		return SourceSpan(
+			self._documents[self._documentColumn[row]],
+			self._lineColumn[row],
+			self._columnColumn[row],
+			self._endLineColumn[row]
+		)
+
+	def Get(self, kind: SourceLocationKind, name: str) -> Nullable[SourceSpan]:
+		"""
+		Lookup the source location of a language construct.
+
+		:param kind: Kind of the language construct.
+		:param name: Qualified, normalized name.
+		:returns:    The source span, otherwise ``None``.
+		"""
+		try:
+			return self._Row(self._keys[(kind, name)])
+		except KeyError:
+			return None
+
+	def IterateDocument(self, document: str) -> Generator[Tuple[SourceLocationKind, str, SourceSpan], None, None]:
+		"""
+		Iterate all source locations within a source file ordered by line.
+
+		:param document: Path of the source file relative to the design's base directory.
+		:returns:        A generator of tuples of kind, qualified name and source span.
+		"""
+		try:
+			documentIndex = self._documentIndex[document]
+		except KeyError:
+			return
+
+		rows = sorted(self._documentRows[documentIndex], key=lambda row: (self._lineColumn[row], -self._endLineColumn[row]))
+		for row in rows:
+			yield SourceLocationKind(self._kindColumn[row]), self._names[row], self._Row(row)
+
+	@staticmethod
+	def Anchor(kind: SourceLocationKind, name: str) -> str:
+		"""Returns the HTML anchor of a language construct on a source page."""
+		return f"{kind}-{name}"
+
+	def _AddInterfaceItems(self, kind: SourceLocationKind, prefix: str, items: Iterable, document: str) -> None:
+		for item in items:
+			position = getattr(item, "Position", None)
+			if position is None:
+				continue
+
+			for identifier in getattr(item, "NormalizedIdentifiers", ()):
+				self.Add(kind, f"{prefix}.{identifier}", document, position.Line, position.Column, position.Line)
+
+	def AddDocument(self, document, shortPath: str, lineCount: int) -> None:
+		"""
+		Capture source locations of all design units in a parsed document.
+
+		A design unit spans up to the line before the next design unit, or the end of the source file. Subprograms (and
+		their parameters), types, components and constants declared in packages, as well as generics and ports span a
+		single line.
+
+		:param document:  A parsed and translated pyGHDL document, already added to a library.
+		:param shortPath: Path of the source file relative to the design's base directory.
+		:param lineCount: Number of lines in the source file.
+		"""
+		designUnits = []
+		for designUnit in document.DesignUnits:
+			position = getattr(designUnit, "Position", None)
+			if position is not None:
+				designUnits.append((position.Line, position.Column, designUnit))
+		designUnits.sort(key=lambda item: item[0])
+
+		for index, (line, column, designUnit) in enumerate(designUnits):
+			endLine = designUnits[index + 1][0] - 1 if index + 1 < len(designUnits) else lineCount
+
+			for unitClass, kind in _designUnitKinds:
+				if isinstance(designUnit, unitClass):
+					break
+			else:
+				continue
+
+			libraryName = designUnit.Library.NormalizedIdentifier
+			if kind is SourceLocationKind.Architecture:
+				name = f"{libraryName}.{designUnit.Entity.NormalizedIdentifier}({designUnit.NormalizedIdentifier})"
+			else:
+				name = f"{libraryName}.{designUnit.NormalizedIdentifier}"
+
+			self.Add(kind, name, shortPath, line, column, endLine)
+
+			if kind in (SourceLocationKind.Entity, SourceLocationKind.Package):
+				self._AddInterfaceItems(SourceLocationKind.Generic, name, designUnit.GenericItems, shortPath)
+			if kind is SourceLocationKind.Entity:
+				self._AddInterfaceItems(SourceLocationKind.Port, name, designUnit.PortItems, shortPath)
+			elif kind is SourceLocationKind.Package:
+				overloads: Dict[Tuple[SourceLocationKind, str], int] = {}
+				for item in designUnit.DeclaredItems:
+					if isinstance(item, BaseConstant):
+						self._AddInterfaceItems(SourceLocationKind.Constant, name, (item, ), shortPath)
+						continue
+					elif isinstance(item, Function):
+						itemKind = SourceLocationKind.Function
+					elif isinstance(item, Procedure):
+						itemKind = SourceLocationKind.Procedure
+					elif isinstance(item, BaseType):
+						itemKind = SourceLocationKind.Type
+					elif isinstance(item, Component):
+						itemKind = SourceLocationKind.Component
+					else:
+						continue
+
+					itemName = f"{name}.{item.NormalizedIdentifier}"
+					overload = overloads[(itemKind, itemName)] = overloads.get((itemKind, itemName), 0) + 1
+					locationName = OverloadName(itemName, overload)
+
+					position = getattr(item, "Position", None)
+					if position is not None:
+						self.Add(itemKind, locationName, shortPath, position.Line, position.Column, position.Line)
+					if itemKind in (SourceLocationKind.Function, SourceLocationKind.Procedure):
+						self._AddInterfaceItems(SourceLocationKind.Parameter, locationName, item.ParameterItems, shortPath)
@@ -0,0 +1,382 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains the typed options of the VHDL domain's directives.
+
+Default values from ``vhdl_defaults`` are validated and compiled once at ``config-inited`` into typed option objects.
+Directives merge only their explicitly given options into these precompiled defaults.
+"""
+from enum import Flag, auto
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Tuple, Type, Optional as Nullable
+
+from pyTooling.Decorators import export
+from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.errors import ConfigError
+
+
+@export
+class ParameterStyle(Flag):
+	Never = auto()
+	Table = auto()
+	Sections = auto()
+	Compact = auto()
+
+
+@export
+class ArchitecturesStyle(Flag):
+	Never = auto()
+	Multiple = auto()
+	Always = auto()
+
+
+@export
+class GroupingStyle(Flag):
+	Never = auto()
+	Library = auto()
+	Directory = auto()
+
+
+@export
+class DependencyDirection(Flag):
+	Uses = auto()
+	UsedBy = auto()
+	Both = Uses | UsedBy
+
+
+def _Normalize(option: Nullable[str], expected: str) -> str:
+	# docutils passes None for an option given without argument.
+	if option is None:
+		raise ValueError(f"must supply an argument; {expected}.")
+
+	return option.strip().lower()
+
+
+@export
+def ParseParameterStyle(option: str) -> ParameterStyle:
+	option = _Normalize(option, "choose from: never, table, sections, compact")
+	if option == "never":
+		return ParameterStyle.Never
+	elif option == "table":
+		return ParameterStyle.Table
+	elif option == "sections":
+		return ParameterStyle.Sections
+	elif option == "compact":
+		return ParameterStyle.Compact
+	else:
+		raise ValueError(f"value '{option}' is not in list of choices: never, table, sections, compact.")
+
+
+@export
+def ParseArchitecturesStyle(option: str) -> ArchitecturesStyle:
+	option = _Normalize(option, "choose from: never, multiple, always")
+	if option == "never":
+		return ArchitecturesStyle.Never
+	elif option == "multiple":
+		return ArchitecturesStyle.Multiple
+	elif option == "always":
+		return ArchitecturesStyle.Always
+	else:
+		raise ValueError(f"value '{option}' is not in list of choices: never, multiple, always.")
+
+
+@export
+def ParseGroupingStyle(option: str) -> GroupingStyle:
+	option = _Normalize(option, "choose from: never, library, directory")
+	if option == "never":
+		return GroupingStyle.Never
+	elif option == "library":
+		return GroupingStyle.Library
+	elif option == "directory":
+		return GroupingStyle.Directory
+	else:
+		raise ValueError(f"value '{option}' is not in list of choices: never, library, directory.")
+
+
+@export
+def ParseDependencyDirection(option: str) -> DependencyDirection:
+	option = _Normalize(option, "choose from: uses, usedby, both")
+	if option == "uses":
+		return DependencyDirection.Uses
+	elif option == "usedby":
+		return DependencyDirection.UsedBy
+	elif option == "both":
+		return DependencyDirection.Both
+	else:
+		raise ValueError(f"value '{option}' is not in list of choices: uses, usedby, both.")
+
+
+@export
+def ParseStatisticsColumn(option: str) -> str:
+	option = _Normalize(option, "choose from: architectures, ports, generics, lines")
+	if option in ("architectures", "ports", "generics", "lines"):
+		return option.capitalize()
+	else:
+		raise ValueError(f"value '{option}' is not in list of choices: architectures, ports, generics, lines.")
+
+
+@export
+def ParseCount(option: str) -> int:
+	option = _Normalize(option, "expected a non-negative integer")
+	try:
+		value = int(option)
+	except ValueError:
+		raise ValueError(f"Value '{option}' is not an integer.")
+
+	if value < 0:
+		raise ValueError(f"Value '{option}' must not be negative.")
+
+	return value
+
+
+@export
+def ParseBoolean(option: str) -> bool:
+	option = _Normalize(option, "expected yes/true or no/false")
+	if option in ("yes", "true"):
+		return True
+	elif option in ("no", "false"):
+		return False
+	else:
+		raise ValueError(f"Value '{option}' not supported for a boolean value (yes/true, no/false).")
+
+
+@export
+class DesignOptions(NamedTuple):
+	"""Rendering options of a design description."""
+	GroupBy:       GroupingStyle =      GroupingStyle.Library
+	Documentation: int =                200
+
+
+@export
+class EntityOptions(NamedTuple):
+	"""Rendering options of an entity description."""
+	Definition:    bool =               True
+	Generics:      ParameterStyle =     ParameterStyle.Table
+	Ports:         ParameterStyle =     ParameterStyle.Table
+	Architectures: ArchitecturesStyle = ArchitecturesStyle.Multiple
+	ReferencedBy:  bool =               True
+	Hierarchy:     bool =               True
+
+
+@export
+class LibraryOptions(NamedTuple):
+	"""Rendering options of a library description (entity options apply to all entities)."""
+	Definition:    bool =               True
+	Generics:      ParameterStyle =     ParameterStyle.Table
+	Ports:         ParameterStyle =     ParameterStyle.Table
+	Architectures: ArchitecturesStyle = ArchitecturesStyle.Multiple
+	ReferencedBy:  bool =               True
+	Hierarchy:     bool =               True
+	Packages:      bool =               True
+
+
+@export
+class PackageOptions(NamedTuple):
+	"""Rendering options of a package description."""
+	Generics:      ParameterStyle =     ParameterStyle.Table
+	ReferencedBy:  bool =               True
+
+
+@export
+class ReferencedByOptions(NamedTuple):
+	"""Rendering options of descriptions only supporting back links (contexts, configurations)."""
+	ReferencedBy:  bool =               True
+
+
+@export
+class DesignStatisticsOptions(NamedTuple):
+	"""Rendering options of design statistics."""
+	Top:           int =                10
+	SortBy:        str =                "Lines"
+
+
+@export
+class DependencyOptions(NamedTuple):
+	"""Rendering options of dependency lists."""
+	Depth:         int =                0
+	Direction:     DependencyDirection = DependencyDirection.Both
+	Predefined:    bool =               False
+
+
+@export
+class NoOptions(NamedTuple):
+	"""Options of directives without options."""
+
+
+@export
+class OptionSchema:
+	"""
+	Describes the options of a directive: option names, their parsers and the field in the typed options object.
+	"""
+	_optionsClass: Type[NamedTuple]
+	_options:      Dict[str, Tuple[str, Callable[[str], Any]]]
+	_inheritFrom:  Tuple[str, ...]
+
+	def __init__(self, optionsClass: Type[NamedTuple], options: Dict[str, Tuple[str, Callable[[str], Any]]], inheritFrom: Tuple[str, ...] = ()):
+		"""
+		Initializes an option schema.
+
+		:param optionsClass: Named tuple class holding the typed option values.
+		:param options:      Mapping of option names to tuples of field name and parser function.
+		:param inheritFrom:  Names of other directives, whose defaults are applied first (if the option is known).
+		"""
+		self._optionsClass = optionsClass
+		self._options = options
+		self._inheritFrom = inheritFrom
+
+	@property
+	def OptionSpec(self) -> Dict[str, Callable[[str], Any]]:
+		"""Returns a docutils ``option_spec`` converting option strings to typed values while parsing a directive."""
+		return {optionName: parser for optionName, (_, parser) in self._options.items()}
+
+	@property
+	def InheritFrom(self) -> Tuple[str, ...]:
+		return self._inheritFrom
+
+	def IsKnown(self, optionName: str) -> bool:
+		return optionName in self._options
+
+	def Compile(self, values: Mapping[str, Any]) -> NamedTuple:
+		"""
+		Validate and parse option strings into a typed options object.
+
+		Values, which are not strings (e.g. ``True``, ``5`` or ``ParameterStyle.Table`` written in :file:`conf.py`), are
+		converted to strings and validated by the same parser as option strings.
+
+		:param values:      Mapping of option names to option values.
+		:returns:           The typed options object.
+		:raises ValueError: If an option name or value is invalid.
+		"""
+		fields = {}
+		for optionName, value in values.items():
+			try:
+				fieldName, parser = self._options[optionName]
+			except KeyError:
+				raise ValueError(f"Unknown option '{optionName}', expected one of: {', '.join(self._options)}.")
+
+			if isinstance(value, Flag):
+				value = value.name
+			elif value is not None and not isinstance(value, str):
+				value = str(value)
+
+			try:
+				fields[fieldName] = parser(value)
+			except ValueError as ex:
+				raise ValueError(f"Option '{optionName}': {ex}") from ex
+
+		return self._optionsClass(**fields)
+
+	def Merge(self, defaults: NamedTuple, explicitOptions: Mapping[str, Any]) -> NamedTuple:
+		"""
+		Merge explicitly given (already converted) directive options into precompiled defaults.
+
+		:param defaults:        Precompiled default options.
+		:param explicitOptions: Options given at the directive, converted by :py:attr:`OptionSpec`.
+		:returns:               The effective typed options object.
+		"""
+		if not explicitOptions:
+			return defaults
+
+		return defaults._replace(**{self._options[optionName][0]: value for optionName, value in explicitOptions.items() if optionName in self._options})
+
+
+_entityOptions = {
+	"definition":    ("Definition",    ParseBoolean),
+	"genericlist":   ("Generics",      ParseParameterStyle),
+	"portlist":      ("Ports",         ParseParameterStyle),
+	"architectures": ("Architectures", ParseArchitecturesStyle),
+	"referencedby":  ("ReferencedBy",  ParseBoolean),
+	"hierarchy":     ("Hierarchy",     ParseBoolean),
+}
+
+directiveOptions: Dict[str, OptionSchema] = {
+	"describedesign":        OptionSchema(DesignOptions, {"groupby": ("GroupBy", ParseGroupingStyle), "documentation": ("Documentation", ParseCount)}),
+	"describedocument":      OptionSchema(NoOptions, {}),
+	"describearchitecture":  OptionSchema(NoOptions, {}),
+	"describepackagebody":   OptionSchema(NoOptions, {}),
+	"describeentity":        OptionSchema(EntityOptions, _entityOptions),
+	"describelibrary":       OptionSchema(LibraryOptions, {**_entityOptions, "packages": ("Packages", ParseBoolean)}, inheritFrom=("describeentity", )),
+	"describepackage":       OptionSchema(PackageOptions, {"genericlist": ("Generics", ParseParameterStyle), "referencedby": ("ReferencedBy", ParseBoolean)}),
+	"describecontext":       OptionSchema(ReferencedByOptions, {"referencedby": ("ReferencedBy", ParseBoolean)}),
+	"describeconfiguration": OptionSchema(ReferencedByOptions, {"referencedby": ("ReferencedBy", ParseBoolean)}),
+	"designstats":           OptionSchema(DesignStatisticsOptions, {"top": ("Top", ParseCount), "sortby": ("SortBy", ParseStatisticsColumn)}),
+	"dependencies":          OptionSchema(DependencyOptions, {"depth": ("Depth", ParseCount), "direction": ("Direction", ParseDependencyDirection), "predefined": ("Predefined", ParseBoolean)}),
+}  #: A dictionary of option schemas per directive name.
+
+_configAttribute = "_vhdlCompiledDefaults"
+
+
+@export
+def CompileDefaults(sphinxApplication: Sphinx, config: Config) -> None:
+	"""
+	Call back for Sphinx ``config-inited`` event.
+
+	Validates configuration variable ``vhdl_defaults`` and compiles it into typed option objects per directive. Invalid
+	option names or values are reported as configuration errors before any page is read.
+
+	:param sphinxApplication: The Sphinx application.
+	:param config:            The Sphinx configuration.
+	:raises ConfigError:      If an option name or value in ``vhdl_defaults`` is invalid.
+	"""
+	defaults: Dict[str, Mapping[str, str]] = config.vhdl_defaults
+
+	for directiveName in defaults:
+		if directiveName not in directiveOptions:
+			print(f"[VHDL][WARNING] vhdl_defaults: Unknown directive '{directiveName}' is ignored.")
+
+	compiled: Dict[str, NamedTuple] = {}
+	for directiveName, schema in directiveOptions.items():
+		values: Dict[str, str] = {}
+		for baseDirectiveName in schema.InheritFrom:
+			values.update((optionName, value) for optionName, value in defaults.get(baseDirectiveName, {}).items() if schema.IsKnown(optionName))
+		values.update(defaults.get(directiveName, {}))
+
+		try:
+			compiled[directiveName] = schema.Compile(values)
+		except ValueError as ex:
+			raise ConfigError(f"vhdl_defaults['{directiveName}']: {ex}") from ex
+
+	setattr(config, _configAttribute, compiled)
+
+
+@export
+def GetDefaults(config: Config, directiveName: str) -> NamedTuple:
+	"""
+	Returns the precompiled default options of a directive.
+
+	:param config:        The Sphinx configuration.
+	:param directiveName: Name of the directive (without domain).
+	:returns:             The typed default options.
+	"""
+	return getattr(config, _configAttribute)[directiveName]
@@ -0,0 +1,108 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module provides sorted views of a design, so indices, stubs and directives emit their output in a deterministic
+order, independent of the order in which source files were parsed.
+
+Libraries and design units are sorted by normalized identifier, source files by path. Each view is sorted once on
+first use and cached per design (:func:`GetSortedDesign`), so repeated ``generate`` calls and directives don't sort
+again.
+"""
+from typing import Any, Dict, List, Tuple
+
+from pyTooling.Decorators import export
+
+
+def _Key(item) -> str:
+	return item.NormalizedIdentifier
+
+
+@export
+class SortedDesign:
+	"""Sorted, cached views of a design (a full design or a catalog view)."""
+
+	_design:    Any
+	_libraries: List
+	_views:     Dict[Tuple[str, ...], List]
+
+	def __init__(self, design) -> None:
+		self._design = design
+		self._libraries = None
+		self._views = {}
+
+	def _Get(self, key: Tuple[str, ...], items) -> List:
+		try:
+			return self._views[key]
+		except KeyError:
+			view = self._views[key] = sorted(items, key=_Key)
+			return view
+
+	@property
+	def Libraries(self) -> List:
+		"""All libraries sorted by name."""
+		if self._libraries is None:
+			self._libraries = sorted(self._design.Libraries.values(), key=_Key)
+
+		return self._libraries
+
+	def Entities(self, library) -> List:
+		"""Entities of a library sorted by name."""
+		return self._Get(("entities", library.NormalizedIdentifier), library.Entities.values())
+
+	def Packages(self, library) -> List:
+		"""Packages of a library sorted by name."""
+		return self._Get(("packages", library.NormalizedIdentifier), library.Packages.values())
+
+	def Architectures(self, entity) -> List:
+		"""Architectures of an entity sorted by name."""
+		return self._Get(("architectures", entity.Library.NormalizedIdentifier, entity.NormalizedIdentifier), entity.Architectures.values())
+
+	@property
+	def Documents(self) -> List:
+		"""All source files sorted by path relative to the design's base directory."""
+		try:
+			return self._views[("documents", )]
+		except KeyError:
+			view = self._views[("documents", )] = sorted(self._design.Documents, key=lambda document: document.ShortPath.as_posix())
+			return view
+
+
+@export
+def GetSortedDesign(design) -> SortedDesign:
+	"""Returns the cached sorted views of a design, creating them on first use."""
+	try:
+		return design._sortedDesign
+	except AttributeError:
+		sortedDesign = design._sortedDesign = SortedDesign(design)
+		return sortedDesign
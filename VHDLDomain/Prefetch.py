@@ -0,0 +1,178 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains a prefetcher reading VHDL source files ahead of the parser.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, Generator, Deque, Tuple, Optional as Nullable
+
+from pyTooling.Decorators import export
+
+
+@export
+class SourceFilePrefetcher:
+	"""
+	Reads VHDL source files in background threads, while previously read files are consumed (parsed) by the caller.
+
+	At most ``bufferSize`` files are read ahead of the consumer. When ``bufferSize`` is 0, files are read synchronously
+	when requested by the consumer.
+
+	The time the consumer was blocked waiting for a file to be read is accumulated in :py:attr:`WaitTime`, whereas
+	:py:attr:`ReadTime` accumulates the time spent on reading files (in background).
+
+	If ``onError`` is given, a file which can't be read (or decoded) is reported to that callback and skipped, instead of
+	aborting the iteration.
+	"""
+	_files:      Iterable[Tuple[str, Path]]
+	_bufferSize: int
+	_encoding:   str
+	_onError:    Nullable[Callable[[str, Path, Exception], None]]
+
+	_waitTime:   float
+	_readTime:   float
+	_fileCount:  int
+	_byteCount:  int
+
+	def __init__(self, files: Iterable[Tuple[str, Path]], bufferSize: int = 8, encoding: str = "utf-8", onError: Callable[[str, Path, Exception], None] = None):
+		"""
+		Initializes a source file prefetcher.
+
+		:param files:      Iterable of tuples of library name and path to a source file.
+		:param bufferSize: Number of files to read ahead.
+		:param encoding:   Encoding of the source files.
+		:param onError:    Optional callback receiving library name, path and exception of a file which couldn't be read.
+		"""
+		if bufferSize < 0:
+			raise ValueError(f"Parameter 'bufferSize' must be positive or 0.")
+
+		self._files = files
+		self._bufferSize = bufferSize
+		self._encoding = encoding
+		self._onError = onError
+
+		self._waitTime = 0.0
+		self._readTime = 0.0
+		self._fileCount = 0
+		self._byteCount = 0
+
+	@property
+	def BufferSize(self) -> int:
+		return self._bufferSize
+
+	@property
+	def WaitTime(self) -> float:
+		"""Accumulated time in seconds the consumer was blocked by file I/O."""
+		return self._waitTime
+
+	@property
+	def ReadTime(self) -> float:
+		"""Accumulated time in seconds spent on reading files."""
+		return self._readTime
+
+	@property
+	def FileCount(self) -> int:
+		return self._fileCount
+
+	@property
+	def ByteCount(self) -> int:
+		return self._byteCount
+
+	def _Read(self, path: Path) -> Tuple[str, float]:
+		startTime = perf_counter()
+		with path.open("r", encoding=self._encoding) as fileHandle:
+			sourceCode = fileHandle.read()
+
+		return sourceCode, perf_counter() - startTime
+
+	def _Account(self, sourceCode: str, readTime: float, waitTime: float) -> None:
+		self._readTime += readTime
+		self._waitTime += waitTime
+		self._fileCount += 1
+		self._byteCount += len(sourceCode)
+
+	def __iter__(self) -> Generator[Tuple[str, Path, str], None, None]:
+		"""
+		Iterate all files in order and yield library name, path and source code.
+
+		:returns: A generator of tuples of library name, path to the source file and the source file's content.
+		"""
+		if self._bufferSize == 0:
+			for libraryName, path in self._files:
+				try:
+					sourceCode, readTime = self._Read(path)
+				except (OSError, UnicodeDecodeError) as ex:
+					if self._onError is None:
+						raise
+					self._onError(libraryName, path, ex)
+					continue
+
+				self._Account(sourceCode, readTime, readTime)
+
+				yield libraryName, path, sourceCode
+
+			return
+
+		files: Iterator[Tuple[str, Path]] = iter(self._files)
+		pending: Deque[Tuple[str, Path, Future]] = deque()
+		with ThreadPoolExecutor(max_workers=self._bufferSize, thread_name_prefix="VHDLPrefetch") as executor:
+			try:
+				for libraryName, path in islice(files, self._bufferSize):
+					pending.append((libraryName, path, executor.submit(self._Read, path)))
+
+				while pending:
+					libraryName, path, future = pending.popleft()
+
+					# Refill the buffer before handing out the file, so the next read overlaps with parsing.
+					for nextLibraryName, nextPath in islice(files, 1):
+						pending.append((nextLibraryName, nextPath, executor.submit(self._Read, nextPath)))
+
+					startTime = perf_counter()
+					try:
+						sourceCode, readTime = future.result()
+					except (OSError, UnicodeDecodeError) as ex:
+						if self._onError is None:
+							raise
+						self._onError(libraryName, path, ex)
+						continue
+
+					self._Account(sourceCode, readTime, perf_counter() - startTime)
+
+					yield libraryName, path, sourceCode
+			finally:
+				for _, _, future in pending:
+					future.cancel()
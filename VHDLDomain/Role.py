@@ -33,14 +33,189 @@
 **A Sphinx domain providing VHDL language support.**
 
 This module contains all the roles of the VHDL domain.
+
+Roles create :class:`pending_vhdl_xref` nodes, which are not resolved one by one by Sphinx. Instead, all references of a
+document are resolved in one batch at ``doctree-resolved`` (see :func:`ResolveReferences`).
 """
+from typing import Dict, List, Tuple, Optional as Nullable
+
+from docutils import nodes
 from pyTooling.Decorators import export
+from sphinx.application import Sphinx
 from sphinx.roles import XRefRole
 
+from VHDLDomain.Inventory import GetExternalInventory
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Signature import ParseSignature
+from VHDLDomain.SourcePage import SourcePageName, SourcePagesEnabled
+
+
+@export
+class pending_vhdl_xref(nodes.Inline, nodes.Element):
+	"""
+	A reference to a VHDL object, which is resolved at ``doctree-resolved``.
+
+	It has the same attributes as :class:`sphinx.addnodes.pending_xref`, but isn't processed by Sphinx's reference
+	resolver.
+	"""
+
 
 @export
 class BaseRole(XRefRole):
-	pass
+	nodeclass = pending_vhdl_xref
+	innernodeclass = nodes.literal
+
+
+_subprogramKinds = {
+	"func": SourceLocationKind.Function,
+	"proc": SourceLocationKind.Procedure,
+}
+
+_sourceLocationKinds = {
+	"ctx":      SourceLocationKind.Context,
+	"ent":      SourceLocationKind.Entity,
+	"arch":     SourceLocationKind.Architecture,
+	"comp":     SourceLocationKind.Component,
+	"pack":     SourceLocationKind.Package,
+	"packbody": SourceLocationKind.PackageBody,
+	"config":   SourceLocationKind.Configuration,
+	"type":     SourceLocationKind.Type,
+	"const":    SourceLocationKind.Constant,
+	"generic":  SourceLocationKind.Generic,
+	"port":     SourceLocationKind.Port,
+	"param":    SourceLocationKind.Parameter,
+}  #: Roles, which fall back to the highlighted source code, if the referenced object isn't described by a directive.
+
+
+@export
+def ResolveReferences(sphinxApplication: Sphinx, doctree: nodes.document, docname: str) -> None:
+	"""
+	Call back for Sphinx ``doctree-resolved`` event.
+
+	Resolves all VHDL references of a document in one batch. References are grouped by library, so each library's
+	objects are looked up once per document. Relative URIs are computed once per target document. References to
+	subprograms are resolved by signature (see :mod:`VHDLDomain.Signature`) to the overload's highlighted source code.
+	References not found in this project are resolved against external inventories (see ``vhdl_inventories``). Other
+	language constructs, which aren't described by a directive (e.g. architectures, package bodies, constants or
+	parameters), are resolved to their highlighted source code, if source pages are generated.
+	Unresolved and ambiguous references are replaced by their content and reported in one message per document.
+
+	:param sphinxApplication: The Sphinx application.
+	:param doctree:           The resolved doctree of a document.
+	:param docname:           Name of the document.
+	"""
+	domain = sphinxApplication.env.domains["vhdl"]
+	builder = sphinxApplication.builder
+
+	references: Dict[str, List[Tuple[pending_vhdl_xref, str]]] = {}
+	subprogramReferences: List[pending_vhdl_xref] = []
+	for node in doctree.findall(pending_vhdl_xref):
+		if node["reftype"] in _subprogramKinds:
+			subprogramReferences.append(node)
+		else:
+			target = node["reftarget"].lower()
+			references.setdefault(target.split(".", 1)[0], []).append((node, target))
+
+	if not references and not subprogramReferences:
+		return
+
+	inventory = GetExternalInventory(sphinxApplication.config)
+	relativeURIs: Dict[str, str] = {}
+
+	def createReference(toDocname: str, anchor: str, title: str) -> nodes.reference:
+		reference = nodes.reference("", "", internal=True, reftitle=title)
+		if toDocname == docname:
+			reference["refid"] = anchor
+		else:
+			try:
+				relativeURI = relativeURIs[toDocname]
+			except KeyError:
+				relativeURI = relativeURIs[toDocname] = builder.get_relative_uri(docname, toDocname)
+			reference["refuri"] = f"{relativeURI}#{anchor}"
+
+		return reference
+
+	def replace(node: pending_vhdl_xref, reference: Nullable[nodes.reference]) -> bool:
+		content = node[0].deepcopy() if len(node) > 0 else nodes.literal(text=node["reftarget"])
+		if reference is None:
+			node.replace_self(content)
+			return False
+
+		reference.append(content)
+		node.replace_self(reference)
+		return True
+
+	def createSourceReference(kind: SourceLocationKind, name: str, title: str) -> Nullable[nodes.reference]:
+		for designName, design in domain.Designs.items():
+			span = design.SourceLocations.Get(kind, name)
+			if span is not None:
+				return createReference(SourcePageName(designName, span.Document), SourceLocationTable.Anchor(kind, name), title)
+
+		return None
+
+	sourcePages = SourcePagesEnabled(sphinxApplication)
+	unresolved: List[str] = []
+	ambiguous: List[str] = []
+	for libraryName, libraryReferences in references.items():
+		objects = domain.Objects.GetLibrary(libraryName)
+		for node, target in libraryReferences:
+			reference = None
+			for objectType in domain.objtypes_for_role(node["reftype"], []):
+				entry = objects.get((objectType, target))
+				if entry is not None:
+					reference = createReference(entry.DocName, entry.Anchor, entry.DisplayName)
+					break
+
+				externalObject = inventory.Get(objectType, target)
+				if externalObject is not None:
+					reference = nodes.reference("", "", internal=False, refuri=externalObject.URI, reftitle=f"(in {externalObject.Project})")
+					break
+
+			if reference is None and sourcePages and node["reftype"] in _sourceLocationKinds:
+				reference = createSourceReference(_sourceLocationKinds[node["reftype"]], target, node["reftarget"])
+
+			if not replace(node, reference):
+				unresolved.append(f"{node['reftype']}:{node['reftarget']}")
+
+	for node in subprogramReferences:
+		kind = _subprogramKinds[node["reftype"]]
+		objectType = str(kind)
+		try:
+			name = ParseSignature(node["reftarget"])[0]
+			overloads = [(designName, design, entry) for designName, design in domain.Designs.items() for entry in design.Signatures.Resolve(kind, node["reftarget"])]
+		except ValueError:
+			replace(node, None)
+			unresolved.append(f"{node['reftype']}:{node['reftarget']}")
+			continue
+
+		reference = None
+		if len(overloads) > 1:
+			replace(node, None)
+			ambiguous.append(f"{node['reftype']}:{node['reftarget']} ({' | '.join(str(entry.Signature) for _, _, entry in overloads)})")
+			continue
+		elif len(overloads) == 1:
+			designName, design, entry = overloads[0]
+			span = design.SourceLocations.Get(kind, entry.LocationName) if sourcePages else None
+			if span is not None:
+				reference = createReference(SourcePageName(designName, span.Document), SourceLocationTable.Anchor(kind, entry.LocationName), str(entry.Signature))
+
+		if reference is None:
+			documentedObject = domain.Objects.Get(objectType, name)
+			externalObject = inventory.Get(objectType, name)
+			if documentedObject is not None:
+				reference = createReference(documentedObject.DocName, documentedObject.Anchor, documentedObject.DisplayName)
+			elif externalObject is not None:
+				reference = nodes.reference("", "", internal=False, refuri=externalObject.URI, reftitle=f"(in {externalObject.Project})")
+
+		if not replace(node, reference):
+			unresolved.append(f"{node['reftype']}:{node['reftarget']}")
+
+	if unresolved:
+		print(f"[VHDL][WARNING] {docname}: {len(unresolved)} unresolved reference(s): {', '.join(unresolved)}")
+	if ambiguous:
+		print(f"[VHDL][WARNING] {docname}: {len(ambiguous)} ambiguous reference(s), add a signature to select an overload:")
+		for reference in ambiguous:
+			print(f"[VHDL][WARNING]   {reference}")
 
 
 @export
@@ -0,0 +1,349 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module exports a client-side symbol index of all VHDL objects and provides a small search widget.
+
+The symbol index is a compact JSON file sorted by normalized (lower case) name, so the search widget can find all
+symbols starting with a prefix by binary search.
+"""
+from hashlib import sha256
+from json import dumps
+from pathlib import Path
+from typing import Dict, Generator, Iterable, List, NamedTuple, Tuple
+
+from docutils import nodes
+from docutils.nodes import Node
+from pyTooling.Decorators import export
+from pyVHDLModel.Subprogram import Function, Procedure
+from pyVHDLModel.Type import BaseType
+from sphinx.application import Sphinx
+from sphinx.util.docutils import SphinxDirective
+
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable, OverloadName
+from VHDLDomain.SourcePage import SourcePageName
+from VHDLDomain.Stub import StubDocumentName
+
+SYMBOL_INDEX_FILE = "vhdl-symbols.json"  #: File name of the symbol index in ``_static``.
+SEARCH_SCRIPT_FILE = "vhdl-search.js"    #: File name of the search widget's script in ``_static``.
+FORMAT_VERSION = 1                       #: Version of the symbol index' file format.
+
+_predefinedLibraries = ("std", "ieee")
+
+
+@export
+class Symbol(NamedTuple):
+	"""A searchable VHDL object."""
+	Kind:          SourceLocationKind  #: Kind of the VHDL object.
+	Identifier:    str                 #: Identifier as written in the source.
+	QualifiedName: str                 #: Qualified, normalized name as used by the source location index.
+	Library:       str                 #: Identifier of the library.
+	Unit:          str                 #: Identifier of the enclosing primary design unit.
+
+
+@export
+def IterateSymbols(design) -> Generator[Symbol, None, None]:
+	"""
+	Iterate all searchable objects of a design: entities, ports, generics, packages, subprograms and types.
+
+	Predefined libraries (``std``, ``ieee``) are skipped.
+
+	:param design: An analyzed design.
+	:returns:      A generator of symbols.
+	"""
+	for library in design.Libraries.values():
+		libraryName = library.NormalizedIdentifier
+		if libraryName in _predefinedLibraries:
+			continue
+
+		for entity in library.Entities.values():
+			name = f"{libraryName}.{entity.NormalizedIdentifier}"
+			yield Symbol(SourceLocationKind.Entity, entity.Identifier, name, library.Identifier, entity.Identifier)
+			for generic in entity.GenericItems:
+				for identifier, normalizedIdentifier in zip(generic.Identifiers, generic.NormalizedIdentifiers):
+					yield Symbol(SourceLocationKind.Generic, identifier, f"{name}.{normalizedIdentifier}", library.Identifier, entity.Identifier)
+			for port in entity.PortItems:
+				for identifier, normalizedIdentifier in zip(port.Identifiers, port.NormalizedIdentifiers):
+					yield Symbol(SourceLocationKind.Port, identifier, f"{name}.{normalizedIdentifier}", library.Identifier, entity.Identifier)
+
+		for package in library.Packages.values():
+			name = f"{libraryName}.{package.NormalizedIdentifier}"
+			yield Symbol(SourceLocationKind.Package, package.Identifier, name, library.Identifier, package.Identifier)
+			for generic in package.GenericItems:
+				for identifier, normalizedIdentifier in zip(generic.Identifiers, generic.NormalizedIdentifiers):
+					yield Symbol(SourceLocationKind.Generic, identifier, f"{name}.{normalizedIdentifier}", library.Identifier, package.Identifier)
+			overloads: Dict[Tuple[SourceLocationKind, str], int] = {}
+			for item in package.DeclaredItems:
+				if isinstance(item, Function):
+					kind = SourceLocationKind.Function
+				elif isinstance(item, Procedure):
+					kind = SourceLocationKind.Procedure
+				elif isinstance(item, BaseType):
+					kind = SourceLocationKind.Type
+				else:
+					continue
+
+				itemName = f"{name}.{item.NormalizedIdentifier}"
+				overload = overloads[(kind, itemName)] = overloads.get((kind, itemName), 0) + 1
+				yield Symbol(kind, item.Identifier, OverloadName(itemName, overload), library.Identifier, package.Identifier)
+
+
+@export
+def CreateSymbolIndex(sphinxApplication: Sphinx) -> Dict:
+	"""
+	Create the symbol index of all designs.
+
+	Each symbol refers to an anchor on the symbol's highlighted source page, if source pages are enabled, otherwise to
+	the stub page of the enclosing design unit, if stubs are generated.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 A JSON serializable dictionary.
+	"""
+	builder = sphinxApplication.builder
+	config = sphinxApplication.config
+	designs = sphinxApplication.env.domains["vhdl"].Designs
+
+	pages: List[str] = []
+	pageIndex: Dict[str, int] = {}
+
+	def getPage(pageName: str) -> int:
+		try:
+			return pageIndex[pageName]
+		except KeyError:
+			pageIndex[pageName] = len(pages)
+			pages.append(builder.get_target_uri(pageName))
+			return pageIndex[pageName]
+
+	symbols: List[Tuple[str, str, int, str, int, str]] = []
+	for designName, design in designs.items():
+		locations: SourceLocationTable = design.SourceLocations
+		stubDesignName = designName if len(designs) > 1 else None
+		for symbol in IterateSymbols(design):
+			page = -1
+			anchor = ""
+			span = locations.Get(symbol.Kind, symbol.QualifiedName) if config.vhdl_source_pages else None
+			if span is not None:
+				page = getPage(SourcePageName(designName, span.Document))
+				anchor = SourceLocationTable.Anchor(symbol.Kind, symbol.QualifiedName)
+			elif config.vhdl_stub_directory is not None:
+				page = getPage(StubDocumentName(config.vhdl_stub_directory, symbol.Library, symbol.Unit, stubDesignName))
+
+			symbols.append((symbol.Identifier.lower(), symbol.Identifier, int(symbol.Kind), f"{symbol.Library}.{symbol.Unit}", page, anchor))
+
+	symbols.sort()
+
+	return {
+		"version": FORMAT_VERSION,
+		"kinds":   [str(kind) for kind in SourceLocationKind],
+		"pages":   pages,
+		"symbols": symbols,
+	}
+
+
+@export
+def SymbolIndexKey(sphinxApplication: Sphinx) -> str:
+	"""
+	Returns a key identifying the content of the symbol index without creating it.
+
+	The key covers the source hashes of all designs (read from the catalog, if available), the options deciding the
+	link targets and the builder's URI scheme. If the key didn't change since the last build, the symbol index doesn't
+	need to be created again, so the model artifact isn't loaded.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 The key as hex string.
+	"""
+	builder = sphinxApplication.builder
+	config = sphinxApplication.config
+
+	hash = sha256(f"{FORMAT_VERSION}\0{builder.name}\0{builder.get_target_uri('_vhdl/index')}\0{config.vhdl_source_pages}\0{config.vhdl_stub_directory}\0".encode("utf-8"))
+	designs = sphinxApplication.env.domains["vhdl"].Catalogs
+	for designName in sorted(designs):
+		hash.update(f"{designName}\0{designs[designName].SourceHashes.Design}\n".encode("utf-8"))
+
+	return hash.hexdigest()
+
+
+def _WriteIfChanged(path: Path, content: str) -> None:
+	try:
+		if path.read_text(encoding="utf-8") == content:
+			return
+	except OSError:
+		path.parent.mkdir(parents=True, exist_ok=True)
+
+	path.write_text(content, encoding="utf-8")
+
+
+@export
+def WriteSymbolIndex(sphinxApplication: Sphinx) -> Iterable[Tuple[str, Dict, str]]:
+	"""
+	Call back for Sphinx ``html-collect-pages`` event.
+
+	Writes the symbol index and the search widget's script into the output's ``_static`` directory. No pages are added.
+	The symbol index is only created again, if its key (see :func:`SymbolIndexKey`) changed.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 An empty list of pages.
+	"""
+	if not sphinxApplication.config.vhdl_symbol_search:
+		return []
+
+	builder = sphinxApplication.builder
+	if builder.name == "singlehtml" or builder.name.startswith("epub"):
+		return []
+
+	staticDirectory = Path(builder.outdir) / "_static"
+	_WriteIfChanged(staticDirectory / SEARCH_SCRIPT_FILE, SEARCH_SCRIPT)
+
+	symbolIndexFile = staticDirectory / SYMBOL_INDEX_FILE
+	keyFile = Path(sphinxApplication.doctreedir) / "vhdl-symbols.key"
+	key = SymbolIndexKey(sphinxApplication)
+	try:
+		if symbolIndexFile.exists() and keyFile.read_text(encoding="ascii") == key:
+			return []
+	except OSError:
+		pass
+
+	symbolIndex = CreateSymbolIndex(sphinxApplication)
+	_WriteIfChanged(symbolIndexFile, dumps(symbolIndex, separators=(",", ":"), ensure_ascii=False))
+	_WriteIfChanged(keyFile, key)
+
+	print(f"[VHDL] Wrote symbol index with {len(symbolIndex['symbols'])} symbols.")
+
+	return []
+
+
+@export
+def AddSearchScript(sphinxApplication: Sphinx) -> None:
+	"""
+	Call back for Sphinx ``builder-inited`` event.
+
+	Adds the search widget's script to all HTML pages, if ``vhdl_symbol_search`` is enabled.
+
+	:param sphinxApplication: The Sphinx application.
+	"""
+	if sphinxApplication.config.vhdl_symbol_search:
+		sphinxApplication.add_js_file(SEARCH_SCRIPT_FILE, defer="defer")
+
+
+@export
+class SymbolSearch(SphinxDirective):
+	"""
+	This directive will be replaced by a search field for VHDL symbols (HTML builders only).
+	"""
+
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 0
+
+	def run(self) -> List[Node]:
+		html = (
+			'<div class="vhdl-symbol-search">'
+			'<input type="search" class="vhdl-symbol-search-input" placeholder="Search VHDL symbols ..." autocomplete="off"/>'
+			'<ul class="vhdl-symbol-search-results"></ul>'
+			'</div>'
+		)
+
+		return [nodes.raw("", html, format="html")]
+
+
+SEARCH_SCRIPT = """\
+/* Search widget for VHDL symbols generated by VHDLDomain. */
+(function () {
+	"use strict";
+	var MAX_RESULTS = 50;
+	var indexPromise = null;
+
+	function rootUrl() {
+		if (typeof DOCUMENTATION_OPTIONS !== "undefined" && DOCUMENTATION_OPTIONS.URL_ROOT !== undefined) {
+			return DOCUMENTATION_OPTIONS.URL_ROOT;
+		}
+		return document.documentElement.dataset.content_root || "";
+	}
+
+	function loadIndex() {
+		if (indexPromise === null) {
+			indexPromise = fetch(rootUrl() + "_static/vhdl-symbols.json").then(function (response) { return response.json(); });
+		}
+		return indexPromise;
+	}
+
+	function lowerBound(symbols, prefix) {
+		var low = 0, high = symbols.length;
+		while (low < high) {
+			var middle = (low + high) >>> 1;
+			if (symbols[middle][0] < prefix) { low = middle + 1; } else { high = middle; }
+		}
+		return low;
+	}
+
+	function search(index, query) {
+		var prefix = query.trim().toLowerCase();
+		var results = [];
+		if (prefix === "") { return results; }
+		for (var i = lowerBound(index.symbols, prefix); i < index.symbols.length && results.length < MAX_RESULTS; i++) {
+			if (index.symbols[i][0].lastIndexOf(prefix, 0) !== 0) { break; }
+			results.push(index.symbols[i]);
+		}
+		return results;
+	}
+
+	function render(list, index, results) {
+		list.textContent = "";
+		results.forEach(function (symbol) {
+			var item = document.createElement("li");
+			var label = symbol[1] + " (" + index.kinds[symbol[2]] + " in " + symbol[3] + ")";
+			if (symbol[4] >= 0) {
+				var link = document.createElement("a");
+				link.href = rootUrl() + index.pages[symbol[4]] + (symbol[5] ? "#" + symbol[5] : "");
+				link.textContent = label;
+				item.appendChild(link);
+			} else {
+				item.textContent = label;
+			}
+			list.appendChild(item);
+		});
+	}
+
+	function bind(widget) {
+		var input = widget.querySelector(".vhdl-symbol-search-input");
+		var list = widget.querySelector(".vhdl-symbol-search-results");
+		input.addEventListener("input", function () {
+			loadIndex().then(function (index) { render(list, index, search(index, input.value)); });
+		});
+	}
+
+	document.addEventListener("DOMContentLoaded", function () {
+		document.querySelectorAll(".vhdl-symbol-search").forEach(bind);
+	});
+})();
+"""
@@ -0,0 +1,214 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains an index of subprogram signatures to resolve references to overloaded subprograms.
+
+A reference may carry a signature in VHDL syntax (like in an alias declaration) to select an overload:
+
+* ``lib_Utilities.Utilities_pkg.to_slv`` (unique, if not overloaded)
+* ``lib_Utilities.Utilities_pkg.to_slv[natural, positive]`` (parameter type profile)
+* ``lib_Utilities.Utilities_pkg.to_slv[natural, positive return std_logic_vector]`` (parameter and return type profile)
+"""
+from re import compile as re_compile
+from typing import Dict, List, NamedTuple, Tuple, Optional as Nullable
+
+from pyTooling.Decorators import export
+from pyVHDLModel.Subprogram import Function, Procedure
+
+from VHDLDomain.Identifier import IdentifierTable
+from VHDLDomain.Location import SourceLocationKind, OverloadName
+
+_predefinedLibraries = ("std", "ieee")
+
+_signaturePattern = re_compile(r"^\s*([\w.]+)\s*(?:\[\s*([^\]]*?)\s*\])?\s*$")
+_returnPattern = re_compile(r"(?:^|\s+)return\s+")
+
+
+def _TypeMark(symbol) -> str:
+	try:
+		return symbol.NormalizedIdentifier
+	except AttributeError:
+		return str(symbol).lower()
+
+
+@export
+class SubprogramSignature(NamedTuple):
+	"""Signature of a subprogram: qualified name, parameter type profile and return type (``None`` for procedures)."""
+	Name:       str              #: Qualified, normalized name, e.g. ``lib.pkg.to_slv``.
+	Parameters: Tuple[str, ...]  #: Normalized type marks of all parameters.
+	ReturnType: Nullable[str]    #: Normalized type mark of the return type.
+
+	def __str__(self) -> str:
+		profile = ", ".join(self.Parameters)
+		if self.ReturnType is not None:
+			profile = f"{profile} return {self.ReturnType}" if profile else f"return {self.ReturnType}"
+
+		return f"{self.Name}[{profile}]"
+
+
+@export
+class SubprogramEntry(NamedTuple):
+	"""An overload of a subprogram in the signature index."""
+	Kind:         SourceLocationKind   #: Function or procedure.
+	Signature:    SubprogramSignature  #: Signature of the overload.
+	LocationName: str                  #: Name of the overload in the source location index.
+
+
+@export
+def ParseSignature(target: str) -> Tuple[str, Nullable[Tuple[str, ...]], Nullable[str]]:
+	"""
+	Split a reference target into qualified name, parameter type profile and return type.
+
+	:param target: Reference target, optionally with a signature in brackets.
+	:returns:      A tuple of normalized name, parameter types (``None`` if no signature is given) and return type.
+	:raises ValueError: If the target is not a name with an optional signature.
+	"""
+	match = _signaturePattern.match(target.lower())
+	if match is None:
+		raise ValueError(f"Malformed subprogram reference '{target}'.")
+
+	name, profile = match.groups()
+	if profile is None:
+		return name, None, None
+
+	parts = _returnPattern.split(profile, maxsplit=1)
+	returnType = parts[1].strip() if len(parts) > 1 else None
+	parameters = tuple(parameter.strip() for parameter in parts[0].split(",") if parameter.strip())
+
+	return name, parameters, returnType
+
+
+@export
+class SignatureIndex:
+	"""
+	An index of all subprograms declared in packages of a design.
+
+	The index is built once after analysis. It's keyed by qualified name and by qualified name plus parameter type
+	profile, so a reference resolves with one dictionary lookup regardless of the number of overloads. Names and type
+	marks are keyed by their IDs in the design's identifier table.
+	"""
+
+	_identifiers: IdentifierTable
+	_byName:      Dict[Tuple[SourceLocationKind, Tuple[int, ...]], List[SubprogramEntry]]
+	_bySignature: Dict[Tuple[SourceLocationKind, Tuple[int, ...], Tuple[int, ...]], List[SubprogramEntry]]
+
+	def __init__(self, identifiers: IdentifierTable = None) -> None:
+		"""
+		Initializes an empty index.
+
+		:param identifiers: The design's identifier table, or ``None`` to use a private table.
+		"""
+		self._identifiers = identifiers if identifiers is not None else IdentifierTable()
+		self._byName = {}
+		self._bySignature = {}
+
+	def __len__(self) -> int:
+		return sum(len(entries) for entries in self._byName.values())
+
+	def Add(self, kind: SourceLocationKind, signature: SubprogramSignature) -> SubprogramEntry:
+		"""
+		Add an overload of a subprogram.
+
+		Overloads are numbered in order of declaration, matching the names used by the source location index.
+
+		:param kind:      Function or procedure.
+		:param signature: Signature of the overload.
+		:returns:         The new index entry.
+		"""
+		name = self._identifiers.InternQualified(signature.Name)
+		parameters = tuple(self._identifiers.Intern(parameter) for parameter in signature.Parameters)
+
+		overloads = self._byName.setdefault((kind, name), [])
+		entry = SubprogramEntry(kind, signature, OverloadName(signature.Name, len(overloads) + 1))
+		overloads.append(entry)
+		self._bySignature.setdefault((kind, name, parameters), []).append(entry)
+
+		return entry
+
+	def AddDesign(self, design) -> None:
+		"""
+		Add all subprograms declared in packages of an analyzed design (except predefined libraries).
+
+		:param design: An analyzed design.
+		"""
+		for library in design.Libraries.values():
+			libraryName = library.NormalizedIdentifier
+			if libraryName in _predefinedLibraries:
+				continue
+
+			for package in library.Packages.values():
+				packageName = f"{libraryName}.{package.NormalizedIdentifier}"
+				for item in package.DeclaredItems:
+					if isinstance(item, Function):
+						kind = SourceLocationKind.Function
+						returnType = getattr(item, "ReturnType", None)
+						returnType = _TypeMark(returnType) if returnType is not None else None
+					elif isinstance(item, Procedure):
+						kind = SourceLocationKind.Procedure
+						returnType = None
+					else:
+						continue
+
+					parameters = []
+					for parameter in item.ParameterItems:
+						typeMark = _TypeMark(parameter.Subtype)
+						parameters.extend(typeMark for _ in getattr(parameter, "Identifiers", (None, )))
+
+					self.Add(kind, SubprogramSignature(f"{packageName}.{item.NormalizedIdentifier}", tuple(parameters), returnType))
+
+	def Resolve(self, kind: SourceLocationKind, target: str) -> List[SubprogramEntry]:
+		"""
+		Find all overloads matching a reference.
+
+		:param kind:   Function or procedure.
+		:param target: Reference target, optionally with a signature (see :func:`ParseSignature`).
+		:returns:      List of matching overloads: empty if unknown, more than one if ambiguous.
+		:raises ValueError: If the target is malformed.
+		"""
+		name, parameters, returnType = ParseSignature(target)
+		nameIDs = self._identifiers.LookupQualified(name)
+		if nameIDs is None:
+			return []
+		elif parameters is None:
+			return self._byName.get((kind, nameIDs), [])
+
+		parameterIDs = tuple(self._identifiers.Lookup(parameter) for parameter in parameters)
+		if None in parameterIDs:
+			return []
+
+		candidates = self._bySignature.get((kind, nameIDs, parameterIDs), [])
+		if returnType is None:
+			return candidates
+
+		return [entry for entry in candidates if entry.Signature.ReturnType == returnType]
@@ -0,0 +1,305 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module generates highlighted source pages (similar to ``sphinx.ext.viewcode``) for all VHDL source files.
+
+Language constructs are wrapped in anchored blocks, so directives can link to the line range of e.g. an entity.
+Highlighted HTML is cached per content hash, so only changed source files are highlighted again.
+"""
+from hashlib import sha256
+from html import escape
+from json import dump, load
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Tuple, Optional as Nullable
+
+from pygments import __version__ as pygments_version
+from pyTooling.Decorators import export
+from sphinx import __display_version__ as sphinx_version
+from sphinx.application import Sphinx
+from sphinx.util.parallel import ParallelTasks, make_chunks, parallel_available
+
+from VHDLDomain.Artifact import GetDesignCache
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable, SourceSpan
+
+
+@export
+def SourcePageName(designName: str, shortPath: str) -> str:
+	"""
+	Returns the Sphinx page name of the highlighted source page of a VHDL source file.
+
+	:param designName: Name of the design.
+	:param shortPath:  Path of the source file relative to the design's base directory.
+	:returns:          The page name.
+	"""
+	return f"_vhdl/source/{designName}/{shortPath}"
+
+
+@export
+def SourcePagesEnabled(sphinxApplication: Sphinx) -> bool:
+	"""
+	Returns true, if highlighted source pages are generated by the current builder.
+
+	Source pages are enabled by ``vhdl_source_pages`` and generated by HTML builders except ``singlehtml`` and ``epub``.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 ``True``, if source pages are generated.
+	"""
+	builder = sphinxApplication.builder
+	return (
+		sphinxApplication.config.vhdl_source_pages and builder.format == "html" and
+		builder.name != "singlehtml" and not builder.name.startswith("epub")
+	)
+
+
+@export
+def RenderSourceBlocks(highlighted: str, locations: Iterable[Tuple[SourceLocationKind, str, SourceSpan]]) -> str:
+	"""
+	Wrap line ranges of highlighted source code in anchored ``<div>`` elements.
+
+	:param highlighted: Source code highlighted as HTML by Pygments (without line numbers).
+	:param locations:   Source locations ordered by first line (outer constructs first).
+	:returns:           The HTML code.
+	"""
+	lines = highlighted.splitlines()
+	before, after = lines[0].split("<pre>", 1)
+	lines[0:1] = [before + "<pre>", after]
+	maxIndex = len(lines) - 1
+
+	openingTags: Dict[int, List[str]] = {}
+	closingTags: Dict[int, int] = {}
+	for kind, name, span in locations:
+		anchor = SourceLocationTable.Anchor(kind, name)
+		openingTags.setdefault(min(span.Line, maxIndex), []).append(f'<div class="vhdl-source-block vhdl-source-{kind}" id="{escape(anchor)}">')
+		endIndex = min(span.EndLine, maxIndex)
+		closingTags[endIndex] = closingTags.get(endIndex, 0) + 1
+
+	for index, tags in openingTags.items():
+		lines[index] = "".join(tags) + lines[index]
+	for index, count in closingTags.items():
+		lines[index] += "</div>" * count
+
+	return "\n".join(lines)
+
+
+@export
+class HighlightCache:
+	"""
+	A persistent cache of highlighted VHDL source code.
+
+	Highlighted HTML is stored per SHA-256 hash of the source code (and Pygments version) in a cache directory. In
+	addition, a manifest records the source hash each source page was generated from during the last build, so
+	unchanged pages are not generated again. The manifest is discarded, if the page key (see :func:`SourcePageKey`)
+	changed, e.g. because another Pygments style, theme or template is used.
+	"""
+	_directory:    Path
+	_manifestFile: Path
+	_pageKey:      str
+	_manifest:     Dict[str, str]
+
+	def __init__(self, directory: Path, pageKey: str = ""):
+		"""
+		Initializes a highlight cache.
+
+		:param directory: Directory to store cached HTML fragments and the manifest.
+		:param pageKey:   Key of everything besides the source code, which generated pages depend on.
+		"""
+		self._directory = directory
+		self._manifestFile = directory / "manifest.json"
+		self._pageKey = pageKey
+
+		try:
+			with self._manifestFile.open("r", encoding="utf-8") as fileHandle:
+				manifest = load(fileHandle)
+			self._manifest = manifest["pages"] if manifest["key"] == pageKey else {}
+		except (OSError, ValueError, KeyError, TypeError):
+			self._manifest = {}
+
+	@staticmethod
+	def Hash(sourceCode: bytes) -> str:
+		"""Returns the cache key of a source file's content."""
+		hash = sha256(f"pygments-{pygments_version}\0".encode("ascii"))
+		hash.update(sourceCode)
+		return hash.hexdigest()
+
+	def IsUnchanged(self, pageName: str, hash: str) -> bool:
+		"""Returns true, if the page was generated from the same source code in the last build."""
+		return self._manifest.get(pageName) == hash
+
+	def Get(self, hash: str) -> Nullable[str]:
+		try:
+			return (self._directory / f"{hash}.html").read_text(encoding="utf-8")
+		except OSError:
+			return None
+
+	def Put(self, hash: str, highlighted: str) -> None:
+		self._directory.mkdir(parents=True, exist_ok=True)
+		(self._directory / f"{hash}.html").write_text(highlighted, encoding="utf-8")
+
+	def Record(self, pageName: str, hash: str) -> None:
+		self._manifest[pageName] = hash
+
+	def Save(self) -> None:
+		self._directory.mkdir(parents=True, exist_ok=True)
+		with self._manifestFile.open("w", encoding="utf-8") as fileHandle:
+			dump({"key": self._pageKey, "pages": self._manifest}, fileHandle, indent="\t", sort_keys=True)
+
+
+_pageTemplate = "page.html"  #: Template rendering source pages.
+
+
+@export
+def SourcePageKey(sphinxApplication: Sphinx) -> str:
+	"""
+	Returns a key identifying everything besides the source code, which generated source pages depend on.
+
+	The key covers the Sphinx and Pygments versions, the Pygments style, the HTML theme and its options, the page
+	template and all templates in ``templates_path`` (which can override or extend the theme's templates).
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 The key as hex string.
+	"""
+	config = sphinxApplication.config
+
+	hash = sha256(
+		f"{sphinx_version}\0{pygments_version}\0{config.pygments_style}\0{config.html_theme}\0"
+		f"{sorted(config.html_theme_options.items())}\0{_pageTemplate}\0".encode("utf-8")
+	)
+	for templateDirectory in config.templates_path:
+		templateDirectory = Path(sphinxApplication.confdir) / templateDirectory
+		for template in sorted(path for path in templateDirectory.rglob("*") if path.is_file()):
+			hash.update(f"{template.relative_to(templateDirectory).as_posix()}\0".encode("utf-8"))
+			hash.update(template.read_bytes())
+
+	return hash.hexdigest()
+
+
+def _HighlightChunk(argument: Tuple[Any, List[Tuple[str, str]]]) -> Dict[str, str]:
+	highlighter, chunk = argument
+	return {hash: highlighter.highlight_block(sourceCode, "vhdl", linenos=False) for hash, sourceCode in chunk}
+
+
+def _HighlightAll(sphinxApplication: Sphinx, jobs: List[Tuple[str, str]]) -> Dict[str, str]:
+	"""
+	Highlight source code in parallel worker processes (``sphinx-build -j N``) or sequentially.
+
+	:param sphinxApplication: The Sphinx application.
+	:param jobs:              List of tuples of cache key and source code.
+	:returns:                 Dictionary of cache keys to highlighted HTML.
+	"""
+	highlighter = sphinxApplication.builder.highlighter
+	results: Dict[str, str] = {}
+
+	if parallel_available and sphinxApplication.parallel > 1 and len(jobs) > 1:
+		tasks = ParallelTasks(sphinxApplication.parallel)
+		for chunk in make_chunks(jobs, sphinxApplication.parallel):
+			tasks.add_task(_HighlightChunk, (highlighter, chunk), lambda _, result: results.update(result))
+		tasks.join()
+	else:
+		results.update(_HighlightChunk((highlighter, jobs)))
+
+	return results
+
+
+@export
+def CollectSourcePages(sphinxApplication: Sphinx) -> Generator[Tuple[str, Dict[str, Any], str], None, None]:
+	"""
+	Call back for Sphinx ``html-collect-pages`` event.
+
+	Yields a highlighted source page for every VHDL source file of every design, whose content changed since the last
+	build (or whose output file is missing). All pages are generated again, if the Pygments style, theme or templates
+	changed (see :func:`SourcePageKey`). Highlighted HTML is cached per content hash, and source files missing in the
+	cache are highlighted in parallel, if Sphinx runs with multiple processes.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 A generator of tuples of page name, page context and template name.
+	"""
+	if not SourcePagesEnabled(sphinxApplication):
+		return
+
+	builder = sphinxApplication.builder
+	cache = HighlightCache(Path(sphinxApplication.doctreedir) / "vhdl-highlight", SourcePageKey(sphinxApplication))
+
+	# Paths in a model artifact are relative to the artifact's directory.
+	artifactPath = GetDesignCache(sphinxApplication.config).ArtifactPath
+	sourceDirectory = artifactPath.parent if artifactPath is not None else Path(sphinxApplication.confdir)
+
+	# Source files are listed by the catalog, so the model artifact is only loaded, if a page must be generated.
+	vhdlDomain = sphinxApplication.env.domains["vhdl"]
+	pages: List[Tuple[str, str, str, str]] = []
+	sourceCodes: Dict[str, str] = {}
+	for designName, design in vhdlDomain.Catalogs.items():
+		baseDirectory = sourceDirectory / design.BaseDirectory if design.BaseDirectory is not None else sourceDirectory
+		for _, shortPath, _ in design.SourceHashes.IterateFiles():
+			sourceFile = baseDirectory / shortPath
+			pageName = SourcePageName(designName, shortPath)
+
+			try:
+				content = sourceFile.read_bytes()
+			except OSError as ex:
+				print(f"[VHDL][WARNING] Can't read '{sourceFile}', skipping source page: {ex}")
+				continue
+
+			hash = HighlightCache.Hash(content)
+			if cache.IsUnchanged(pageName, hash) and Path(builder.get_outfilename(pageName)).exists():
+				continue
+
+			pages.append((pageName, designName, shortPath, hash))
+			sourceCodes[hash] = content.decode("utf-8")
+
+	highlighted: Dict[str, str] = {}
+	jobs: List[Tuple[str, str]] = []
+	for hash, sourceCode in sourceCodes.items():
+		cached = cache.Get(hash)
+		if cached is None:
+			jobs.append((hash, sourceCode))
+		else:
+			highlighted[hash] = cached
+
+	if jobs:
+		for hash, html in _HighlightAll(sphinxApplication, jobs).items():
+			cache.Put(hash, html)
+			highlighted[hash] = html
+
+	for pageName, designName, shortPath, hash in pages:
+		locations: SourceLocationTable = vhdlDomain.Designs[designName].SourceLocations
+		context = {
+			"parents": [],
+			"title":   shortPath,
+			"body":    f"<h1>Source code for {escape(shortPath)}</h1>\n{RenderSourceBlocks(highlighted[hash], locations.IterateDocument(shortPath))}",
+		}
+
+		yield pageName, context, _pageTemplate
+		cache.Record(pageName, hash)
+
+	cache.Save()
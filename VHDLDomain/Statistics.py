@@ -0,0 +1,240 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module contains design statistics: per library counts of design units, ports and generics as well as line counts.
+
+Statistics are collected in one pass while loading a design and stored in columnar arrays (module :mod:`array`), so
+summary tables and top-N lists are computed without walking the design model again.
+"""
+from array import array
+from heapq import nlargest
+from typing import Dict, Generator, List, NamedTuple
+
+from pyTooling.Decorators import export
+
+from VHDLDomain.Location import SourceLocationKind
+
+_predefinedLibraries = ("std", "ieee")
+
+
+@export
+class LineCount(NamedTuple):
+	"""Line counts of a source file."""
+	Lines:        int  #: Number of lines.
+	BlankLines:   int  #: Number of empty lines (or lines containing only whitespace).
+	CommentLines: int  #: Number of lines containing only a comment.
+
+	@property
+	def CodeLines(self) -> int:
+		return self.Lines - self.BlankLines - self.CommentLines
+
+
+@export
+def CountLines(sourceCode: str) -> LineCount:
+	"""
+	Count lines, blank lines and comment lines of VHDL source code.
+
+	A comment line contains only a single-line comment (``--``) or a line of a delimited comment (``/* ... */``).
+
+	:param sourceCode: VHDL source code.
+	:returns:          The line counts.
+	"""
+	lines = sourceCode.splitlines()
+	blankLines = 0
+	commentLines = 0
+	inDelimitedComment = False
+	for line in lines:
+		line = line.strip()
+		if inDelimitedComment:
+			commentLines += 1
+			inDelimitedComment = "*/" not in line
+		elif line == "":
+			blankLines += 1
+		elif line.startswith("--"):
+			commentLines += 1
+		elif line.startswith("/*"):
+			commentLines += 1
+			inDelimitedComment = "*/" not in line[2:]
+
+	return LineCount(len(lines), blankLines, commentLines)
+
+
+@export
+class LibraryStatistics(NamedTuple):
+	"""Statistics of a VHDL library."""
+	Library:       str  #: Identifier of the library.
+	Entities:      int  #: Number of entities.
+	Architectures: int  #: Number of architectures.
+	Packages:      int  #: Number of packages.
+	Ports:         int  #: Number of ports of all entities.
+	Generics:      int  #: Number of generics of all entities and packages.
+	Files:         int  #: Number of source files.
+	Lines:         int  #: Number of lines.
+	CodeLines:     int  #: Number of lines containing code.
+	CommentLines:  int  #: Number of lines containing only comments.
+
+	@property
+	def CommentRatio(self) -> float:
+		"""Ratio of comment lines to non-blank lines."""
+		nonBlankLines = self.CodeLines + self.CommentLines
+		return self.CommentLines / nonBlankLines if nonBlankLines > 0 else 0.0
+
+
+@export
+class EntityStatistics(NamedTuple):
+	"""Statistics of an entity."""
+	Library:       str  #: Identifier of the library.
+	Entity:        str  #: Identifier of the entity.
+	Architectures: int  #: Number of architectures.
+	Ports:         int  #: Number of ports.
+	Generics:      int  #: Number of generics.
+	Lines:         int  #: Number of lines of the entity declaration.
+
+
+@export
+class DesignStatistics:
+	"""
+	Statistics of a design in columnar arrays.
+
+	Line counts are added per source file while parsing (:meth:`AddDocument`), design unit counts are added once after
+	analysis (:meth:`AddDesign`).
+	"""
+
+	_libraries:      List[str]
+	_libraryIndex:   Dict[str, int]
+	_libraryColumns: Dict[str, array]
+
+	_entities:       List[str]
+	_entityColumns:  Dict[str, array]
+
+	def __init__(self) -> None:
+		self._libraries = []
+		self._libraryIndex = {}
+		self._libraryColumns = {column: array("I") for column in LibraryStatistics._fields[1:]}
+
+		self._entities = []
+		self._entityColumns = {column: array("I") for column in ("Library", ) + EntityStatistics._fields[2:]}
+
+	def _GetLibraryIndex(self, libraryName: str) -> int:
+		try:
+			return self._libraryIndex[libraryName.lower()]
+		except KeyError:
+			index = len(self._libraries)
+			self._libraries.append(libraryName)
+			self._libraryIndex[libraryName.lower()] = index
+			for column in self._libraryColumns.values():
+				column.append(0)
+			return index
+
+	def AddDocument(self, libraryName: str, lineCount: LineCount) -> None:
+		"""
+		Add the line counts of a source file.
+
+		:param libraryName: Identifier of the library the source file is compiled into.
+		:param lineCount:   Line counts of the source file.
+		"""
+		index = self._GetLibraryIndex(libraryName)
+		columns = self._libraryColumns
+		columns["Files"][index] += 1
+		columns["Lines"][index] += lineCount.Lines
+		columns["CodeLines"][index] += lineCount.CodeLines
+		columns["CommentLines"][index] += lineCount.CommentLines
+
+	def AddDesign(self, design) -> None:
+		"""
+		Add design unit, port and generic counts of an analyzed design (except predefined libraries).
+
+		:param design: An analyzed design with captured source locations.
+		"""
+		columns = self._libraryColumns
+		entityColumns = self._entityColumns
+		for library in design.Libraries.values():
+			libraryName = library.NormalizedIdentifier
+			if libraryName in _predefinedLibraries:
+				continue
+
+			index = self._GetLibraryIndex(library.Identifier)
+			for entity in library.Entities.values():
+				ports = sum(len(getattr(port, "Identifiers", (None, ))) for port in entity.PortItems)
+				generics = sum(len(getattr(generic, "Identifiers", (None, ))) for generic in entity.GenericItems)
+				architectures = len(library.Architectures.get(entity.NormalizedIdentifier, {}))
+				span = design.SourceLocations.Get(SourceLocationKind.Entity, f"{libraryName}.{entity.NormalizedIdentifier}")
+
+				columns["Entities"][index] += 1
+				columns["Architectures"][index] += architectures
+				columns["Ports"][index] += ports
+				columns["Generics"][index] += generics
+
+				self._entities.append(entity.Identifier)
+				entityColumns["Library"].append(index)
+				entityColumns["Architectures"].append(architectures)
+				entityColumns["Ports"].append(ports)
+				entityColumns["Generics"].append(generics)
+				entityColumns["Lines"].append(span.EndLine - span.Line + 1 if span is not None else 0)
+
+			for package in library.Packages.values():
+				columns["Packages"][index] += 1
+				columns["Generics"][index] += sum(len(getattr(generic, "Identifiers", (None, ))) for generic in package.GenericItems)
+
+	def _LibraryRow(self, index: int) -> LibraryStatistics:
+		return LibraryStatistics(self._libraries[index], *(column[index] for column in self._libraryColumns.values()))
+
+	def _EntityRow(self, index: int) -> EntityStatistics:
+		columns = self._entityColumns
+		return EntityStatistics(
+			self._libraries[columns["Library"][index]],
+			self._entities[index],
+			*(columns[column][index] for column in EntityStatistics._fields[2:])
+		)
+
+	def IterateLibraries(self) -> Generator[LibraryStatistics, None, None]:
+		"""Iterate statistics of all libraries sorted by library name."""
+		for index in sorted(range(len(self._libraries)), key=lambda index: self._libraries[index].lower()):
+			yield self._LibraryRow(index)
+
+	@property
+	def Total(self) -> LibraryStatistics:
+		"""Returns statistics summed over all libraries."""
+		return LibraryStatistics("", *(sum(column) for column in self._libraryColumns.values()))
+
+	def TopEntities(self, column: str, count: int) -> List[EntityStatistics]:
+		"""
+		Returns the entities with the highest values in a column.
+
+		:param column: Name of a column: ``Architectures``, ``Ports``, ``Generics`` or ``Lines``.
+		:param count:  Maximum number of entities to return.
+		:returns:      List of entity statistics sorted by descending value.
+		"""
+		values = self._entityColumns[column]
+		return [self._EntityRow(index) for index in nlargest(count, range(len(values)), key=values.__getitem__)]
@@ -0,0 +1,259 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module generates documentation stub pages (similar to ``sphinx.ext.autosummary``) for VHDL design units.
+
+Stub files are only written if their content changed, so Sphinx's modification time based outdated detection doesn't
+re-read unchanged pages. Generated stubs of removed design units are deleted.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+from pyTooling.Decorators import export
+from sphinx.application import Sphinx
+
+from VHDLDomain.Order import GetSortedDesign
+
+_predefinedLibraries = ("std", "ieee")
+_stubMarker = ".. This file was generated by VHDLDomain. Don't edit it manually."
+
+
+@export
+class StubWriter:
+	"""
+	Writes stub files into a directory, but only if a file's content differs from the content on disk.
+	"""
+	_directory:      Path
+	_writtenCount:   int
+	_unchangedCount: int
+	_removedCount:   int
+	_paths:          Set[Path]
+
+	def __init__(self, directory: Path):
+		"""
+		Initializes a stub writer.
+
+		:param directory: Directory to write stub files into.
+		"""
+		self._directory = directory
+		self._writtenCount = 0
+		self._unchangedCount = 0
+		self._removedCount = 0
+		self._paths = set()
+
+	@property
+	def Directory(self) -> Path:
+		return self._directory
+
+	@property
+	def WrittenCount(self) -> int:
+		return self._writtenCount
+
+	@property
+	def UnchangedCount(self) -> int:
+		return self._unchangedCount
+
+	@property
+	def RemovedCount(self) -> int:
+		return self._removedCount
+
+	def Write(self, relativePath: Path, content: str) -> bool:
+		"""
+		Write a stub file, if its content changed.
+
+		:param relativePath: Path of the stub file relative to the stub directory.
+		:param content:      Content of the stub file.
+		:returns:            True, if the file was written.
+		"""
+		path = self._directory / relativePath
+		self._paths.add(path)
+		try:
+			if path.read_text(encoding="utf-8") == content:
+				self._unchangedCount += 1
+				return False
+		except OSError:
+			path.parent.mkdir(parents=True, exist_ok=True)
+
+		path.write_text(content, encoding="utf-8")
+		self._writtenCount += 1
+		return True
+
+	def RemoveStale(self) -> None:
+		"""
+		Delete generated stub files, which were not written (or found unchanged) by this writer.
+
+		Only files starting with the VHDLDomain stub marker are deleted, thus manually written files in the stub directory
+		are kept. Directories, which became empty because a stale stub was deleted, are removed, too. Other empty
+		directories and the stub directory itself are kept.
+		"""
+		if not self._directory.exists():
+			return
+
+		directories: Set[Path] = set()
+		for path in sorted(self._directory.rglob("*.rst"), reverse=True):
+			if path in self._paths:
+				continue
+
+			try:
+				with path.open("r", encoding="utf-8") as fileHandle:
+					isStub = fileHandle.readline().rstrip("\n") == _stubMarker
+			except OSError:
+				continue
+
+			if isStub:
+				path.unlink()
+				self._removedCount += 1
+				directories.add(path.parent)
+
+		# Remove emptied directories bottom-up; a parent becomes a candidate, if its emptied child was removed.
+		while directories:
+			directory = max(directories, key=lambda path: len(path.parts))
+			directories.remove(directory)
+			if directory == self._directory or any(directory.iterdir()):
+				continue
+
+			directory.rmdir()
+			directories.add(directory.parent)
+
+
+@export
+def CreateStub(title: str, body: str) -> str:
+	"""
+	Returns the content of a stub page consisting of a marker comment, a title and a body.
+
+	:param title: Title of the page.
+	:param body:  reStructuredText content following the title.
+	:returns:     The reStructuredText content.
+	"""
+	return f"{_stubMarker}\n\n{title}\n{'#' * len(title)}\n\n{body}"
+
+
+@export
+def CreateDirectiveStub(title: str, directive: str, argument: str, options: Dict[str, str] = None) -> str:
+	"""
+	Returns the content of a stub page consisting of a title and a single VHDL directive.
+
+	:param title:     Title of the page.
+	:param directive: Name of the directive (without domain).
+	:param argument:  Argument of the directive.
+	:param options:   Optional directive options.
+	:returns:         The reStructuredText content.
+	"""
+	lines = "".join(f"   :{optionName}: {value}\n" for optionName, value in (options or {}).items())
+	return CreateStub(title, f".. vhdl:{directive}:: {argument}\n{lines}")
+
+
+@export
+def CreateToctreeStub(title: str, entries: Iterable[str]) -> str:
+	"""
+	Returns the content of a stub page consisting of a title and a toctree.
+
+	:param title:   Title of the page.
+	:param entries: Document names listed in the toctree.
+	:returns:       The reStructuredText content.
+	"""
+	lines = "".join(f"   {entry}\n" for entry in entries)
+	return CreateStub(title, f".. toctree::\n   :maxdepth: 1\n\n{lines}")
+
+
+@export
+def StubDocumentName(stubDirectory: str, libraryName: str, unitName: str = None, designName: str = None) -> str:
+	"""
+	Returns the Sphinx document name of a generated stub page.
+
+	:param stubDirectory: Stub directory relative to the source directory (empty for the source directory).
+	:param libraryName:   Name of the library.
+	:param unitName:      Name of the design unit, or ``None`` for the library's stub page.
+	:param designName:    Name of the design, if more than one design is loaded, otherwise ``None``.
+	:returns:             The document name.
+	"""
+	prefix = f"{Path(stubDirectory).as_posix()}/" if stubDirectory else ""
+	if designName is not None:
+		prefix += f"{designName}/"
+
+	if unitName is None:
+		return f"{prefix}{libraryName}"
+	else:
+		return f"{prefix}{libraryName}/{unitName}"
+
+
+@export
+def GenerateStubs(sphinxApplication: Sphinx) -> None:
+	"""
+	Call back for Sphinx ``builder-inited`` event.
+
+	Writes stub pages into directory ``vhdl_stub_directory`` (relative to the source directory):
+
+	* ``<library>.rst`` per VHDL library containing a toctree of all its design units,
+	* ``<library>/<entity>.rst`` per entity using directive ``vhdl:describeentity`` and
+	* ``<library>/<package>.rst`` per package using directive ``vhdl:describepackage``.
+
+	If more than one design is loaded, the stubs of each design are written into a subdirectory ``<design>``, because
+	designs may use the same library names (e.g. ``work``).
+
+	Unchanged stubs are not rewritten and stubs of removed design units are deleted. Stub generation is disabled, if
+	``vhdl_stub_directory`` is ``None``.
+
+	:param sphinxApplication: The Sphinx application.
+	"""
+	stubDirectory = sphinxApplication.config.vhdl_stub_directory
+	if stubDirectory is None:
+		return
+
+	writer = StubWriter(Path(sphinxApplication.srcdir) / stubDirectory)
+	designs: Dict = sphinxApplication.env.domains["vhdl"].Catalogs
+
+	print(f"[VHDL] Generating stubs in '{writer.Directory}' ...")
+	for designName, design in designs.items():
+		options = {"design": designName}
+		designDirectory = Path(designName) if len(designs) > 1 else Path()
+		sortedDesign = GetSortedDesign(design)
+		for library in sortedDesign.Libraries:
+			if library.NormalizedIdentifier in _predefinedLibraries:
+				continue
+
+			libraryName = library.Identifier
+			entries = []
+			for entity in sortedDesign.Entities(library):
+				writer.Write(designDirectory / libraryName / f"{entity.Identifier}.rst", CreateDirectiveStub(entity.Identifier, "describeentity", f"{libraryName}.{entity.Identifier}", options))
+				entries.append(f"{libraryName}/{entity.Identifier}")
+			for package in sortedDesign.Packages(library):
+				writer.Write(designDirectory / libraryName / f"{package.Identifier}.rst", CreateDirectiveStub(package.Identifier, "describepackage", f"{libraryName}.{package.Identifier}", options))
+				entries.append(f"{libraryName}/{package.Identifier}")
+
+			writer.Write(designDirectory / f"{libraryName}.rst", CreateToctreeStub(libraryName, entries))
+
+	writer.RemoveStale()
+
+	print(f"[VHDL]   Written {writer.WrittenCount} stubs, {writer.UnchangedCount} unchanged, {writer.RemovedCount} removed.")
@@ -0,0 +1,218 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+This module tracks which design units and source files each document consumed, so only documents depending on a
+changed VHDL source file are read again.
+
+While loading a design, a content hash of each source file is recorded. While reading a document, directives record
+the hashes of the source files (or libraries, or whole designs) they described. At ``env-get-outdated``, the recorded
+hashes are compared with the hashes of the freshly loaded designs.
+"""
+from hashlib import sha256
+from typing import Dict, Generator, List, Set, Tuple, Optional as Nullable
+
+from pyTooling.Decorators import export
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+
+DependencyKey = Tuple[str, ...]  #: ``("file", design, path)``, ``("library", design, library)`` or ``("design", design)``.
+
+
+@export
+class SourceHashTable:
+	"""Content hashes of all source files of a design, grouped by library."""
+
+	_files:     Dict[str, str]
+	_libraries: Dict[str, List[str]]
+	_cache:     Dict[str, str]
+
+	def __init__(self) -> None:
+		self._files = {}
+		self._libraries = {}
+		self._cache = {}
+
+	def __len__(self) -> int:
+		return len(self._files)
+
+	def AddDocument(self, libraryName: str, path: str, sourceCode: str) -> None:
+		"""
+		Add a source file.
+
+		:param libraryName: Name of the library the file is compiled into.
+		:param path:        Path of the source file relative to the design's base directory.
+		:param sourceCode:  Content of the source file.
+		"""
+		self.AddHash(libraryName, path, sha256(sourceCode.encode("utf-8")).hexdigest())
+
+	def AddHash(self, libraryName: str, path: str, hash: str) -> None:
+		"""
+		Add a source file by its precomputed content hash (e.g. read from a catalog).
+
+		:param libraryName: Name of the library the file is compiled into.
+		:param path:        Path of the source file relative to the design's base directory.
+		:param hash:        SHA-256 hash of the source file's content.
+		"""
+		self._files[path] = hash
+		self._libraries.setdefault(libraryName.lower(), []).append(path)
+		self._cache.clear()
+
+	def IterateFiles(self) -> Generator[Tuple[str, str, str], None, None]:
+		"""Yields library name (normalized), path and hash of all source files."""
+		for libraryName, paths in self._libraries.items():
+			for path in paths:
+				yield libraryName, path, self._files[path]
+
+	def _Combine(self, key: str, paths: List[str]) -> str:
+		try:
+			return self._cache[key]
+		except KeyError:
+			pass
+
+		hash = sha256()
+		for path in sorted(paths):
+			hash.update(f"{path}\0{self._files[path]}\n".encode("utf-8"))
+
+		self._cache[key] = hash.hexdigest()
+		return self._cache[key]
+
+	def GetFile(self, path: str) -> Nullable[str]:
+		"""Returns the hash of a source file, or ``None`` if it's not part of the design."""
+		return self._files.get(path)
+
+	def GetLibrary(self, libraryName: str) -> Nullable[str]:
+		"""Returns a hash over all source files (paths and contents) of a library, or ``None`` if it's unknown."""
+		libraryName = libraryName.lower()
+		if libraryName not in self._libraries:
+			return None
+
+		return self._Combine(f"library:{libraryName}", self._libraries[libraryName])
+
+	@property
+	def Design(self) -> str:
+		"""Hash over all source files (paths and contents) of the design."""
+		return self._Combine("design:", list(self._files))
+
+
+def _CurrentHash(designs: Dict, key: DependencyKey) -> Nullable[str]:
+	kind, designName, *names = key
+	try:
+		hashes: SourceHashTable = designs[designName].SourceHashes
+	except KeyError:
+		return None
+
+	if kind == "file":
+		return hashes.GetFile(names[0])
+	elif kind == "library":
+		return hashes.GetLibrary(names[0])
+	else:
+		return hashes.Design
+
+
+@export
+class DocumentTracker:
+	"""
+	Design units and source file hashes consumed by each document.
+
+	Entries are grouped by document name, so they can be cleared and merged per document like the object table.
+	"""
+
+	_hashes: Dict[str, Dict[DependencyKey, str]]
+	_units:  Dict[str, Set[str]]
+
+	def __init__(self) -> None:
+		self._hashes = {}
+		self._units = {}
+
+	def __len__(self) -> int:
+		return len(self._hashes)
+
+	def Add(self, docname: str, key: DependencyKey, hash: Nullable[str]) -> None:
+		"""Record that a document consumed a source file, library or design with the given hash."""
+		self._hashes.setdefault(docname, {})[key] = hash
+
+	def AddUnit(self, docname: str, designName: str, unitName: str) -> None:
+		"""Record that a document described a design unit."""
+		self._units.setdefault(docname, set()).add(f"{designName}:{unitName}")
+
+	def GetUnits(self, docname: str) -> Set[str]:
+		"""Returns the design units (``design:library.unit``) described by a document."""
+		return self._units.get(docname, set())
+
+	def ClearDocument(self, docname: str) -> None:
+		self._hashes.pop(docname, None)
+		self._units.pop(docname, None)
+
+	def MergeDocuments(self, other: "DocumentTracker", docnames: Set[str]) -> None:
+		for docname in docnames:
+			if docname in other._hashes:
+				self._hashes[docname] = other._hashes[docname]
+			if docname in other._units:
+				self._units[docname] = other._units[docname]
+
+	def IterateOutdated(self, designs: Dict) -> Generator[str, None, None]:
+		"""
+		Yields all documents, which consumed a source file, library or design whose hash changed.
+
+		:param designs: The currently loaded designs, or their catalog views (both provide ``SourceHashes``).
+		"""
+		for docname, hashes in self._hashes.items():
+			for key, hash in hashes.items():
+				if _CurrentHash(designs, key) != hash:
+					yield docname
+					break
+
+
+@export
+def GetOutdatedDocuments(sphinxApplication: Sphinx, env: BuildEnvironment, added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+	"""
+	Call back for Sphinx ``env-get-outdated`` event.
+
+	Returns all documents, which consumed a VHDL source file that was changed, added to or removed from the design.
+
+	Source hashes are taken from the catalog of a model artifact, if available, so this check (done at every build)
+	doesn't load the model artifact.
+
+	:param sphinxApplication: The Sphinx application.
+	:param env:               The build environment.
+	:param added:             Documents added since the last build.
+	:param changed:           Documents changed since the last build.
+	:param removed:           Documents removed since the last build.
+	:returns:                 Additional documents to read again.
+	"""
+	vhdlDomain = env.domains["vhdl"]
+	outdated = [docname for docname in vhdlDomain.Tracker.IterateOutdated(vhdlDomain.Catalogs) if docname not in changed and docname not in removed]
+	if len(outdated) > 0:
+		print(f"[VHDL] {len(outdated)} documents depend on changed VHDL sources.")
+
+	return outdated
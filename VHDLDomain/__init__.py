@@ -44,28 +44,64 @@ __copyright__ = "2016-2023, Patrick Lehmann"
 __license__ =   "Apache License, Version 2.0"
 __version__ =   "0.1.0"
 
+from hashlib import sha256
+from json import dumps
+from os.path import relpath
 from pathlib import Path
-from typing import Dict, Tuple, Any, Optional as Nullable, cast
+from time import perf_counter
+from typing import Callable, Dict, Tuple, Any, Generator, Iterable, NamedTuple, Set, Union, Optional as Nullable, cast
 
 from docutils import nodes
 from pyGHDL.dom.NonStandard import Design as DOMDesign, Document as DOMDocument
 from pyTooling.Decorators import export
+from pyTooling.Graph import Graph
+from pyVHDLModel import DesignUnitKind
+from pyVHDLModel.DesignUnit import DesignUnit
 from sphinx.addnodes import pending_xref
 from sphinx.application import Sphinx
 from sphinx.builders import Builder
-from sphinx.domains import Domain
+from sphinx.config import Config
+from sphinx.domains import Domain, ObjType
 from sphinx.environment import BuildEnvironment
+from sphinx.errors import ConfigError
 from sphinx.extension import Extension
-
-from VHDLDomain.Directive import DescribeDesign, DescribeLibrary, DescribeDocument, DescribeEntity, DescribeArchitecture
+from sphinx.util.nodes import make_refnode
+
+from VHDLDomain.Artifact import CheckModelArtifact, GetDesignCache, LoadBeforeParallelRead, ModelArtifactException
+from VHDLDomain.Catalog import DesignView
+from VHDLDomain.Dependency import DependencyClosure
+from VHDLDomain.Diagnostic import DiagnosticCollection
+from VHDLDomain.Diagram import pending_vhdl_diagram, RenderDiagrams, ResolveDiagrams
+from VHDLDomain.Directive import DescribeDependencies, DescribeDesignStatistics, DescribeDesign, DescribeLibrary, DescribeDocument, DescribeEntity, DescribeArchitecture
 from VHDLDomain.Directive import DescribePackage, DescribePackageBody, DescribeConfiguration, DescribeContext
+from VHDLDomain.Inventory import ObjectTable, LoadExternalInventories, GetExternalInventory
+from VHDLDomain.Identifier import IdentifierTable, DesignUnitTable
 from VHDLDomain.Index import LibraryIndex, DocumentIndex, ComponentIndex, PackageIndex, SubprogramIndex, TypeIndex
-from VHDLDomain.Role import DesignRole, LibraryRole, DocumentRole, ContextRole, EntityRole, ArchitectureRole, PackageRole, PackageBodyRole, ConfigurationRole
+from VHDLDomain.Location import SourceLocationTable
+from VHDLDomain.Option import CompileDefaults, GetDefaults, directiveOptions
+from VHDLDomain.Prefetch import SourceFilePrefetcher
+from VHDLDomain.Role import DesignRole, LibraryRole, DocumentRole, ContextRole, EntityRole, ArchitectureRole, ComponentRole, PackageRole, PackageBodyRole, ConfigurationRole
+from VHDLDomain.Role import TypeRole, FunctionRole, ProcedureRole, ConstantRole, GenericRole, PortRole, ParameterRole, pending_vhdl_xref, ResolveReferences
+from VHDLDomain.Signature import SignatureIndex
+from VHDLDomain.Statistics import DesignStatistics, CountLines
+from VHDLDomain.Search import SymbolSearch, AddSearchScript, WriteSymbolIndex
+from VHDLDomain.SourcePage import CollectSourcePages
+from VHDLDomain.Stub import GenerateStubs
+from VHDLDomain.Tracking import SourceHashTable, DocumentTracker, GetOutdatedDocuments
 
 
 @export
 class Design(DOMDesign):
-	_baseDirectory: Nullable[Path]
+	_baseDirectory:   Nullable[Path]
+	_sourceLocations: SourceLocationTable
+	_signatures:      SignatureIndex
+	_statistics:      DesignStatistics
+	_dependencies:    DependencyClosure
+	_sourceHashes:    SourceHashTable
+	_identifiers:     IdentifierTable
+	_units:           DesignUnitTable
+	_diagnostics:     DiagnosticCollection
+	_analyzedUnits:   Nullable[Tuple[DesignUnit, ...]]
 
 	def __init__(self, name: str = None, baseDirectory: Path = None):
 		"""
@@ -76,11 +112,177 @@ class Design(DOMDesign):
 		"""
 		super().__init__(name)
 		self._baseDirectory = baseDirectory
+		self._sourceLocations = SourceLocationTable()
+		self._identifiers = IdentifierTable()
+		self._units = DesignUnitTable(self._identifiers)
+		self._signatures = SignatureIndex(self._identifiers)
+		self._statistics = DesignStatistics()
+		self._dependencies = DependencyClosure()
+		self._sourceHashes = SourceHashTable()
+		self._diagnostics = DiagnosticCollection()
+		self._analyzedUnits = None
 
 	@property
 	def BaseDirectory(self) -> Path:
 		return self._baseDirectory
 
+	def Relocate(self, directory: Path) -> None:
+		"""
+		Makes the base directory and all document paths relative to ``directory``.
+
+		A model artifact stores paths relative to its own directory, so it stays valid, if the artifact is moved or used
+		on another machine together with the VHDL sources.
+
+		:param directory: Directory the paths will be relative to (e.g. the directory of a model artifact).
+		"""
+		if self._baseDirectory is None:
+			return
+
+		try:
+			baseDirectory = Path(relpath(self._baseDirectory.resolve(), directory.resolve()))
+		except ValueError:  # e.g. on another drive
+			return
+
+		for document in self._documents:
+			document._path = baseDirectory / document.ShortPath
+		self._baseDirectory = baseDirectory
+
+	@property
+	def SourceLocations(self) -> SourceLocationTable:
+		"""Source locations of all language constructs captured while parsing."""
+		return self._sourceLocations
+
+	@property
+	def Identifiers(self) -> IdentifierTable:
+		"""Design-wide table of interned, case-insensitive identifiers."""
+		return self._identifiers
+
+	@property
+	def Units(self) -> DesignUnitTable:
+		"""Libraries and primary design units keyed by identifier IDs, built after analysis."""
+		return self._units
+
+	@property
+	def Signatures(self) -> SignatureIndex:
+		"""Signatures of all subprograms declared in packages, built after analysis."""
+		return self._signatures
+
+	@property
+	def Statistics(self) -> DesignStatistics:
+		"""Line counts collected while parsing and design unit counts collected after analysis."""
+		return self._statistics
+
+	@property
+	def Dependencies(self) -> DependencyClosure:
+		"""Transitive dependencies and dependents of all libraries and design units, computed after analysis."""
+		return self._dependencies
+
+	@property
+	def SourceHashes(self) -> SourceHashTable:
+		"""Content hashes of all source files, used to find documents depending on changed files."""
+		return self._sourceHashes
+
+	@property
+	def Diagnostics(self) -> DiagnosticCollection:
+		"""Read, parse and analysis errors collected while loading the design."""
+		return self._diagnostics
+
+	def IterateDesignUnits(self, filter: DesignUnitKind = DesignUnitKind.All) -> Generator[DesignUnit, None, None]:
+		"""
+		Iterates all design units of the design.
+
+		While :meth:`Analyze` executes a step for a single design unit, only that design unit is returned.
+		"""
+		if self._analyzedUnits is None:
+			yield from super().IterateDesignUnits(filter)
+		else:
+			yield from self._analyzedUnits
+
+	def Analyze(self) -> None:
+		"""
+		Analyzes the design step by step and design unit by design unit.
+
+		In contrast to :meth:`pyVHDLModel.Design.Analyze`, an error doesn't abort the analysis. All steps indexing or
+		linking design units are executed for one design unit at a time. If a design unit can't be linked (e.g. it uses a
+		package of a file, which couldn't be parsed), the error is recorded in :py:attr:`Diagnostics` for the file of that
+		design unit and all other design units are still linked.
+
+		Steps working on the whole design (creating the dependency, compile order and hierarchy graphs, propagating
+		context references and computing the compile order) can't be split by design unit. If such a step fails, its error
+		is recorded for the design and the rest of that step is skipped.
+		"""
+		self._AnalyzeStep(self.CreateDependencyGraph, self.name)
+		self._AnalyzeStep(self.CreateCompileOrderGraph, self.name)
+
+		for library in self._libraries.values():
+			for package in library.IterateDesignUnits(DesignUnitKind.Package):
+				self._AnalyzeStep(package.IndexPackage, self._UnitPath(package))
+			for architecture in library.IterateDesignUnits(DesignUnitKind.Architecture):
+				self._AnalyzeStep(architecture.Index, self._UnitPath(architecture))
+
+		self._AnalyzeUnits(self.LinkContexts, self.IterateDesignUnits(DesignUnitKind.Context))
+
+		# Library steps iterate the library's dictionaries, so these are reduced to a single design unit per call.
+		for library in self._libraries.values():
+			architectures, packageBodies = library._architectures, library._packageBodies
+			try:
+				for entityIdentifier, architecturesPerEntity in architectures.items():
+					for architectureIdentifier, architecture in architecturesPerEntity.items():
+						library._architectures = {entityIdentifier: {architectureIdentifier: architecture}}
+						self._AnalyzeStep(library.LinkArchitectures, self._UnitPath(architecture))
+				for packageBodyIdentifier, packageBody in packageBodies.items():
+					library._packageBodies = {packageBodyIdentifier: packageBody}
+					self._AnalyzeStep(library.LinkPackageBodies, self._UnitPath(packageBody))
+			finally:
+				library._architectures, library._packageBodies = architectures, packageBodies
+
+		self._AnalyzeUnits(self.LinkLibraryReferences, self.IterateDesignUnits(DesignUnitKind.WithContext))
+		self._AnalyzeUnits(self.LinkPackageReferences, self.IterateDesignUnits(DesignUnitKind.WithContext))
+
+		# Link context references unit by unit against an empty dependency graph, so the contexts are propagated along the
+		# whole dependency graph only once afterwards.
+		dependencyGraph, self._dependencyGraph = self._dependencyGraph, Graph()
+		try:
+			self._AnalyzeUnits(self.LinkContextReferences, [unit for unit in self.IterateDesignUnits() if unit._contextReferences])
+		finally:
+			self._dependencyGraph = dependencyGraph
+		self._AnalyzeStep(self.LinkContextReferences, self.name, ())
+
+		self._AnalyzeUnits(self.LinkComponents, self.IterateDesignUnits(DesignUnitKind.Package))
+		self._AnalyzeUnits(self.LinkInstantiations, self.IterateDesignUnits(DesignUnitKind.Architecture))
+		self._AnalyzeStep(self.CreateHierarchyGraph, self.name)
+		self._AnalyzeStep(self.ComputeCompileOrder, self.name)
+
+	def _AnalyzeUnits(self, step: Callable[[], None], designUnits: Iterable[DesignUnit]) -> None:
+		for designUnit in list(designUnits):
+			self._AnalyzeStep(step, self._UnitPath(designUnit), (designUnit, ))
+
+	def _AnalyzeStep(self, step: Callable[[], None], path: str, designUnits: Tuple[DesignUnit, ...] = None) -> None:
+		"""
+		Executes an analysis step and records its error for ``path``.
+
+		:param step:        Analysis step to execute.
+		:param path:        Path of the source file (or name of the design) the error is recorded for.
+		:param designUnits: Design units returned by :meth:`IterateDesignUnits` during the step, or ``None`` for all.
+		"""
+		self._analyzedUnits = designUnits
+		try:
+			step()
+		except Exception as ex:
+			self._diagnostics.Add(path, "analyze", ex)
+		finally:
+			self._analyzedUnits = None
+
+	def _UnitPath(self, designUnit: DesignUnit) -> str:
+		path = designUnit.Document.Path
+		if self._baseDirectory is not None:
+			try:
+				return path.relative_to(self._baseDirectory).as_posix()
+			except ValueError:
+				pass
+
+		return path.as_posix()
+
 
 @export
 class Document(DOMDocument):
@@ -93,6 +295,208 @@ class Document(DOMDocument):
 			return self._path.relative_to(design._baseDirectory)
 
 
+_defaultPatterns = (("work", "**/*.vhd"), ("work", "**/*.vhdl"))  #: Files of a design configured only by its root directory.
+
+
+@export
+class DesignConfiguration(NamedTuple):
+	"""Root directory and source file patterns of a design (see configuration variable ``vhdl_designs``)."""
+
+	Root:  Path
+	Files: Tuple[Tuple[str, str], ...]  #: Tuples of library name and path or glob pattern relative to :py:attr:`Root`.
+
+
+@export
+def GetDesignConfiguration(value: Union[str, Path, Dict[str, Any]], baseDirectory: Path = None) -> DesignConfiguration:
+	"""
+	Converts an entry of configuration variable ``vhdl_designs`` into a design configuration.
+
+	An entry is either a path to the design's root directory (all ``*.vhd`` and ``*.vhdl`` files below are compiled into
+	library ``work``), or a dictionary with keys ``root`` and ``files``. ``files`` is a list of tuples of library name
+	and path or glob pattern relative to the root directory in compile order.
+
+	:param value:         Entry of ``vhdl_designs``.
+	:param baseDirectory: Directory relative root directories are resolved against (e.g. the configuration directory).
+	:returns:             The design configuration.
+	:raises ValueError:   If the entry has an unsupported format.
+	"""
+	if isinstance(value, (str, Path)):
+		root = Path(value)
+		files = _defaultPatterns
+	elif isinstance(value, dict):
+		try:
+			root = Path(value["root"])
+		except KeyError:
+			raise ValueError(f"Design configuration has no 'root' entry.")
+
+		files = []
+		for entry in value.get("files", _defaultPatterns):
+			try:
+				libraryName, pattern = entry
+			except (TypeError, ValueError):
+				raise ValueError(f"File entry '{entry}' is not a tuple of library name and path.")
+			files.append((str(libraryName), Path(pattern).as_posix()))
+		files = tuple(files)
+	else:
+		raise ValueError(f"Design configuration '{value}' is neither a path nor a dictionary.")
+
+	if baseDirectory is not None and not root.is_absolute():
+		root = baseDirectory / root
+
+	return DesignConfiguration(root, files)
+
+
+@export
+def GetDesignFiles(configuration: DesignConfiguration) -> Generator[Tuple[str, Path], None, None]:
+	"""
+	Returns all VHDL source files of a design in compile order.
+
+	Glob patterns are expanded in sorted order. A file matched by multiple patterns is returned only once (for the first
+	matching pattern). Explicitly listed files are returned even if they don't exist, so reading them reports an error.
+
+	:param configuration: Configuration of the design.
+	:returns:             A generator of tuples of library name and path to the source file.
+	"""
+	seen: Set[Path] = set()
+	for libraryName, pattern in configuration.Files:
+		if any(character in pattern for character in "*?["):
+			files = sorted(path for path in configuration.Root.glob(pattern) if path.is_file())
+		else:
+			files = [configuration.Root / pattern]
+
+		for file in files:
+			if file not in seen:
+				seen.add(file)
+				yield libraryName, file
+
+
+@export
+def ComputeConfigurationFingerprint(sphinxApplication: Sphinx, config: Config) -> None:
+	"""
+	Call back for Sphinx ``config-inited`` event (after :func:`~VHDLDomain.Option.CompileDefaults`).
+
+	Computes a fingerprint of the effective design configuration: the resolved source file lists of all designs and the
+	compiled default options of all directives. Both are serialized canonically (sorted keys, POSIX paths, option values
+	as strings), so the fingerprint doesn't depend on dictionary order or object representations in :file:`conf.py`.
+
+	Only the fingerprint is registered with rebuild ``env``; thus, an unchanged effective configuration never forces
+	reading all documents again. Changes of source file contents are handled per document (see
+	:mod:`VHDLDomain.Tracking`).
+
+	:param sphinxApplication: The Sphinx application.
+	:param config:            The Sphinx configuration.
+	:raises ConfigError:      If an entry of ``vhdl_designs`` has an unsupported format.
+	"""
+	designs = {}
+	for designName, value in config.vhdl_designs.items():
+		try:
+			configuration = GetDesignConfiguration(value, Path(sphinxApplication.confdir))
+		except ValueError as ex:
+			raise ConfigError(f"vhdl_designs['{designName}']: {ex}") from ex
+		designs[str(designName)] = [(libraryName, file.as_posix()) for libraryName, file in GetDesignFiles(configuration)]
+
+	defaults = {}
+	for directiveName in directiveOptions:
+		defaults[directiveName] = {optionName: str(value) for optionName, value in GetDefaults(config, directiveName)._asdict().items()}
+
+	canonical = dumps({"designs": designs, "defaults": defaults}, sort_keys=True, separators=(",", ":"))
+	config.vhdl_configuration_fingerprint = sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@export
+def LoadDesign(designName: str, configuration: DesignConfiguration, prefetchBufferSize: int = 8) -> Design:
+	"""
+	Parses all VHDL source files of a design and analyzes the design.
+
+	This is shared by the Sphinx ``builder-inited`` callback and the ``python -m VHDLDomain analyze`` command.
+
+	Files which can't be read or parsed are skipped; their errors are collected in :py:attr:`Design.Diagnostics` and
+	reported in bulk after the remaining files were analyzed.
+
+	:param designName:         Name of the design.
+	:param configuration:      Root directory and source files of the design.
+	:param prefetchBufferSize: Number of source files to read ahead while parsing.
+	:returns:                  The analyzed design.
+	"""
+	print(f"[VHDL]   Loading design '{designName}' ...")
+	designRoot = configuration.Root
+	if not designRoot.exists():
+		print(f"[VHDL][ERROR] Path '{designRoot}' does not exist.")
+	design = Design(designName, designRoot)
+	design.LoadDefaultLibraries()
+
+	def ShortPath(sourceFile: Path) -> str:
+		try:
+			return sourceFile.relative_to(designRoot).as_posix()
+		except ValueError:
+			return sourceFile.as_posix()
+
+	def ReadError(libraryName: str, sourceFile: Path, ex: Exception) -> None:
+		print(f"[VHDL][ERROR] Can't read '{sourceFile}': {ex}")
+		design.Diagnostics.Add(ShortPath(sourceFile), "read", ex)
+
+	prefetcher = SourceFilePrefetcher(GetDesignFiles(configuration), bufferSize=prefetchBufferSize, onError=ReadError)
+	parseTime = 0.0
+	for libraryName, sourceFile, sourceCode in prefetcher:
+		print(f"[VHDL]     Parsing '{sourceFile}'")
+		startTime = perf_counter()
+		try:
+			document = Document(sourceFile, sourceCode)
+		except Exception as ex:
+			print(f"[VHDL][ERROR] Can't parse '{sourceFile}', skipping file.")
+			design.Diagnostics.Add(ShortPath(sourceFile), "parse", ex)
+			# Keep the hash of the broken file, so fixing it rebuilds the documents describing its library.
+			design.SourceHashes.AddDocument(libraryName, ShortPath(sourceFile), sourceCode)
+			continue
+		finally:
+			parseTime += perf_counter() - startTime
+
+		design.AddDocument(document, design.GetLibrary(libraryName))
+		design.SourceLocations.AddDocument(document, document.ShortPath.as_posix(), sourceCode.count("\n") + 1)
+		design.Statistics.AddDocument(libraryName, CountLines(sourceCode))
+		design.SourceHashes.AddDocument(libraryName, document.ShortPath.as_posix(), sourceCode)
+
+	print(f"[VHDL]     Read {prefetcher.FileCount} files ({prefetcher.ByteCount} characters): I/O wait {prefetcher.WaitTime:.3f} s (read {prefetcher.ReadTime:.3f} s), parsing {parseTime:.3f} s")
+
+	print(f"[VHDL]     Analyzing design '{designName}' ...")
+	design.Analyze()
+	design.Units.AddDesign(design)
+	design.Signatures.AddDesign(design)
+	design.Statistics.AddDesign(design)
+	design.Dependencies.AddDesign(design)
+
+	design.Diagnostics.Report(designName)
+
+	return design
+
+
+def LoadDesigns(sphinxApplication: Sphinx) -> Dict[str, Design]:
+	"""
+	Parses and analyzes all designs listed in configuration variable ``vhdl_designs``.
+
+	:param sphinxApplication: The Sphinx application.
+	:returns:                 Dictionary of analyzed designs.
+	"""
+	designs: Dict[str, Design] = {}
+
+	# Get modules to build documentation for
+	designConfigurations: Dict[str, Any] = sphinxApplication.config.vhdl_designs
+	if not designConfigurations:
+		return designs
+
+	prefetchBufferSize: int = sphinxApplication.config.vhdl_prefetch
+
+	for designName, value in designConfigurations.items():
+		if not isinstance(designName, str):
+			print(f"[VHDL][ERROR] '{designName}' is not a string.")
+
+		# Entries were validated at config-inited by ComputeConfigurationFingerprint.
+		configuration = GetDesignConfiguration(value, Path(sphinxApplication.confdir))
+		designs[designName] = LoadDesign(designName, configuration, prefetchBufferSize)
+
+	return designs
+
+
 @export
 class VHDLDomain(Domain):
 	name =  "vhdl"  #: The name of this domain
@@ -101,28 +505,59 @@ class VHDLDomain(Domain):
 	dependencies = [
 	]  #: A list of other extensions this domain depends on.
 
+	object_types = {
+		"design":        ObjType("design",        "design"),
+		"library":       ObjType("library",       "lib"),
+		"document":      ObjType("document",      "doc"),
+		"context":       ObjType("context",       "ctx"),
+		"entity":        ObjType("entity",        "ent"),
+		"architecture":  ObjType("architecture",  "arch"),
+		"component":     ObjType("component",     "comp"),
+		"package":       ObjType("package",       "pack"),
+		"packagebody":   ObjType("packagebody",   "packbody"),
+		"configuration": ObjType("configuration", "config"),
+		"type":          ObjType("type",          "type"),
+		"function":      ObjType("function",      "func"),
+		"procedure":     ObjType("procedure",     "proc"),
+		"constant":      ObjType("constant",      "const"),
+		"generic":       ObjType("generic",       "generic"),
+		"port":          ObjType("port",          "port"),
+		"parameter":     ObjType("parameter",     "param"),
+	}  #: A dictionary of all object types in this domain.
+
 	directives = {
 		"describedesign":        DescribeDesign,
-		# "describelibrary":       DescribeLibrary,
+		"designstats":           DescribeDesignStatistics,
+		"dependencies":          DescribeDependencies,
+		"describelibrary":       DescribeLibrary,
 		# "describedocument":      DescribeDocument,
 		# "describecontext":       DescribeContext,
 		"describeentity":        DescribeEntity,
 		# "describearchitecture":  DescribeArchitecture,
-		# "describepackage":       DescribePackage,
+		"describepackage":       DescribePackage,
 		# "describepackagebody":   DescribePackageBody,
 		# "describeconfiguration": DescribeConfiguration,
+		"symbolsearch":          SymbolSearch,
 	}  #: A dictionary of all directives in this domain.
 
 	roles = {
-		# "design":   DesignRole,
-		# "lib":      LibraryRole,
-		# "doc":      DocumentRole,
-		# "ctx":      ContextRole,
+		"design":   DesignRole(),
+		"lib":      LibraryRole(),
+		"doc":      DocumentRole(),
+		"ctx":      ContextRole(),
 		"ent":      EntityRole(),
-		# "arch":     ArchitectureRole,
-		# "pack":     PackageRole,
-		# "packbody": PackageBodyRole,
-		# "config":   ConfigurationRole,
+		"arch":     ArchitectureRole(),
+		"comp":     ComponentRole(),
+		"pack":     PackageRole(),
+		"packbody": PackageBodyRole(),
+		"config":   ConfigurationRole(),
+		"type":     TypeRole(),
+		"func":     FunctionRole(),
+		"proc":     ProcedureRole(),
+		"const":    ConstantRole(),
+		"generic":  GenericRole(),
+		"port":     PortRole(),
+		"param":    ParameterRole(),
 	}  #: A dictionary of all roles in this domain.
 
 	indices = {
@@ -135,24 +570,52 @@ class VHDLDomain(Domain):
 	}  #: A dictionary of all indices in this domain.
 
 	configValues: Dict[str, Tuple[Any, str, Any]] = {
-		"designs": ({}, "env", Dict),
-		"defaults": ({}, "env", Dict),
+		"designs": ({}, "", Dict),
+		"defaults": ({}, "", Dict),
+		"configuration_fingerprint": ("", "env", str),
+		"prefetch": (8, "", int),
+		"model_artifact": (None, "env", (str, Path)),
+		"source_pages": (True, "html", bool),
+		"stub_directory": (None, "env", (str, Path)),
+		"symbol_search": (True, "html", bool),
+		"inventories": ({}, "env", Dict),
+		"graphviz_dot": ("dot", "env", str),
 	}  #: A dictionary of all configuration values used by this domain.
 
+	data_version = 4  #: Version of the data structure stored in the environment.
+
 	initial_data = {
-		"designs": {}
+		"objects": ObjectTable(),
+		"diagrams": {},
+		"tracker": DocumentTracker(),
 	}  #: A dictionary of all global data fields used by this domain.
 
 	@property
 	def Designs(self) -> Dict[str, Design]:
-		return self.data["designs"]
+		"""Analyzed designs from the process-local design cache (they aren't part of the pickled environment)."""
+		return GetDesignCache(self.env.config).Get()
+
+	@property
+	def Catalogs(self) -> Dict[str, Union[Design, DesignView]]:
+		"""Lightweight views of all designs (memory-mapped catalog of a model artifact, if available) used by indices, stubs and outdated detection."""
+		return GetDesignCache(self.env.config).GetCatalogs()
+
+	@property
+	def Objects(self) -> ObjectTable:
+		return self.data["objects"]
+
+	@property
+	def Tracker(self) -> DocumentTracker:
+		return self.data["tracker"]
 
 	@staticmethod
 	def ReadDesigns(sphinxApplication: Sphinx) -> None:
 		"""
 		Call back for Sphinx ``builder-inited`` event.
 
-		This callback will read the configuration variable ``vhdl_designs`` and parse the found VHDL source files.
+		This callback will read the configuration variable ``vhdl_designs`` and parse the found VHDL source files. If
+		configuration variable ``vhdl_model_artifact`` is set, pre-analyzed designs are loaded from that model artifact
+		instead.
 
 		.. seealso::
 
@@ -165,64 +628,22 @@ class VHDLDomain(Domain):
 		print(f"Callback: builder-inited -> ReadDesigns")
 		print(f"[VHDL] Reading designs ...")
 
-		# Get modules to build documentation for
-		designConfigurations: Dict[str, Path] = sphinxApplication.config.vhdl_designs
-		print(designConfigurations)
-		if not designConfigurations:
-			return
+		designCache = GetDesignCache(sphinxApplication.config)
 
-		_packageFiles = (
-			("lib_Utilities", Path("Utilities.pkg.vhdl")),
-			("lib_Utilities", Path("Utilities.ctx.vhdl")),
-			("lib_StopWatch", Path("StopWatch.pkg.vhdl")),
-			("lib_StopWatch", Path("StopWatch.ctx.vhdl")),
-		)
-		_encoderFiles = _packageFiles + (
-			("lib_StopWatch", Path("seg7_Encoder.vhdl")),
-			("lib_StopWatch", Path("toplevel.Encoder.vhdl")),
-		)
-		_displayFiles = _packageFiles + (
-			("lib_StopWatch", Path("Counter.vhdl")),
-			("lib_StopWatch", Path("seg7_Encoder.vhdl")),
-			("lib_StopWatch", Path("seg7_Display.vhdl")),
-			("lib_StopWatch", Path("seg7_Display.cfg.vhdl")),
-			("lib_StopWatch", Path("toplevel.Display.vhdl")),
-		)
-		_stopwatchFiles = _packageFiles + (
-			("lib_Utilities", Path("Counter.vhdl")),
-			("lib_StopWatch", Path("seg7_Encoder.vhdl")),
-			("lib_StopWatch", Path("seg7_Display.vhdl")),
-			("lib_StopWatch", Path("seg7_Display.cfg.vhdl")),
-			("lib_StopWatch", Path("StopWatch.vhdl")),
-			("lib_Utilities", Path("sync_Bits.vhdl")),
-			("lib_Utilities", Path("Debouncer.vhdl")),
-			("lib_StopWatch", Path("toplevel.vhdl")),
-		)
-
-		vhdlDomain: Domain = sphinxApplication.env.domains[VHDLDomain.name]
-		designs: Dict[str, Design] = vhdlDomain.data["designs"]
-
-		for designName, designRoot in designConfigurations.items():
-			if not isinstance(designName, str):
-				print(f"[VHDL][ERROR] '{designName}' is not a string.")
-			if not isinstance(designRoot, Path):
-				print(f"[VHDL][ERROR] '{designRoot}' is not a Path.")
-			print(f"[VHDL]   Loading design '{designName}' ...")
-			if not designRoot.exists():
-				print(f"[VHDL][ERROR] Path '{designRoot}' does not exist.")
-			design = Design(designName, designRoot)
-			design.LoadDefaultLibraries()
-			for libraryName, file in _stopwatchFiles:
-				sourceFile = designRoot / file
-
-				print(f"[VHDL]     Parsing '{sourceFile}'")
-				document = Document(sourceFile)
-				design.AddDocument(document, design.GetLibrary(libraryName))
-
-			print(f"[VHDL]     Analyzing design '{designName}' ...")
-			design.Analyze()
-
-			designs[designName] = design
+		# Use pre-analyzed designs, if a model artifact is configured. It's read on first use; if it can't be read, the
+		# designs are parsed from VHDL sources instead.
+		artifactPath: Nullable[Path] = sphinxApplication.config.vhdl_model_artifact
+		if artifactPath is not None:
+			artifactPath = Path(sphinxApplication.confdir) / artifactPath
+			try:
+				CheckModelArtifact(artifactPath)
+			except ModelArtifactException as ex:
+				print(f"[VHDL][WARNING] {ex} Parsing VHDL sources instead.")
+			else:
+				designCache.SetArtifact(artifactPath, fallback=lambda: LoadDesigns(sphinxApplication))
+				return
+
+		designCache.SetDesigns(LoadDesigns(sphinxApplication))
 
 
 # 	@staticmethod
@@ -232,9 +653,35 @@ class VHDLDomain(Domain):
 # #		print(source)
 
 	callbacks = {
-		"builder-inited": ReadDesigns,
+		"config-inited":        (CompileDefaults, ComputeConfigurationFingerprint),
+		"builder-inited":       (ReadDesigns, GenerateStubs, AddSearchScript, LoadExternalInventories),
+		"env-get-outdated":     (GetOutdatedDocuments, ),
+		"env-before-read-docs": (LoadBeforeParallelRead, ),
+		"env-updated":          (RenderDiagrams, ),
+		"doctree-resolved":     (ResolveReferences, ResolveDiagrams),
+		"html-collect-pages":   (CollectSourcePages, WriteSymbolIndex),
 		# "source-read": ReadDesigns
-	}  #: A dictionary of all callbacks used by this domain.
+	}  #: A dictionary of all callbacks (in order of registration) used by this domain.
+
+	def clear_doc(self, docname: str) -> None:
+		self.Objects.ClearDocument(docname)
+		self.data["diagrams"].pop(docname, None)
+		self.Tracker.ClearDocument(docname)
+
+	def merge_domaindata(self, docnames: Set[str], otherdata: Dict) -> None:
+		self.Objects.MergeDocuments(otherdata["objects"], docnames)
+		self.Tracker.MergeDocuments(otherdata["tracker"], docnames)
+		for docname in docnames:
+			if docname in otherdata["diagrams"]:
+				self.data["diagrams"][docname] = otherdata["diagrams"][docname]
+
+	def get_objects(self) -> Iterable[Tuple[str, str, str, str, str, int]]:
+		"""
+		Returns all documented VHDL objects for the search index and ``objects.inv``.
+
+		Objects are added to a flat table by directives while reading, thus no design is walked here.
+		"""
+		return iter(self.Objects)
 
 	def resolve_xref(
 		self,
@@ -246,7 +693,19 @@ class VHDLDomain(Domain):
 		node: pending_xref,
 		contnode: nodes.Element
 	) -> Nullable[nodes.Element]:
-		raise NotImplementedError()
+		if typ == "source":
+			return make_refnode(builder, fromdocname, target, node["refid"], contnode)
+
+		# Fall back to objects documented in other projects
+		inventory = GetExternalInventory(env.config)
+		for objectType in self.objtypes_for_role(typ, []):
+			externalObject = inventory.Get(objectType, target)
+			if externalObject is not None:
+				reference = nodes.reference("", "", internal=False, refuri=externalObject.URI, reftitle=f"(in {externalObject.Project})")
+				reference.append(contnode)
+				return reference
+
+		return None
 
 
 @export
@@ -258,14 +717,17 @@ def setup(sphinxApplication: Sphinx):
 	:return:                  Dictionary containing the extension version and some properties.
 	"""
 	sphinxApplication.add_domain(VHDLDomain)
-	for eventName, callback in VHDLDomain.callbacks.items():
-		sphinxApplication.connect(eventName, callback)
+	sphinxApplication.add_node(pending_vhdl_xref)
+	sphinxApplication.add_node(pending_vhdl_diagram)
+	for eventName, callbacks in VHDLDomain.callbacks.items():
+		for callback in callbacks:
+			sphinxApplication.connect(eventName, callback)
 	for configName, (configDefault, configRebuilt, configTypes) in VHDLDomain.configValues.items():
 		sphinxApplication.add_config_value(f"{VHDLDomain.name}_{configName}", configDefault, configRebuilt, configTypes)
 
 	return {
 		"version": __version__,                          # version of the extension
 		"env_version": int(__version__.split(".")[0]),   # version of the data structure stored in the environment
-		'parallel_read_safe': False,                     # Not yet evaluated, thus false
+		'parallel_read_safe': True,                      # Designs are read-only and process-local; domain data is merged per document.
 		'parallel_write_safe': True,                     # Internal data structure is used read-only, thus no problems will occur by parallel writing.
 	}
@@ -0,0 +1,145 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A Sphinx domain providing VHDL language support.**
+
+Command line interface to pre-analyze VHDL designs outside of Sphinx.
+
+.. code-block:: bash
+
+   python -m VHDLDomain analyze --design IPCores=src --output IPCores.vhdlmodel \
+     --files "IPCores:lib_Common=common/*.vhdl" --files "IPCores:lib_IP=**/*.vhdl"
+"""
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from pathlib import Path
+from sys import exit as sys_exit
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from VHDLDomain import __version__, Design, GetDesignConfiguration, LoadDesign
+from VHDLDomain.Artifact import WriteModelArtifact
+from VHDLDomain.Catalog import WriteCatalog, CatalogPath
+
+
+def _ParseDesignArgument(argument: str) -> Tuple[str, Path]:
+	try:
+		designName, designRoot = argument.split("=", 1)
+	except ValueError:
+		raise ArgumentTypeError(f"Design '{argument}' has incorrect format, expected '<name>=<directory>'.")
+
+	return designName, Path(designRoot).resolve()
+
+
+def _ParseFilesArgument(argument: str) -> Tuple[str, str, str]:
+	try:
+		designName, files = argument.split(":", 1)
+		libraryName, pattern = files.split("=", 1)
+	except ValueError:
+		raise ArgumentTypeError(f"Files '{argument}' have incorrect format, expected '<design>:<library>=<pattern>'.")
+
+	return designName, libraryName, pattern
+
+
+def _CreateArgumentParser() -> ArgumentParser:
+	argumentParser = ArgumentParser(prog="python -m VHDLDomain", description="Pre-analyze VHDL designs for the Sphinx VHDL domain.")
+	argumentParser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+	commands = argumentParser.add_subparsers(dest="command", required=True)
+
+	analyzeCommand = commands.add_parser("analyze", help="Parse and analyze designs and write a model artifact.")
+	analyzeCommand.add_argument("-d", "--design", dest="designs", metavar="NAME=DIRECTORY", action="append", required=True, type=_ParseDesignArgument, help="Name and root directory of a design. Can be given multiple times.")
+	analyzeCommand.add_argument("-f", "--files", dest="files", metavar="DESIGN:LIBRARY=PATTERN", action="append", default=[], type=_ParseFilesArgument, help="Library and path or glob pattern (relative to the design's directory) of source files in compile order. Can be given multiple times. Without, all *.vhd and *.vhdl files are compiled into library 'work'.")
+	analyzeCommand.add_argument("-o", "--output", metavar="FILE", required=True, type=Path, help="Path to the model artifact to write.")
+	analyzeCommand.add_argument("--prefetch", metavar="FILES", default=8, type=int, help="Number of source files to read ahead while parsing (default: 8).")
+	analyzeCommand.add_argument("--strict", action="store_true", help="Exit with code 2, if a source file couldn't be read, parsed or analyzed.")
+
+	return argumentParser
+
+
+def Analyze(arguments: Namespace) -> int:
+	"""
+	Handler for command ``analyze``.
+
+	Parses and analyzes all designs like the VHDL domain does at ``builder-inited`` and writes the result as model
+	artifact, which can be loaded by the domain via configuration option ``vhdl_model_artifact``. Design roots and source
+	paths are stored relative to the artifact's directory. Broken source files are skipped and the artifact is written
+	anyway; with ``--strict``, the exit code signals the collected diagnostics.
+
+	:param arguments: Parsed command line arguments.
+	:returns:         Exit code.
+	"""
+	designConfigurations: List[Tuple[str, Path]] = arguments.designs
+
+	files: Dict[str, List[Tuple[str, str]]] = {}
+	for designName, libraryName, pattern in arguments.files:
+		files.setdefault(designName, []).append((libraryName, pattern))
+
+	unknownDesigns = set(files) - set(designName for designName, _ in designConfigurations)
+	if unknownDesigns:
+		print(f"[VHDL][ERROR] Files given for unknown design(s): {', '.join(sorted(unknownDesigns))}")
+		return 1
+
+	startTime = perf_counter()
+	designs: Dict[str, Design] = {}
+	for designName, designRoot in designConfigurations:
+		configuration = GetDesignConfiguration({"root": designRoot, "files": files[designName]} if designName in files else designRoot)
+		design = LoadDesign(designName, configuration, arguments.prefetch)
+		design.Relocate(arguments.output.parent)
+		designs[designName] = design
+
+	print(f"[VHDL] Writing model artifact '{arguments.output}' ...")
+	size = WriteModelArtifact(arguments.output, designs)
+	catalogPath = CatalogPath(arguments.output)
+	catalogSize = WriteCatalog(catalogPath, designs)
+	print(f"[VHDL] Wrote {size} bytes for {len(designs)} design(s) and a catalog of {catalogSize} bytes ('{catalogPath}') in {perf_counter() - startTime:.3f} s.")
+
+	diagnosticCount = sum(len(design.Diagnostics) for design in designs.values())
+	if diagnosticCount > 0:
+		print(f"[VHDL][WARNING] {diagnosticCount} diagnostic(s) were reported.")
+		if arguments.strict:
+			return 2
+
+	return 0
+
+
+def main() -> int:
+	argumentParser = _CreateArgumentParser()
+	arguments = argumentParser.parse_args()
+
+	if arguments.command == "analyze":
+		return Analyze(arguments)
+
+	argumentParser.print_help()
+	return 1
+
+
+if __name__ == "__main__":
+	sys_exit(main())
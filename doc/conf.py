@@ -288,7 +288,23 @@ autoapi_modules = {
 # AutoAPI.Sphinx
 # ==============================================================================
 vhdl_designs = {
-	"StopWatch": (Path.cwd() / "../examples/StopWatch").resolve(),
+	"StopWatch": {
+		"root": Path("../examples/StopWatch"),
+		"files": [
+			("lib_Utilities", "Utilities.pkg.vhdl"),
+			("lib_Utilities", "Utilities.ctx.vhdl"),
+			("lib_StopWatch", "StopWatch.pkg.vhdl"),
+			("lib_StopWatch", "StopWatch.ctx.vhdl"),
+			("lib_Utilities", "Counter.vhdl"),
+			("lib_StopWatch", "seg7_Encoder.vhdl"),
+			("lib_StopWatch", "seg7_Display.vhdl"),
+			("lib_StopWatch", "seg7_Display.cfg.vhdl"),
+			("lib_StopWatch", "StopWatch.vhdl"),
+			("lib_Utilities", "sync_Bits.vhdl"),
+			("lib_Utilities", "Debouncer.vhdl"),
+			("lib_StopWatch", "toplevel.vhdl"),
+		],
+	},
 }
 vhdl_defaults = {
 	"describedesign": {},
@@ -298,23 +314,23 @@ vhdl_defaults = {
 		"referencedby":  "yes",          # no, yes
 	},
 	"describeentity": {
-		"generics":      "table",        # never, table, sections
-		"ports":         "table",        # never, table, sections
+		"genericlist":   "table",        # never, table, sections, compact
+		"portlist":      "table",        # never, table, sections, compact
 		"architectures": "multiple",     # never, multiple, always
 		"referencedby":  "yes",          # no, yes
 	},
 	"describearchitecture": {},
 	"describepackage": {
-		"generics":      "table",        # never, table, sections
+		"genericlist":   "table",        # never, table, sections, compact
 		"referencedby":  "yes",          # no, yes
 	},
 	"describepackagebody": {},
 	"describeconfiguration": {
 		"referencedby":  "yes",          # no, yes
 	},
-	"describesubprogram": {
-		"parameters":    "table",        # never, table, sections
-	},
+	# "describesubprogram": {
+	# 	"parameters":    "table",        # never, table, sections, compact
+	# },
 }
 
 # for directory in [mod for mod in Path("../VHDLDomain").iterdir() if mod.is_dir() and mod.name != "__pycache__"]:
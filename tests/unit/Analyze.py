@@ -0,0 +1,85 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for analyzing a design with broken references."""
+from pathlib import Path
+from unittest import TestCase
+
+from pyVHDLModel import Document
+from pyVHDLModel.DesignUnit import Architecture, Entity, Package, UseClause
+from pyVHDLModel.Symbol import AllPackageMembersReferenceSymbol, EntitySymbol, LibraryReferenceSymbol, PackageReferenceSymbol
+
+from VHDLDomain import Design
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateDocument(path: str, *units) -> Document:
+	document = Document(Path("/src") / path)
+	for unit in units:
+		document._AddDesignUnit(unit)
+	return document
+
+
+def UseAll(libraryName: str, packageName: str) -> UseClause:
+	return UseClause([AllPackageMembersReferenceSymbol(PackageReferenceSymbol(packageName, LibraryReferenceSymbol(libraryName)))])
+
+
+class MissingPackage(TestCase):
+	def setUp(self):
+		self.design = Design("design", Path("/src"))
+		self.design.LoadStdLibrary()
+		library = self.design.GetLibrary("lib")
+
+		self.utilities = Package("utilities")
+		self.broken = Entity("broken", [UseAll("work", "missing")])
+		self.brokenArchitecture = Architecture("rtl", EntitySymbol("broken"))
+		self.counter = Entity("counter", [UseAll("work", "utilities")])
+		self.counterArchitecture = Architecture("rtl", EntitySymbol("counter"))
+
+		for path, units in (("utilities.vhdl", (self.utilities, )), ("broken.vhdl", (self.broken, self.brokenArchitecture)), ("counter.vhdl", (self.counter, self.counterArchitecture))):
+			self.design.AddDocument(CreateDocument(path, *units), library)
+
+		self.design.Analyze()
+
+	def test_Diagnostics(self):
+		self.assertEqual(["broken.vhdl"], [diagnostic.Path for diagnostic in self.design.Diagnostics])
+		self.assertIn("missing", next(iter(self.design.Diagnostics)).Message)
+
+	def test_OtherUnitsLinked(self):
+		self.assertIs(self.utilities, self.counter._referencedPackages["lib"]["utilities"])
+		self.assertIs(self.counter, self.counterArchitecture.Entity.Entity)
+		self.assertIs(self.broken, self.brokenArchitecture.Entity.Entity)
+		self.assertIn("std", self.brokenArchitecture._referencedLibraries)
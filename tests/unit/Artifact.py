@@ -0,0 +1,226 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for model artifacts and the process-local design cache."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from VHDLDomain.Artifact import CheckModelArtifact, DesignCache, LoadBeforeParallelRead, ModelArtifactException, ReadModelArtifact, WriteModelArtifact
+from VHDLDomain.Catalog import CatalogPath, WriteCatalog
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Search import SymbolIndexKey
+from VHDLDomain.Stub import GenerateStubs
+from VHDLDomain.Tracking import DocumentTracker, GetOutdatedDocuments, SourceHashTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateUnit(name: str, **items):
+	return SimpleNamespace(Identifier=name, NormalizedIdentifier=name.lower(), Documentation=None, **items)
+
+
+def CreateDesign(counterSource: str = "entity Counter is end entity;"):
+	hashes = SourceHashTable()
+	hashes.AddDocument("lib_Utilities", "Counter.vhdl", counterSource)
+
+	library = SimpleNamespace(
+		Identifier="lib_Utilities",
+		NormalizedIdentifier="lib_utilities",
+		Entities={"counter": CreateUnit("Counter", PortItems=[], GenericItems=[])},
+		Architectures={},
+		Packages={}
+	)
+	return SimpleNamespace(Libraries={"lib_utilities": library}, SourceLocations=SourceLocationTable(), SourceHashes=hashes, BaseDirectory=None)
+
+
+class FakeDomain:
+	def __init__(self, cache: DesignCache):
+		self._cache = cache
+		self.Tracker = DocumentTracker()
+
+	@property
+	def Designs(self):
+		return self._cache.Get()
+
+	@property
+	def Catalogs(self):
+		return self._cache.GetCatalogs()
+
+
+class ReadWrite(TestCase):
+	def setUp(self):
+		self.directory = TemporaryDirectory()
+		self.artifactPath = Path(self.directory.name) / "StopWatch.vhdlmodel"
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_RoundTrip(self):
+		design = CreateDesign()
+		design.SourceLocations.Add(SourceLocationKind.Entity, "lib_utilities.counter", "Counter.vhdl", 3, 1, 20)
+
+		size = WriteModelArtifact(self.artifactPath, {"StopWatch": design})
+		designs = ReadModelArtifact(self.artifactPath)
+
+		self.assertEqual(self.artifactPath.stat().st_size, size)
+		self.assertFalse(self.artifactPath.with_name(f"{self.artifactPath.name}.tmp").exists())
+		self.assertEqual(["StopWatch"], list(designs))
+
+		loaded = designs["StopWatch"]
+		self.assertEqual(["lib_utilities"], list(loaded.Libraries))
+		self.assertEqual("Counter", loaded.Libraries["lib_utilities"].Entities["counter"].Identifier)
+		self.assertEqual(design.SourceHashes.Design, loaded.SourceHashes.Design)
+		self.assertEqual(design.SourceLocations.Get(SourceLocationKind.Entity, "lib_utilities.counter"), loaded.SourceLocations.Get(SourceLocationKind.Entity, "lib_utilities.counter"))
+
+		CheckModelArtifact(self.artifactPath)
+
+	def test_NoArtifact(self):
+		self.artifactPath.write_bytes(b"something else")
+
+		with self.assertRaises(ModelArtifactException):
+			ReadModelArtifact(self.artifactPath)
+		with self.assertRaises(ModelArtifactException):
+			ReadModelArtifact(self.artifactPath.with_name("missing.vhdlmodel"))
+
+	def test_OtherVHDLDomainVersion(self):
+		with patch("VHDLDomain.__version__", "0.0.0"):
+			WriteModelArtifact(self.artifactPath, {"StopWatch": CreateDesign()})
+
+		with self.assertRaises(ModelArtifactException):
+			ReadModelArtifact(self.artifactPath)
+
+		parsedDesigns = {"StopWatch": CreateDesign("parsed")}
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath, fallback=lambda: parsedDesigns)
+		with patch("builtins.print") as printMock:
+			self.assertIs(parsedDesigns, cache.Get())
+
+		self.assertTrue(any("[VHDL][WARNING]" in str(call.args[0]) for call in printMock.call_args_list))
+
+
+class LazyLoading(TestCase):
+	def setUp(self):
+		self.directory = TemporaryDirectory()
+		self.root = Path(self.directory.name)
+		self.artifactPath = self.root / "StopWatch.vhdlmodel"
+
+		designs = {"StopWatch": CreateDesign()}
+		WriteModelArtifact(self.artifactPath, designs)
+		WriteCatalog(CatalogPath(self.artifactPath), designs)
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_BuildWithoutModelDependentDirectives(self):
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath)
+		domain = FakeDomain(cache)
+		domain.Tracker.Add("counter", ("file", "StopWatch", "Counter.vhdl"), CreateDesign().SourceHashes.GetFile("Counter.vhdl"))
+		domain.Tracker.Add("overview", ("design", "StopWatch"), CreateDesign("changed").SourceHashes.Design)
+
+		env = SimpleNamespace(domains={"vhdl": domain})
+		config = SimpleNamespace(vhdl_stub_directory="vhdl", vhdl_source_pages=True)
+		builder = SimpleNamespace(name="html", get_target_uri=lambda pageName: f"{pageName}.html")
+		application = SimpleNamespace(config=config, env=env, builder=builder, srcdir=str(self.root))
+
+		with patch("VHDLDomain.Artifact.ReadModelArtifact") as readModelArtifact:
+			self.assertEqual(["overview"], GetOutdatedDocuments(application, env, set(), set(), set()))
+			GenerateStubs(application)
+			SymbolIndexKey(application)
+
+			readModelArtifact.assert_not_called()
+			self.assertFalse(cache.IsLoaded)
+
+		self.assertTrue((self.root / "vhdl" / "lib_Utilities" / "Counter.rst").exists())
+
+
+class Fallback(TestCase):
+	def setUp(self):
+		self.directory = TemporaryDirectory()
+		self.artifactPath = Path(self.directory.name) / "StopWatch.vhdlmodel"
+		self.parsedDesigns = {"StopWatch": CreateDesign("parsed")}
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_TruncatedArtifact(self):
+		WriteModelArtifact(self.artifactPath, {"StopWatch": CreateDesign()})
+		content = self.artifactPath.read_bytes()
+		self.artifactPath.write_bytes(content[:len(content) // 2])
+
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath, fallback=lambda: self.parsedDesigns)
+		with patch("builtins.print") as printMock:
+			self.assertIs(self.parsedDesigns, cache.Get())
+
+		self.assertTrue(any("[VHDL][WARNING]" in str(call.args[0]) for call in printMock.call_args_list))
+
+	def test_TruncatedArtifactWithoutFallback(self):
+		WriteModelArtifact(self.artifactPath, {"StopWatch": CreateDesign()})
+		content = self.artifactPath.read_bytes()
+		self.artifactPath.write_bytes(content[:len(content) // 2])
+
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath)
+		with patch("builtins.print"), self.assertRaises(ModelArtifactException):
+			cache.Get()
+
+	def test_OtherPyVHDLModelVersion(self):
+		with patch("VHDLDomain.Artifact._PackageVersion", side_effect=lambda packageName: "0.0.1"):
+			WriteModelArtifact(self.artifactPath, {"StopWatch": CreateDesign()})
+
+		with self.assertRaises(ModelArtifactException) as context:
+			CheckModelArtifact(self.artifactPath)
+		self.assertIn("0.0.1", str(context.exception))
+
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath, fallback=lambda: self.parsedDesigns)
+		with patch("builtins.print"):
+			self.assertIs(self.parsedDesigns, cache.Get())
+
+	def test_LoadBeforeParallelRead(self):
+		WriteModelArtifact(self.artifactPath, {"StopWatch": CreateDesign()})
+		cache = DesignCache()
+		cache.SetArtifact(self.artifactPath)
+
+		with patch("VHDLDomain.Artifact.GetDesignCache", return_value=cache), patch("builtins.print"):
+			LoadBeforeParallelRead(SimpleNamespace(config=None, parallel=1), None, ["index"])
+			self.assertFalse(cache.IsLoaded)
+
+			LoadBeforeParallelRead(SimpleNamespace(config=None, parallel=4), None, ["index"])
+			self.assertTrue(cache.IsLoaded)
@@ -0,0 +1,126 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the binary design catalog."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+
+from pyVHDLModel.Name import SimpleName
+
+from VHDLDomain.Catalog import Catalog, CatalogException, UnitKind, WriteCatalog
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Tracking import SourceHashTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateUnit(name: str, documentation: str = None, **items):
+	return SimpleNamespace(Identifier=name, NormalizedIdentifier=name.lower(), Documentation=documentation, **items)
+
+
+def CreateDesign():
+	ports = [
+		SimpleNamespace(Identifiers=("Clock", "Reset"), Mode="in", Subtype=SimpleName("std_logic"), DefaultExpression=None),
+		SimpleNamespace(Identifiers=("Value", ), Mode="out", Subtype=SimpleName("unsigned"), DefaultExpression=None),
+	]
+	generics = [SimpleNamespace(Identifiers=("BITS", ), Subtype=SimpleName("positive"), DefaultExpression=None)]
+	counter = CreateUnit("Counter", "A modulo counter.", PortItems=ports, GenericItems=generics)
+
+	locations = SourceLocationTable()
+	locations.Add(SourceLocationKind.Entity, "lib_utilities.counter", "Counter.vhdl", 4, 1, 20)
+
+	library = SimpleNamespace(
+		Identifier="lib_Utilities",
+		NormalizedIdentifier="lib_utilities",
+		Entities={"counter": counter},
+		Architectures={"counter": {"rtl": CreateUnit("rtl"), "sim": CreateUnit("sim")}},
+		Packages={"utilities": CreateUnit("Utilities", GenericItems=[])}
+	)
+	hashes = SourceHashTable()
+	hashes.AddDocument("lib_Utilities", "Counter.vhdl", "entity Counter is end entity;")
+	hashes.AddDocument("lib_Utilities", "Utilities.pkg.vhdl", "package Utilities is end package;")
+
+	return SimpleNamespace(Libraries={"lib_utilities": library}, SourceLocations=locations, SourceHashes=hashes, BaseDirectory=Path("src"))
+
+
+class Views(TestCase):
+	def setUp(self):
+		self.directory = TemporaryDirectory()
+		path = Path(self.directory.name) / "StopWatch.vhdlmodel.catalog"
+		WriteCatalog(path, {"StopWatch": CreateDesign()})
+		self.catalog = Catalog(path)
+
+	def tearDown(self):
+		self.catalog.Close()
+		self.directory.cleanup()
+
+	def test_Units(self):
+		library = self.catalog.Designs["StopWatch"].Libraries["lib_utilities"]
+		self.assertEqual("lib_Utilities", library.Identifier)
+		self.assertEqual(["counter"], list(library.Entities))
+		self.assertEqual(["utilities"], list(library.Packages))
+
+		counter = library.Entities["counter"]
+		self.assertIs(UnitKind.Entity, counter.Kind)
+		self.assertEqual("A modulo counter.", counter.Documentation)
+		self.assertEqual(("Counter.vhdl", 4), (counter.Document, counter.Line))
+		self.assertEqual(["rtl", "sim"], list(counter.Architectures))
+		self.assertEqual("lib_Utilities", counter.Architectures["sim"].Library.Identifier)
+		self.assertEqual("", library.Packages["utilities"].Documentation)
+
+	def test_SourceHashes(self):
+		design = self.catalog.Designs["StopWatch"]
+		expected = CreateDesign().SourceHashes
+
+		self.assertEqual(Path("src"), design.BaseDirectory)
+		self.assertEqual(list(expected.IterateFiles()), list(design.SourceHashes.IterateFiles()))
+		self.assertEqual(expected.Design, design.SourceHashes.Design)
+		self.assertEqual(expected.GetLibrary("lib_Utilities"), design.SourceHashes.GetLibrary("lib_Utilities"))
+
+	def test_InterfaceItems(self):
+		counter = self.catalog.Designs["StopWatch"].Libraries["lib_utilities"].Entities["counter"]
+		self.assertEqual([("Clock", "in", "std_logic"), ("Reset", "in", "std_logic"), ("Value", "out", "unsigned")], [(port.Identifier, port.Mode, port.Subtype) for port in counter.PortItems])
+		self.assertEqual([("BITS", "positive", "")], [(generic.Identifier, generic.Subtype, generic.DefaultExpression) for generic in counter.GenericItems])
+
+
+class Format(TestCase):
+	def test_NoCatalog(self):
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / "other.bin"
+			path.write_bytes(b"VHDLDomain-Model\0" + bytes(100))
+			with self.assertRaises(CatalogException):
+				Catalog(path)
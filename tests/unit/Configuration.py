@@ -0,0 +1,87 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for design configurations."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from VHDLDomain import DesignConfiguration, GetDesignConfiguration, GetDesignFiles
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Configuration(TestCase):
+	def test_RootOnly(self):
+		configuration = GetDesignConfiguration(Path("src"), Path("/doc"))
+
+		self.assertEqual(Path("/doc/src"), configuration.Root)
+		self.assertEqual({"work"}, {libraryName for libraryName, _ in configuration.Files})
+
+	def test_AbsoluteRoot(self):
+		self.assertEqual(Path("/design"), GetDesignConfiguration("/design", Path("/doc")).Root)
+
+	def test_Files(self):
+		configuration = GetDesignConfiguration({"root": "src", "files": [("lib", "a.vhdl"), ("lib", Path("sub/*.vhdl"))]})
+
+		self.assertEqual(DesignConfiguration(Path("src"), (("lib", "a.vhdl"), ("lib", "sub/*.vhdl"))), configuration)
+
+	def test_Invalid(self):
+		with self.assertRaises(ValueError):
+			GetDesignConfiguration({"files": []})
+		with self.assertRaises(ValueError):
+			GetDesignConfiguration({"root": "src", "files": ["a.vhdl"]})
+		with self.assertRaises(ValueError):
+			GetDesignConfiguration(42)
+
+
+class Files(TestCase):
+	def test_CompileOrder(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			(root / "sub").mkdir()
+			for name in ("pkg.vhdl", "sub/b.vhdl", "sub/a.vhdl", "sub/c.vhd"):
+				(root / name).write_text("", encoding="utf-8")
+
+			configuration = GetDesignConfiguration({"root": root, "files": [("lib_A", "pkg.vhdl"), ("lib_B", "sub/*.vhd*"), ("lib_C", "**/*.vhdl"), ("lib_D", "missing.vhdl")]})
+			files = [(libraryName, path.relative_to(root).as_posix()) for libraryName, path in GetDesignFiles(configuration)]
+
+		self.assertEqual([
+			("lib_A", "pkg.vhdl"),
+			("lib_B", "sub/a.vhdl"),
+			("lib_B", "sub/b.vhdl"),
+			("lib_B", "sub/c.vhd"),
+			("lib_D", "missing.vhdl"),
+		], files)
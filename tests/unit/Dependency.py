@@ -0,0 +1,75 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for dependency closures."""
+from unittest import TestCase
+
+from VHDLDomain.Dependency import DependencyClosure
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Closure(TestCase):
+	def setUp(self):
+		self.closure = DependencyClosure()
+		for name, kind in (("ieee", "Library"), ("ieee.std_logic_1164", "Package"), ("lib", "Library"), ("lib.utilities", "Package"),
+		                   ("lib.counter", "Entity"), ("lib.counter(rtl)", "Architecture"), ("lib.toplevel", "Entity"), ("lib.toplevel(rtl)", "Architecture")):
+			self.closure.Add(name, name, kind)
+
+		for name, dependency in (("lib.utilities", "ieee.std_logic_1164"), ("lib.counter", "lib.utilities"), ("lib.counter(rtl)", "lib.counter"),
+		                         ("lib.toplevel", "ieee.std_logic_1164"), ("lib.toplevel(rtl)", "lib.toplevel"), ("lib.toplevel(rtl)", "lib.counter")):
+			self.closure.AddDependency(name, dependency)
+
+		self.closure.Compute()
+
+	def test_Dependencies(self):
+		self.assertEqual(["lib.counter", "lib.toplevel", "lib.utilities"], [entry.Name for entry in self.closure.Dependencies("lib.TopLevel(rtl)")])
+		self.assertEqual(4, len(self.closure.Dependencies("lib.toplevel(rtl)", predefined=True)))
+		self.assertTrue(self.closure.DependsOn("lib.toplevel(rtl)", "ieee.std_logic_1164"))
+		self.assertFalse(self.closure.DependsOn("lib.counter", "lib.toplevel"))
+
+	def test_Dependents(self):
+		self.assertEqual(["lib.counter", "lib.counter(rtl)", "lib.toplevel(rtl)"], [entry.Name for entry in self.closure.Dependents("lib.utilities")])
+
+	def test_Depth(self):
+		entries = self.closure.Dependencies("lib.toplevel(rtl)", depth=2)
+		self.assertEqual([("lib.counter", 1), ("lib.toplevel", 1), ("lib.utilities", 2)], [(entry.Name, entry.Depth) for entry in entries])
+
+	def test_Cycle(self):
+		self.closure.AddDependency("lib.counter", "lib.counter(rtl)")
+		self.closure.Compute()
+
+		self.assertTrue(self.closure.DependsOn("lib.counter(rtl)", "lib.counter(rtl)"))
+		self.assertEqual(["lib.counter", "lib.counter(rtl)", "lib.utilities"], [entry.Name for entry in self.closure.Dependencies("lib.counter")])
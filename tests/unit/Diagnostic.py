@@ -0,0 +1,88 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for collected diagnostics."""
+from unittest import TestCase
+
+from VHDLDomain.Diagnostic import Diagnostic, DiagnosticCollection, CreateDiagnostics
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class LibGHDLException(Exception):
+	def __init__(self, message: str, errors: list):
+		super().__init__(message)
+		self.InternalErrors = errors
+
+
+class Conversion(TestCase):
+	def test_InternalErrors(self):
+		try:
+			try:
+				raise LibGHDLException("libghdl: Internal error 2.", [":12:5: ';' expected", ":20:1: missing 'end'"])
+			except LibGHDLException as ex:
+				raise ValueError("Error in libghdl.") from ex
+		except ValueError as ex:
+			diagnostics = CreateDiagnostics("src/Counter.vhdl", "parse", ex)
+
+		self.assertEqual([
+			Diagnostic("src/Counter.vhdl", 12, 5, "parse", "';' expected"),
+			Diagnostic("src/Counter.vhdl", 20, 1, "parse", "missing 'end'"),
+		], diagnostics)
+		self.assertEqual("src/Counter.vhdl:12:5: parse error: ';' expected", str(diagnostics[0]))
+
+	def test_LineNumber(self):
+		diagnostics = CreateDiagnostics("a.vhdl", "parse", SyntaxError("invalid syntax", ("a.vhdl", 7, 3, "")))
+
+		self.assertEqual([Diagnostic("a.vhdl", 7, 3, "parse", "invalid syntax (a.vhdl, line 7)")], diagnostics)
+
+	def test_WithoutPosition(self):
+		diagnostics = CreateDiagnostics("a.vhdl", "read", FileNotFoundError("No such file"))
+
+		self.assertEqual([Diagnostic("a.vhdl", 0, 0, "read", "No such file")], diagnostics)
+		self.assertEqual("a.vhdl: read error: No such file", str(diagnostics[0]))
+
+
+class Collection(TestCase):
+	def test_Files(self):
+		collection = DiagnosticCollection()
+		collection.Add("a.vhdl", "parse", ValueError(":1:1: bad"))
+		collection.Add("b.vhdl", "read", OSError("unreadable"))
+		collection.Add("a.vhdl", "parse", ValueError(":9:2: worse"))
+
+		self.assertEqual(3, len(collection))
+		files = collection.Files
+		self.assertEqual(["a.vhdl", "b.vhdl"], list(files))
+		self.assertEqual([1, 9], [diagnostic.Line for diagnostic in files["a.vhdl"]])
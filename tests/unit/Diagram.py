@@ -0,0 +1,126 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for block diagrams."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyVHDLModel.Name import OpenName, SimpleName
+
+from VHDLDomain.Diagram import CreateInstanceDiagram, DiagramCache, DiagramHash, RenderDiagrams
+from VHDLDomain.Format import ModelFormatter
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateInstance(label: str, entity: str, *actuals):
+	return SimpleNamespace(
+		Label=label,
+		Entity=SimpleName(entity),
+		PortAssociations=[SimpleNamespace(Actual=actual) for actual in actuals]
+	)
+
+
+def CreateArchitecture(*instances):
+	return SimpleNamespace(IterateInstantiations=lambda: iter(instances))
+
+
+class Instances(TestCase):
+	def test_NoInstances(self):
+		self.assertIsNone(CreateInstanceDiagram(CreateArchitecture(), [], ModelFormatter()))
+
+	def test_Connections(self):
+		architecture = CreateArchitecture(
+			CreateInstance("cnt", "Counter", SimpleName("Clock"), SimpleName("Tick"), OpenName()),
+			CreateInstance("deb", "Debouncer", SimpleName("clock"), SimpleName("tick")),
+		)
+
+		source = CreateInstanceDiagram(architecture, ["Clock"], ModelFormatter())
+		self.assertIn('i0 [label="cnt\\nCounter"];', source)
+		self.assertIn('i1 [label="deb\\nDebouncer"];', source)
+		self.assertIn("p_clock -> i0;", source)
+		self.assertIn("p_clock -> i1;", source)
+		self.assertIn('i0 -> i1 [label="Tick"];', source)
+		self.assertNotIn("open", source)
+
+
+class Cache(TestCase):
+	def test_Hash(self):
+		self.assertEqual(DiagramHash("digraph {}", "dot"), DiagramHash("digraph {}", "dot"))
+		self.assertNotEqual(DiagramHash("digraph {}", "dot"), DiagramHash("digraph {}", "/opt/bin/dot"))
+
+	def test_WriteGet(self):
+		with TemporaryDirectory() as directory:
+			cache = DiagramCache(Path(directory) / "diagrams")
+			hash = DiagramHash("digraph {}", "dot")
+			self.assertNotIn(hash, cache)
+			self.assertIsNone(cache.Get(hash))
+
+			cache.Write(hash, b"<svg/>")
+			self.assertIn(hash, cache)
+			self.assertEqual("<svg/>", cache.Get(hash))
+
+
+def CreateApplication(root: Path, command: str = "dot") -> SimpleNamespace:
+	return SimpleNamespace(doctreedir=str(root), parallel=1, config=SimpleNamespace(vhdl_graphviz_dot=command))
+
+
+def CreateEnvironment(*sources: str) -> SimpleNamespace:
+	diagrams = {DiagramHash(source, "dot"): source for source in sources}
+	return SimpleNamespace(domains={"vhdl": SimpleNamespace(data={"diagrams": {"index": diagrams}})})
+
+
+class Render(TestCase):
+	def test_RenderMissing(self):
+		with TemporaryDirectory() as directory:
+			environment = CreateEnvironment("digraph { a }", "digraph { b }")
+			with patch("VHDLDomain.Diagram._Render", return_value=b"<svg/>") as render:
+				RenderDiagrams(CreateApplication(Path(directory)), environment)
+				RenderDiagrams(CreateApplication(Path(directory)), environment)
+
+			self.assertEqual(2, render.call_count)
+			cache = DiagramCache(Path(directory) / "vhdl-diagrams")
+			self.assertEqual("<svg/>", cache.Get(DiagramHash("digraph { b }", "dot")))
+
+	def test_FailureIsASphinxWarning(self):
+		with TemporaryDirectory() as directory:
+			with self.assertLogs("sphinx.VHDLDomain.Diagram", level="WARNING") as logs:
+				RenderDiagrams(CreateApplication(Path(directory), str(Path(directory) / "missing-dot")), CreateEnvironment("digraph { a }"))
+
+			self.assertIn("Can't render diagram", logs.output[0])
+			self.assertNotIn(DiagramHash("digraph { a }", "dot"), DiagramCache(Path(directory) / "vhdl-diagrams"))
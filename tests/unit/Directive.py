@@ -0,0 +1,147 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for nodes created by directives."""
+from pathlib import PurePosixPath
+from types import SimpleNamespace
+from unittest import TestCase
+
+from docutils import nodes
+from sphinx.addnodes import only, pending_xref
+
+from VHDLDomain.Directive import BaseDirective, DescribeDesign
+from VHDLDomain.Inventory import ObjectTable
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Option import DesignOptions
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateDirective(directiveClass, builderName: str = "html", builderFormat: str = "html", sourcePages: bool = True):
+	config = SimpleNamespace(vhdl_source_pages=sourcePages)
+	application = SimpleNamespace(config=config, builder=SimpleNamespace(name=builderName, format=builderFormat))
+	env = SimpleNamespace(app=application, config=config, docname="index", domains={"vhdl": SimpleNamespace(Objects=ObjectTable())})
+
+	# Directives access the environment via their state's document settings.
+	directive = directiveClass.__new__(directiveClass)
+	directive.state = SimpleNamespace(document=SimpleNamespace(settings=SimpleNamespace(env=env)))
+	return directive
+
+
+class SourceLink(TestCase):
+	def setUp(self):
+		self.locations = SourceLocationTable()
+		self.locations.Add(SourceLocationKind.Entity, "lib.counter", "src/Counter.vhdl", 3, 1, 20)
+
+	def test_HTML(self):
+		link = CreateDirective(BaseDirective).CreateSourceLink("StopWatch", self.locations, SourceLocationKind.Entity, "lib.counter")
+
+		self.assertIsInstance(link, only)
+		self.assertEqual("html", link["expr"])
+
+		references = list(link.findall(pending_xref))
+		self.assertEqual(1, len(references))
+		self.assertEqual("source", references[0]["reftype"])
+		self.assertEqual("_vhdl/source/StopWatch/src/Counter.vhdl", references[0]["reftarget"])
+		self.assertEqual("entity-lib.counter", references[0]["refid"])
+		self.assertEqual("index", references[0]["refdoc"])
+
+	def test_BuildersWithoutSourcePages(self):
+		for builderName, builderFormat in (("latex", "latex"), ("singlehtml", "html"), ("epub", "html")):
+			with self.subTest(builder=builderName):
+				directive = CreateDirective(BaseDirective, builderName, builderFormat)
+				self.assertIsNone(directive.CreateSourceLink("StopWatch", self.locations, SourceLocationKind.Entity, "lib.counter"))
+
+	def test_Disabled(self):
+		directive = CreateDirective(BaseDirective, sourcePages=False)
+
+		self.assertIsNone(directive.CreateSourceLink("StopWatch", self.locations, SourceLocationKind.Entity, "lib.counter"))
+
+	def test_UnknownLocation(self):
+		directive = CreateDirective(BaseDirective)
+
+		self.assertIsNone(directive.CreateSourceLink("StopWatch", self.locations, SourceLocationKind.Entity, "lib.unknown"))
+
+
+class DocumentItem(TestCase):
+	def setUp(self):
+		self.document = SimpleNamespace(
+			ShortPath=PurePosixPath("src/Counter.vhdl"),
+			DesignUnits=[SimpleNamespace(Identifier="Counter")],
+			Documentation="A generic counter."
+		)
+
+	def test_HTML(self):
+		directive = CreateDirective(DescribeDesign)
+		item = directive.CreateDocumentItem("StopWatch", self.document, DesignOptions())
+
+		onlyNodes = list(item.findall(only))
+		self.assertEqual(["html", "not html"], [node["expr"] for node in onlyNodes])
+
+		references = list(onlyNodes[0].findall(pending_xref))
+		self.assertEqual(1, len(references))
+		self.assertEqual("_vhdl/source/StopWatch/src/Counter.vhdl", references[0]["reftarget"])
+		self.assertEqual([], list(onlyNodes[1].findall(pending_xref)))
+		self.assertIn("Counter", onlyNodes[1].astext())
+
+		self.assertIsNotNone(directive.env.domains["vhdl"].Objects.Get("document", "StopWatch.src/Counter.vhdl"))
+
+	def test_BuildersWithoutSourcePages(self):
+		for builderName, builderFormat in (("latex", "latex"), ("singlehtml", "html")):
+			with self.subTest(builder=builderName):
+				item = CreateDirective(DescribeDesign, builderName, builderFormat).CreateDocumentItem("StopWatch", self.document, DesignOptions())
+
+				self.assertEqual([], list(item.findall(pending_xref)))
+				self.assertEqual([], list(item.findall(only)))
+				self.assertIn("src/Counter.vhdl", item[0].astext())
+				self.assertIsInstance(item[-1], nodes.paragraph)
+				self.assertEqual("A generic counter.", item[-1].astext())
+
+
+class CompactTable(TestCase):
+	def test_NonHTMLFallback(self):
+		directive = CreateDirective(BaseDirective)
+		ports = [SimpleNamespace(Identifier=f"axi_{index}", NormalizedIdentifier=f"axi_{index}") for index in range(600)]
+		ports.append(SimpleNamespace(Identifier="Clock", NormalizedIdentifier="clock"))
+
+		htmlNode, fallbackNode = directive._CreateCompactTable("lib.counter", "counter", "port", ports, ("Port Name", "Type"), lambda port: (port.Identifier, "std_logic"))
+
+		self.assertEqual("html", htmlNode["expr"])
+		self.assertEqual("not html", fallbackNode["expr"])
+		self.assertEqual(2, len(fallbackNode.children))
+		self.assertTrue(all(isinstance(child, nodes.paragraph) for child in fallbackNode.children))
+		self.assertIn("counter-port-axi_599", fallbackNode[0]["ids"])
+		self.assertEqual(["counter-port-clock"], fallbackNode[1]["ids"])
+		self.assertEqual(601, len(directive.env.domains["vhdl"].Objects))
@@ -0,0 +1,101 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the expression and subtype formatter."""
+from unittest import TestCase
+
+from pyVHDLModel.Expression import IntegerLiteral, AdditionExpression, SubtractionExpression, SubExpression, MultiplyExpression
+from pyVHDLModel.Expression import Aggregate, OthersAggregateElement, CharacterLiteral, QualifiedExpression, StringLiteral, BitStringLiteral
+from pyVHDLModel.Name import SelectedName, SimpleName
+from pyVHDLModel.Symbol import SimpleSubtypeSymbol, SimpleObjectOrFunctionCallSymbol
+
+from VHDLDomain.Format import ModelFormatter
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Formatter(TestCase):
+	def test_Expression(self):
+		bits = SimpleObjectOrFunctionCallSymbol("DATA_BITS")
+		expression = MultiplyExpression(SubExpression(SubtractionExpression(bits, IntegerLiteral(1))), IntegerLiteral(2))
+
+		self.assertEqual("(DATA_BITS - 1) * 2", ModelFormatter().Format(expression))
+
+	def test_Aggregate(self):
+		formatter = ModelFormatter()
+
+		self.assertEqual("(others => '0')", formatter.Format(Aggregate([OthersAggregateElement(CharacterLiteral("'0'"))])))
+		self.assertEqual("T_SLV'(others => '1')", formatter.Format(QualifiedExpression(SimpleSubtypeSymbol("T_SLV"), Aggregate([OthersAggregateElement(CharacterLiteral("'1'"))]))))
+		self.assertEqual("\"1010\"", formatter.Format(StringLiteral("1010")))
+
+	def test_StringLiteral(self):
+		formatter = ModelFormatter()
+
+		for value in ("", "Hello", "say \"hi\"", "\"\""):
+			with self.subTest(value=value):
+				text = formatter.Format(StringLiteral(value))
+
+				self.assertTrue(text.startswith("\"") and text.endswith("\""))
+				self.assertEqual(value, text[1:-1].replace("\"\"", "\""))
+		self.assertEqual("\"say \"\"hi\"\"\"", formatter.Format(StringLiteral("say \"hi\"")))
+
+	def test_BitStringLiteral(self):
+		formatter = ModelFormatter()
+		literal = BitStringLiteral("FF")
+		literal.Base = "x"
+
+		self.assertEqual("x\"FF\"", formatter.Format(literal))
+		self.assertEqual("\"1010\"", formatter.Format(BitStringLiteral("1010")))
+
+		text = formatter.Format(literal)
+		base, value = text[:-1].split("\"", 1)
+		self.assertEqual((literal.Base, literal.Value), (base, value))
+
+	def test_SubtypeIndication(self):
+		formatter = ModelFormatter()
+
+		self.assertEqual("std_logic", formatter.Format(SimpleSubtypeSymbol("std_logic")))
+		self.assertEqual("ieee.numeric_std.unsigned", formatter.Format(SelectedName("unsigned", SelectedName("numeric_std", SimpleName("ieee")))))
+		self.assertEqual("", formatter.Format(None))
+
+	def test_Memoization(self):
+		formatter = ModelFormatter()
+		shared = AdditionExpression(SimpleObjectOrFunctionCallSymbol("WIDTH"), IntegerLiteral(1))
+
+		self.assertEqual("WIDTH + 1", formatter.Format(shared))
+		misses = formatter.Misses
+		self.assertEqual("WIDTH + 1", formatter.Format(shared))
+		self.assertEqual(misses, formatter.Misses)
+		self.assertEqual(1, formatter.Hits)
@@ -0,0 +1,83 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for interned identifiers."""
+from types import SimpleNamespace
+from unittest import TestCase
+
+from VHDLDomain.Identifier import DesignUnitTable, IdentifierTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Identifiers(TestCase):
+	def test_Intern(self):
+		table = IdentifierTable()
+		id = table.Intern("Counter")
+		self.assertEqual(id, table.Intern("counter"))
+		self.assertEqual(id, table.Lookup("COUNTER"))
+		self.assertEqual("counter", table.Name(id))
+		self.assertEqual(1, len(table))
+		self.assertIsNone(table.Lookup("Debouncer"))
+
+	def test_LookupDoesntAddAliases(self):
+		table = IdentifierTable()
+		table.Intern("Counter")
+		aliases = len(table._ids)
+		table.Lookup("COUNTER")
+		table.LookupQualified("COUNTER.cOUNTER")
+		self.assertEqual(aliases, len(table._ids))
+
+	def test_Qualified(self):
+		table = IdentifierTable()
+		ids = table.InternQualified("lib_Utilities.Utilities_pkg.to_slv")
+		self.assertEqual(ids, table.LookupQualified("LIB_UTILITIES.utilities_pkg.TO_SLV"))
+		self.assertIsNone(table.LookupQualified("lib_Utilities.other_pkg.to_slv"))
+
+
+class Units(TestCase):
+	def test_Lookup(self):
+		counter = SimpleNamespace(Identifier="Counter")
+		package = SimpleNamespace(Identifier="Utilities")
+		library = SimpleNamespace(Identifier="lib_Utilities", Entities={"counter": counter}, Packages={"utilities": package}, Contexts={}, Configurations={})
+
+		units = DesignUnitTable(IdentifierTable())
+		units.AddDesign(SimpleNamespace(Libraries={"lib_utilities": library}))
+
+		self.assertIs(library, units.GetLibrary("LIB_Utilities"))
+		self.assertIs(counter, units.GetUnit("lib_utilities", "COUNTER"))
+		self.assertIs(package, units.GetUnit("lib_Utilities", "Utilities"))
+		self.assertIsNone(units.GetUnit("lib_Utilities", "Debouncer"))
+		self.assertIsNone(units.GetLibrary("lib_StopWatch"))
@@ -0,0 +1,152 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the object table and inventories."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from zlib import compress
+
+from VHDLDomain.Inventory import ObjectTable, ObjectEntry, ExternalInventory, LoadExternalInventories
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Objects(TestCase):
+	def test_AddAndIterate(self):
+		table = ObjectTable()
+		table.Add("lib.counter", "lib.Counter", "entity", "lib/Counter", "counter")
+		table.Add("lib.counter.clock", "Clock", "port", "lib/Counter", "counter-port-clock", priority=2)
+
+		self.assertEqual(2, len(table))
+		self.assertEqual(
+			[
+				ObjectEntry("lib.counter", "lib.Counter", "entity", "lib/Counter", "counter", 1),
+				ObjectEntry("lib.counter.clock", "Clock", "port", "lib/Counter", "counter-port-clock", 2),
+			],
+			list(table)
+		)
+
+	def test_ClearAndMerge(self):
+		table = ObjectTable()
+		table.Add("lib.counter", "lib.Counter", "entity", "lib/Counter", "counter")
+		table.Add("lib.utilities", "lib.Utilities", "package", "lib/Utilities", "utilities")
+
+		other = ObjectTable()
+		other.Add("lib.debouncer", "lib.Debouncer", "entity", "lib/Debouncer", "debouncer")
+		other.Add("lib.ignored", "lib.Ignored", "entity", "lib/Ignored", "ignored")
+
+		table.ClearDocument("lib/Counter")
+		table.MergeDocuments(other, {"lib/Debouncer"})
+
+		self.assertEqual(["lib.utilities", "lib.debouncer"], [entry.Name for entry in table])
+
+	def test_Lookup(self):
+		table = ObjectTable()
+		table.Add("lib", "lib", "library", "lib", "lib")
+		table.Add("lib.counter", "lib.Counter", "entity", "lib/Counter", "counter")
+		table.Add("other.counter", "other.Counter", "entity", "other/Counter", "counter")
+
+		self.assertEqual("lib/Counter", table.Get("entity", "LIB.Counter").DocName)
+		self.assertIsNone(table.Get("package", "lib.counter"))
+		self.assertEqual({("library", "lib"), ("entity", "lib.counter")}, set(table.GetLibrary("lib")))
+
+		table.ClearDocument("lib/Counter")
+		self.assertIsNone(table.Get("entity", "lib.counter"))
+		self.assertEqual("other/Counter", table.Get("entity", "other.counter").DocName)
+
+
+def CreateInventory(project: str, lines: str) -> bytes:
+	header = f"# Sphinx inventory version 2\n# Project: {project}\n# Version: 1.0\n# The remainder of this file is compressed using zlib.\n"
+	return header.encode("utf-8") + compress(lines.encode("utf-8"))
+
+
+class External(TestCase):
+	def test_Parse(self):
+		content = CreateInventory("IPCores", (
+			"lib_IPCores.UART vhdl:entity 1 lib_IPCores/UART.html#$ lib_IPCores.UART\n"
+			"lib_IPCores.UART.TX vhdl:port 2 lib_IPCores/UART.html#uart-port-tx TX\n"
+			"UART std:label -1 index.html#uart UART\n"
+		))
+
+		objects = ExternalInventory.Parse(content, "https://ipcores.example.org")
+
+		self.assertEqual(2, len(objects))
+		self.assertEqual("https://ipcores.example.org/lib_IPCores/UART.html#lib_IPCores.UART", objects[("entity", "lib_ipcores.uart")].URI)
+		self.assertEqual("IPCores", objects[("port", "lib_ipcores.uart.tx")].Project)
+
+	def test_LoadCachedAndFirstWins(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			(root / "first.inv").write_bytes(CreateInventory("First", "lib.Counter vhdl:entity 1 Counter.html#counter -\n"))
+			(root / "second.inv").write_bytes(CreateInventory("Second", "lib.Counter vhdl:entity 1 Counter.html#counter -\nlib.Timer vhdl:entity 1 Timer.html#timer -\n"))
+
+			for _ in range(2):
+				inventory = ExternalInventory(root / "cache")
+				self.assertEqual(1, inventory.Load(root / "first.inv", "https://first.example.org"))
+				self.assertEqual(2, inventory.Load(root / "second.inv", "https://second.example.org"))
+
+				self.assertEqual(2, len(inventory))
+				self.assertEqual("First", inventory.Get("entity", "LIB.COUNTER").Project)
+				self.assertEqual("Second", inventory.Get("entity", "lib.timer").Project)
+				self.assertIsNone(inventory.Get("package", "lib.counter"))
+
+			self.assertEqual(2, len(list((root / "cache").glob("*.pickle"))))
+
+	def test_BrokenCache(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			(root / "first.inv").write_bytes(CreateInventory("First", "lib.Counter vhdl:entity 1 Counter.html#counter -\n"))
+			ExternalInventory(root / "cache").Load(root / "first.inv", "https://first.example.org")
+
+			for cacheContent in (b"no pickle", b"\x80\x04\x95\x10\x00\x00\x00\x00\x00\x00\x00\x8c\x07missing\x94\x8c\x01X\x94\x93\x94."):
+				for cacheFile in (root / "cache").glob("*.pickle"):
+					cacheFile.write_bytes(cacheContent)
+
+				inventory = ExternalInventory(root / "cache")
+				self.assertEqual(1, inventory.Load(root / "first.inv", "https://first.example.org"))
+				self.assertEqual("First", inventory.Get("entity", "lib.counter").Project)
+
+	def test_LoadSkipsBrokenInventories(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			(root / "broken.inv").write_bytes(CreateInventory("Broken", "").split(b"zlib.\n")[0] + b"zlib.\nno zlib stream")
+			(root / "first.inv").write_bytes(CreateInventory("First", "lib.Counter vhdl:entity 1 Counter.html#counter -\n"))
+			config = SimpleNamespace(vhdl_inventories={"Broken": ("https://broken.example.org", "broken.inv"), "First": ("https://first.example.org", "first.inv")})
+
+			LoadExternalInventories(SimpleNamespace(config=config, confdir=directory, doctreedir=str(root / "doctrees")))
+
+			self.assertEqual(1, len(config._vhdlExternalInventory))
@@ -0,0 +1,131 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the source location index."""
+from types import SimpleNamespace
+from unittest import TestCase
+
+from pyVHDLModel import Library
+from pyVHDLModel.Base import Mode
+from pyVHDLModel.DesignUnit import Entity, Package
+from pyVHDLModel.Interface import GenericConstantInterfaceItem, PortSignalInterfaceItem, ParameterConstantInterfaceItem
+from pyVHDLModel.Subprogram import Function, Procedure
+from pyVHDLModel.Symbol import SimpleSubtypeSymbol
+
+from VHDLDomain.Location import OverloadName, SourceLocationKind, SourceLocationTable, SourceSpan
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def Place(item, line: int, column: int = 1):
+	item.Position = SimpleNamespace(Line=line, Column=column)
+	return item
+
+
+def CreateSubprogram(subprogramClass, identifier: str, line: int, *parameters: str):
+	subprogram = Place(subprogramClass(identifier), line, 2)
+	subprogram._parameterItems = [Place(ParameterConstantInterfaceItem([parameter], Mode.In, SimpleSubtypeSymbol("natural")), line, 20) for parameter in parameters]
+	return subprogram
+
+
+class AddDocument(TestCase):
+	def setUp(self):
+		library = Library("lib_Utilities")
+
+		# entity Counter is generic (Bits, Width : natural); port (Clock : in std_logic); end entity;
+		entity = Place(Entity(
+			"Counter",
+			genericItems=[Place(GenericConstantInterfaceItem(["Bits", "Width"], Mode.In, SimpleSubtypeSymbol("natural")), 1, 30)],
+			portItems=[Place(PortSignalInterfaceItem(["Clock"], Mode.In, SimpleSubtypeSymbol("std_logic")), 1, 70)]
+		), 1)
+		entity.Library = library
+
+		package = Place(Package(
+			"Utilities",
+			declaredItems=[
+				CreateSubprogram(Function, "to_slv", 4, "value"),
+				CreateSubprogram(Function, "to_slv", 5, "value", "size"),
+				CreateSubprogram(Procedure, "to_slv", 6),
+			]
+		), 3)
+		package.Library = library
+
+		self.locations = SourceLocationTable()
+		self.locations.AddDocument(SimpleNamespace(DesignUnits=[package, entity]), "Utilities.vhdl", 10)
+
+	def test_DesignUnits(self):
+		self.assertEqual(SourceSpan("Utilities.vhdl", 1, 1, 2), self.locations.Get(SourceLocationKind.Entity, "lib_utilities.counter"))
+		self.assertEqual(SourceSpan("Utilities.vhdl", 3, 1, 10), self.locations.Get(SourceLocationKind.Package, "lib_utilities.utilities"))
+
+	def test_SingleLineInterfaceItems(self):
+		for kind, name, column in (
+			(SourceLocationKind.Generic, "lib_utilities.counter.bits",  30),
+			(SourceLocationKind.Generic, "lib_utilities.counter.width", 30),
+			(SourceLocationKind.Port,    "lib_utilities.counter.clock", 70),
+		):
+			with self.subTest(name=name):
+				self.assertEqual(SourceSpan("Utilities.vhdl", 1, column, 1), self.locations.Get(kind, name))
+
+	def test_OverloadNames(self):
+		self.assertEqual(4, self.locations.Get(SourceLocationKind.Function, "lib_utilities.utilities.to_slv").Line)
+		self.assertEqual(5, self.locations.Get(SourceLocationKind.Function, "lib_utilities.utilities.to_slv-2").Line)
+		self.assertIsNone(self.locations.Get(SourceLocationKind.Function, "lib_utilities.utilities.to_slv-3"))
+
+		# Functions and procedures are numbered separately.
+		self.assertEqual(6, self.locations.Get(SourceLocationKind.Procedure, "lib_utilities.utilities.to_slv").Line)
+
+	def test_Parameters(self):
+		self.assertEqual(4, self.locations.Get(SourceLocationKind.Parameter, "lib_utilities.utilities.to_slv.value").Line)
+		self.assertEqual(5, self.locations.Get(SourceLocationKind.Parameter, "lib_utilities.utilities.to_slv-2.size").Line)
+
+	def test_IterateDocument(self):
+		kinds = [kind for kind, _, _ in self.locations.IterateDocument("Utilities.vhdl")]
+
+		self.assertEqual(SourceLocationKind.Entity, kinds[0])
+		self.assertEqual(SourceLocationKind.Package, kinds[4])
+
+
+class Overloads(TestCase):
+	def test_OverloadName(self):
+		self.assertEqual("lib.pkg.to_slv", OverloadName("lib.pkg.to_slv", 1))
+		self.assertEqual("lib.pkg.to_slv-3", OverloadName("lib.pkg.to_slv", 3))
+
+	def test_FirstLocationIsKept(self):
+		locations = SourceLocationTable()
+		locations.Add(SourceLocationKind.Type, "lib.pkg.t", "Pkg.vhdl", 4, 1, 4)
+		locations.Add(SourceLocationKind.Type, "lib.pkg.t", "Pkg.vhdl", 9, 1, 9)
+
+		self.assertEqual(4, locations.Get(SourceLocationKind.Type, "lib.pkg.t").Line)
+		self.assertEqual(1, len(locations))
@@ -0,0 +1,82 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the typed options of directives."""
+from unittest import TestCase
+
+from VHDLDomain.Option import ParameterStyle, ParseBoolean, ParseCount, ParseDependencyDirection, ParseParameterStyle, directiveOptions
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Parse(TestCase):
+	def test_MissingArgument(self):
+		for parser in (ParseBoolean, ParseCount, ParseDependencyDirection, ParseParameterStyle):
+			with self.subTest(parser=parser.__name__), self.assertRaises(ValueError) as context:
+				parser(None)
+
+			self.assertIn("must supply an argument", str(context.exception))
+
+	def test_Values(self):
+		self.assertTrue(ParseBoolean(" Yes "))
+		self.assertEqual(5, ParseCount("5"))
+		self.assertEqual(ParameterStyle.Compact, ParseParameterStyle("compact"))
+
+
+class Compile(TestCase):
+	def test_Strings(self):
+		options = directiveOptions["describeentity"].Compile({"definition": "no", "portlist": "sections"})
+
+		self.assertFalse(options.Definition)
+		self.assertEqual(ParameterStyle.Sections, options.Ports)
+
+	def test_NonStringValues(self):
+		entityOptions = directiveOptions["describeentity"].Compile({"definition": False, "genericlist": ParameterStyle.Never})
+		statisticsOptions = directiveOptions["designstats"].Compile({"top": 5})
+
+		self.assertIs(False, entityOptions.Definition)
+		self.assertEqual(ParameterStyle.Never, entityOptions.Generics)
+		self.assertEqual(5, statisticsOptions.Top)
+
+	def test_InvalidNonStringValues(self):
+		schema = directiveOptions["describeentity"]
+		for values in ({"definition": 1}, {"portlist": True}, {"hierarchy": None}):
+			with self.subTest(values=values), self.assertRaises(ValueError):
+				schema.Compile(values)
+
+		with self.assertRaises(ValueError):
+			directiveOptions["designstats"].Compile({"top": -1})
+		with self.assertRaises(ValueError):
+			directiveOptions["designstats"].Compile({"top": 2.5})
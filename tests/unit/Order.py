@@ -0,0 +1,72 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for sorted design views."""
+from pathlib import PurePosixPath
+from types import SimpleNamespace
+from unittest import TestCase
+
+from VHDLDomain.Order import GetSortedDesign
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateItem(name: str, **attributes):
+	return SimpleNamespace(Identifier=name, NormalizedIdentifier=name.lower(), **attributes)
+
+
+class Views(TestCase):
+	def setUp(self):
+		self.library = CreateItem("lib_Utilities")
+		self.counter = CreateItem("Counter", Library=self.library, Architectures={"sim": CreateItem("sim"), "rtl": CreateItem("rtl")})
+		self.library.Entities = {"sync_bits": CreateItem("sync_Bits"), "counter": self.counter, "Debouncer": CreateItem("debouncer")}
+		self.library.Packages = {}
+
+		self.design = SimpleNamespace(
+			Libraries={"lib_utilities": self.library, "ieee": CreateItem("ieee")},
+			Documents=[SimpleNamespace(ShortPath=PurePosixPath(path)) for path in ("src/b.vhdl", "a.vhdl", "src/a.vhdl")]
+		)
+
+	def test_Sorted(self):
+		sortedDesign = GetSortedDesign(self.design)
+		self.assertEqual(["ieee", "lib_Utilities"], [library.Identifier for library in sortedDesign.Libraries])
+		self.assertEqual(["Counter", "debouncer", "sync_Bits"], [entity.Identifier for entity in sortedDesign.Entities(self.library)])
+		self.assertEqual(["rtl", "sim"], [architecture.Identifier for architecture in sortedDesign.Architectures(self.counter)])
+		self.assertEqual(["a.vhdl", "src/a.vhdl", "src/b.vhdl"], [document.ShortPath.as_posix() for document in sortedDesign.Documents])
+
+	def test_Cached(self):
+		sortedDesign = GetSortedDesign(self.design)
+		self.assertIs(sortedDesign, GetSortedDesign(self.design))
+		self.assertIs(sortedDesign.Entities(self.library), sortedDesign.Entities(self.library))
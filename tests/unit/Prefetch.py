@@ -0,0 +1,107 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the source file prefetcher."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from VHDLDomain.Prefetch import SourceFilePrefetcher
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Prefetching(TestCase):
+	_directory: TemporaryDirectory
+	_files: list
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		directory = Path(self._directory.name)
+
+		self._files = []
+		for i in range(10):
+			path = directory / f"file{i}.vhdl"
+			path.write_text(f"-- file {i}\n", encoding="utf-8")
+			self._files.append((f"lib{i % 2}", path))
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _check(self, prefetcher: SourceFilePrefetcher) -> None:
+		result = list(prefetcher)
+
+		self.assertEqual(len(self._files), len(result))
+		for (libraryName, path), (resultLibraryName, resultPath, sourceCode) in zip(self._files, result):
+			self.assertEqual(libraryName, resultLibraryName)
+			self.assertIs(path, resultPath)
+			self.assertEqual(path.read_text(encoding="utf-8"), sourceCode)
+
+		self.assertEqual(len(self._files), prefetcher.FileCount)
+		self.assertEqual(sum(len(path.read_text(encoding="utf-8")) for _, path in self._files), prefetcher.ByteCount)
+		self.assertGreaterEqual(prefetcher.WaitTime, 0.0)
+
+	def test_Synchronous(self):
+		self._check(SourceFilePrefetcher(self._files, bufferSize=0))
+
+	def test_Buffered(self):
+		self._check(SourceFilePrefetcher(self._files, bufferSize=3))
+
+	def test_BufferLargerThanFileCount(self):
+		self._check(SourceFilePrefetcher(self._files, bufferSize=32))
+
+	def test_NegativeBufferSize(self):
+		with self.assertRaises(ValueError):
+			SourceFilePrefetcher(self._files, bufferSize=-1)
+
+	def test_ReadError(self):
+		missing = Path(self._directory.name) / "missing.vhdl"
+		files = self._files[:3] + [("lib0", missing)] + self._files[3:]
+		errors = []
+
+		for bufferSize in (0, 3):
+			errors.clear()
+			result = list(SourceFilePrefetcher(files, bufferSize=bufferSize, onError=lambda *args: errors.append(args)))
+
+			self.assertEqual([path for _, path in self._files], [path for _, path, _ in result])
+			self.assertEqual(1, len(errors))
+			self.assertIs(missing, errors[0][1])
+			self.assertIsInstance(errors[0][2], FileNotFoundError)
+
+	def test_ReadErrorWithoutCallback(self):
+		files = self._files + [("lib0", Path(self._directory.name) / "missing.vhdl")]
+
+		with self.assertRaises(FileNotFoundError):
+			list(SourceFilePrefetcher(files, bufferSize=3))
@@ -0,0 +1,173 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for resolving references created by the VHDL domain's roles."""
+from types import SimpleNamespace
+from typing import Optional as Nullable
+from unittest import TestCase
+from unittest.mock import patch
+
+from docutils import nodes
+from docutils.utils import new_document
+
+from VHDLDomain.Inventory import ObjectTable
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Role import pending_vhdl_xref, ResolveReferences
+from VHDLDomain.Signature import SignatureIndex, SubprogramSignature
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+_objectTypes = {
+	"design": "design", "lib": "library", "doc": "document", "ctx": "context", "ent": "entity", "arch": "architecture",
+	"comp": "component", "pack": "package", "packbody": "packagebody", "config": "configuration", "type": "type",
+	"func": "function", "proc": "procedure", "const": "constant", "generic": "generic", "port": "port", "param": "parameter",
+}
+
+
+class FakeDomain:
+	def __init__(self, designs):
+		self.Objects = ObjectTable()
+		self.Designs = designs
+
+	def objtypes_for_role(self, role: str, default=None):
+		return [_objectTypes[role]]
+
+
+class Resolve(TestCase):
+	def setUp(self):
+		locations = SourceLocationTable()
+		locations.Add(SourceLocationKind.Context,       "lib.ctx",                       "Utilities.vhdl", 1, 1, 3)
+		locations.Add(SourceLocationKind.Package,       "lib.pkg",                       "Utilities.vhdl", 5, 1, 30)
+		locations.Add(SourceLocationKind.Component,     "lib.pkg.counter",               "Utilities.vhdl", 8, 2, 8)
+		locations.Add(SourceLocationKind.Type,          "lib.pkg.t_state",               "Utilities.vhdl", 12, 2, 12)
+		locations.Add(SourceLocationKind.Constant,      "lib.pkg.c_width",               "Utilities.vhdl", 13, 2, 13)
+		locations.Add(SourceLocationKind.Function,      "lib.pkg.to_slv",                "Utilities.vhdl", 14, 2, 14)
+		locations.Add(SourceLocationKind.Parameter,     "lib.pkg.to_slv.value",          "Utilities.vhdl", 14, 18, 14)
+		locations.Add(SourceLocationKind.Procedure,     "lib.pkg.reset",                 "Utilities.vhdl", 15, 2, 15)
+		locations.Add(SourceLocationKind.PackageBody,   "lib.pkg",                       "Utilities.vhdl", 32, 1, 60)
+		locations.Add(SourceLocationKind.Entity,        "lib.counter",                   "Counter.vhdl", 1, 1, 10)
+		locations.Add(SourceLocationKind.Generic,       "lib.counter.bits",              "Counter.vhdl", 3, 3, 3)
+		locations.Add(SourceLocationKind.Port,          "lib.counter.clock",             "Counter.vhdl", 5, 3, 5)
+		locations.Add(SourceLocationKind.Architecture,  "lib.counter(rtl)",              "Counter.vhdl", 12, 1, 40)
+		locations.Add(SourceLocationKind.Configuration, "lib.cfg",                       "Counter.vhdl", 42, 1, 46)
+
+		signatures = SignatureIndex()
+		signatures.Add(SourceLocationKind.Function, SubprogramSignature("lib.pkg.to_slv", ("natural", ), "std_logic_vector"))
+		signatures.Add(SourceLocationKind.Procedure, SubprogramSignature("lib.pkg.reset", ("std_logic", ), None))
+
+		self.domain = FakeDomain({"StopWatch": SimpleNamespace(SourceLocations=locations, Signatures=signatures)})
+		self.domain.Objects.Add("stopwatch", "StopWatch", "design", "overview", "stopwatch-design")
+		self.domain.Objects.Add("stopwatch.src/counter.vhdl", "StopWatch.src/Counter.vhdl", "document", "overview", "stopwatch-src-counter-vhdl")
+		self.domain.Objects.Add("lib", "lib", "library", "api", "lib")
+		self.domain.Objects.Add("lib.counter", "lib.Counter", "entity", "api", "counter")
+		self.domain.Objects.Add("lib.counter(rtl)", "lib.Counter(rtl)", "architecture", "api", "counter")
+		self.domain.Objects.Add("lib.counter.bits", "Bits", "generic", "api", "counter-generic-bits")
+		self.domain.Objects.Add("lib.counter.clock", "Clock", "port", "api", "counter-port-clock")
+		self.domain.Objects.Add("lib.pkg", "lib.pkg", "package", "api", "pkg")
+
+	def Resolve(self, role: str, target: str) -> Nullable[nodes.reference]:
+		document = new_document("index")
+		paragraph = nodes.paragraph("", "", pending_vhdl_xref("", nodes.literal(text=target), reftype=role, reftarget=target))
+		document += paragraph
+
+		application = SimpleNamespace(
+			config=SimpleNamespace(vhdl_source_pages=True),
+			builder=SimpleNamespace(name="html", format="html", get_relative_uri=lambda fromDocname, toDocname: f"{toDocname}.html"),
+			env=SimpleNamespace(domains={"vhdl": self.domain})
+		)
+		with patch("builtins.print"):
+			ResolveReferences(application, document, "index")
+
+		references = list(paragraph.findall(nodes.reference))
+		return references[0]["refuri"] if references else None
+
+	def test_Design(self):
+		self.assertEqual("overview.html#stopwatch-design", self.Resolve("design", "StopWatch"))
+
+	def test_Document(self):
+		self.assertEqual("overview.html#stopwatch-src-counter-vhdl", self.Resolve("doc", "StopWatch.src/Counter.vhdl"))
+
+	def test_Library(self):
+		self.assertEqual("api.html#lib", self.Resolve("lib", "lib"))
+
+	def test_Context(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#context-lib.ctx", self.Resolve("ctx", "lib.ctx"))
+
+	def test_Entity(self):
+		self.assertEqual("api.html#counter", self.Resolve("ent", "lib.Counter"))
+
+	def test_Architecture(self):
+		self.assertEqual("api.html#counter", self.Resolve("arch", "lib.Counter(RTL)"))
+
+	def test_UndocumentedArchitecture(self):
+		self.domain.Objects.ClearDocument("api")
+		self.assertEqual("_vhdl/source/StopWatch/Counter.vhdl.html#architecture-lib.counter(rtl)", self.Resolve("arch", "lib.counter(rtl)"))
+
+	def test_Component(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#component-lib.pkg.counter", self.Resolve("comp", "lib.pkg.Counter"))
+
+	def test_Package(self):
+		self.assertEqual("api.html#pkg", self.Resolve("pack", "lib.pkg"))
+
+	def test_PackageBody(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#packagebody-lib.pkg", self.Resolve("packbody", "lib.pkg"))
+
+	def test_Configuration(self):
+		self.assertEqual("_vhdl/source/StopWatch/Counter.vhdl.html#configuration-lib.cfg", self.Resolve("config", "lib.cfg"))
+
+	def test_Type(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#type-lib.pkg.t_state", self.Resolve("type", "lib.pkg.T_State"))
+
+	def test_Function(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#function-lib.pkg.to_slv", self.Resolve("func", "lib.pkg.to_slv[natural]"))
+
+	def test_Procedure(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#procedure-lib.pkg.reset", self.Resolve("proc", "lib.pkg.reset"))
+
+	def test_Constant(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#constant-lib.pkg.c_width", self.Resolve("const", "lib.pkg.C_Width"))
+
+	def test_Generic(self):
+		self.assertEqual("api.html#counter-generic-bits", self.Resolve("generic", "lib.Counter.Bits"))
+
+	def test_Port(self):
+		self.assertEqual("api.html#counter-port-clock", self.Resolve("port", "lib.Counter.Clock"))
+
+	def test_Parameter(self):
+		self.assertEqual("_vhdl/source/StopWatch/Utilities.vhdl.html#parameter-lib.pkg.to_slv.value", self.Resolve("param", "lib.pkg.to_slv.Value"))
+
+	def test_Unresolved(self):
+		self.assertIsNone(self.Resolve("const", "lib.pkg.c_unknown"))
@@ -0,0 +1,159 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the VHDL symbol index."""
+from bisect import bisect_left
+from json import loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyVHDLModel.Subprogram import Function, Procedure
+from pyVHDLModel.Type import BaseType
+
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable, OverloadName
+from VHDLDomain.Search import CreateSymbolIndex, WriteSymbolIndex, SYMBOL_INDEX_FILE
+from VHDLDomain.SourcePage import SourcePageName
+from VHDLDomain.Tracking import SourceHashTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateItem(*identifiers: str) -> SimpleNamespace:
+	return SimpleNamespace(Identifiers=list(identifiers), NormalizedIdentifiers=[identifier.lower() for identifier in identifiers])
+
+
+def CreateDesign(libraryName: str = "lib_StopWatch") -> SimpleNamespace:
+	counter = SimpleNamespace(Identifier="Counter", NormalizedIdentifier="counter", GenericItems=[CreateItem("BITS")], PortItems=[CreateItem("Clock", "Reset"), CreateItem("Value")])
+	utilities = SimpleNamespace(
+		Identifier="Utilities", NormalizedIdentifier="utilities", GenericItems=[],
+		DeclaredItems=[BaseType("T_Count"), Function("to_slv"), Function("TO_SLV"), Procedure("Convert"), SimpleNamespace(Identifier="C_Width")]
+	)
+	library = SimpleNamespace(Identifier=libraryName, NormalizedIdentifier=libraryName.lower(), Entities={"counter": counter}, Packages={"utilities": utilities})
+	predefined = SimpleNamespace(Identifier="ieee", NormalizedIdentifier="ieee", Entities={}, Packages={"numeric_std": utilities})
+
+	hashes = SourceHashTable()
+	hashes.AddHash(libraryName, "Counter.vhdl", "0" * 64)
+	return SimpleNamespace(Libraries={"ieee": predefined, libraryName.lower(): library}, SourceLocations=SourceLocationTable(), SourceHashes=hashes)
+
+
+def CreateApplication(root: Path, designs, sourcePages: bool = False, stubDirectory: str = "vhdl") -> SimpleNamespace:
+	builder = SimpleNamespace(name="html", outdir=str(root / "html"), get_target_uri=lambda pageName: f"{pageName}.html")
+	return SimpleNamespace(
+		config=SimpleNamespace(vhdl_source_pages=sourcePages, vhdl_stub_directory=stubDirectory, vhdl_symbol_search=True),
+		doctreedir=str(root / "doctrees"),
+		builder=builder,
+		env=SimpleNamespace(domains={"vhdl": SimpleNamespace(Designs=designs, Catalogs=designs)})
+	)
+
+
+class Index(TestCase):
+	def test_PrefixSorted(self):
+		symbols = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": CreateDesign()}))["symbols"]
+		names = [symbol[0] for symbol in symbols]
+
+		self.assertEqual(sorted(names), names)
+		self.assertEqual(["clock", "convert", "counter"], names[bisect_left(names, "c"):bisect_left(names, "d")])
+		self.assertEqual(["Clock", "Reset", "Value"], [symbol[1] for symbol in symbols if symbol[2] == int(SourceLocationKind.Port)])
+
+	def test_Kinds(self):
+		index = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": CreateDesign()}))
+		kinds = {symbol[1]: index["kinds"][symbol[2]] for symbol in index["symbols"]}
+
+		self.assertEqual(str(SourceLocationKind.Entity), kinds["Counter"])
+		self.assertEqual(str(SourceLocationKind.Generic), kinds["BITS"])
+		self.assertEqual(str(SourceLocationKind.Port), kinds["Reset"])
+		self.assertEqual(str(SourceLocationKind.Package), kinds["Utilities"])
+		self.assertEqual(str(SourceLocationKind.Function), kinds["to_slv"])
+		self.assertEqual(str(SourceLocationKind.Procedure), kinds["Convert"])
+		self.assertEqual(str(SourceLocationKind.Type), kinds["T_Count"])
+		self.assertNotIn("C_Width", kinds)
+		self.assertEqual(2, len([symbol for symbol in index["symbols"] if symbol[0] == "to_slv"]))
+		self.assertTrue(all(symbol[3].startswith("lib_StopWatch.") for symbol in index["symbols"]))
+
+	def test_StubPages(self):
+		index = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": CreateDesign()}))
+
+		for symbol in index["symbols"]:
+			unitName = "Counter" if symbol[3] == "lib_StopWatch.Counter" else "Utilities"
+			self.assertEqual(f"vhdl/lib_StopWatch/{unitName}.html", index["pages"][symbol[4]])
+			self.assertEqual("", symbol[5])
+
+	def test_StubPagesOfSeveralDesigns(self):
+		index = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": CreateDesign("work"), "Display": CreateDesign("work")}))
+
+		self.assertEqual(["vhdl/StopWatch/work/Counter.html", "vhdl/StopWatch/work/Utilities.html", "vhdl/Display/work/Counter.html", "vhdl/Display/work/Utilities.html"], index["pages"])
+
+	def test_NoPages(self):
+		index = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": CreateDesign()}, stubDirectory=None))
+
+		self.assertEqual([], index["pages"])
+		self.assertTrue(all(symbol[4] == -1 for symbol in index["symbols"]))
+
+	def test_SourcePages(self):
+		design = CreateDesign()
+		design.SourceLocations.Add(SourceLocationKind.Entity, "lib_stopwatch.counter", "Counter.vhdl", 3, 1, 10)
+		design.SourceLocations.Add(SourceLocationKind.Function, OverloadName("lib_stopwatch.utilities.to_slv", 2), "Utilities.pkg.vhdl", 20, 1, 22)
+
+		index = CreateSymbolIndex(CreateApplication(Path("."), {"StopWatch": design}, sourcePages=True))
+		symbols = {(symbol[1], index["pages"][symbol[4]], symbol[5]) for symbol in index["symbols"] if symbol[1] in ("Counter", "TO_SLV")}
+
+		self.assertEqual({
+			("Counter", f"{SourcePageName('StopWatch', 'Counter.vhdl')}.html", SourceLocationTable.Anchor(SourceLocationKind.Entity, "lib_stopwatch.counter")),
+			("TO_SLV", f"{SourcePageName('StopWatch', 'Utilities.pkg.vhdl')}.html", SourceLocationTable.Anchor(SourceLocationKind.Function, OverloadName("lib_stopwatch.utilities.to_slv", 2)))
+		}, symbols)
+
+
+class Write(TestCase):
+	def test_SkipUnchangedKey(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			design = CreateDesign()
+			application = CreateApplication(root, {"StopWatch": design})
+			symbolIndexFile = root / "html/_static" / SYMBOL_INDEX_FILE
+
+			WriteSymbolIndex(application)
+			self.assertEqual(10, len(loads(symbolIndexFile.read_text(encoding="utf-8"))["symbols"]))
+
+			with patch("VHDLDomain.Search.CreateSymbolIndex") as createSymbolIndex:
+				WriteSymbolIndex(application)
+				createSymbolIndex.assert_not_called()
+
+			design.SourceHashes.AddHash("lib_StopWatch", "Counter.vhdl", "1" * 64)
+			with patch("VHDLDomain.Search.CreateSymbolIndex", return_value={"symbols": []}) as createSymbolIndex:
+				WriteSymbolIndex(application)
+				createSymbolIndex.assert_called_once()
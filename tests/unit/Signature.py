@@ -0,0 +1,83 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the subprogram signature index."""
+from unittest import TestCase
+
+from VHDLDomain.Location import SourceLocationKind
+from VHDLDomain.Signature import ParseSignature, SignatureIndex, SubprogramSignature
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Parse(TestCase):
+	def test_Name(self):
+		self.assertEqual(("lib.pkg.to_slv", None, None), ParseSignature("lib.Pkg.to_SLV"))
+
+	def test_Parameters(self):
+		self.assertEqual(("lib.pkg.to_slv", ("natural", "positive"), None), ParseSignature("lib.pkg.to_slv[Natural, positive]"))
+		self.assertEqual(("lib.pkg.reset", (), None), ParseSignature("lib.pkg.reset[]"))
+
+	def test_ReturnType(self):
+		self.assertEqual(("lib.pkg.to_slv", ("natural", ), "std_logic_vector"), ParseSignature("lib.pkg.to_slv [natural return std_logic_vector]"))
+		self.assertEqual(("lib.pkg.now", (), "time"), ParseSignature("lib.pkg.now[return time]"))
+
+	def test_Malformed(self):
+		with self.assertRaises(ValueError):
+			ParseSignature("lib.pkg.to_slv(natural)")
+
+
+class Index(TestCase):
+	def setUp(self):
+		self.index = SignatureIndex()
+		self.first = self.index.Add(SourceLocationKind.Function, SubprogramSignature("lib.pkg.to_slv", ("natural", "positive"), "std_logic_vector"))
+		self.second = self.index.Add(SourceLocationKind.Function, SubprogramSignature("lib.pkg.to_slv", ("natural", "positive"), "unsigned"))
+		self.third = self.index.Add(SourceLocationKind.Function, SubprogramSignature("lib.pkg.to_slv", ("boolean", ), "std_logic_vector"))
+
+	def test_OverloadNames(self):
+		self.assertEqual(["lib.pkg.to_slv", "lib.pkg.to_slv-2", "lib.pkg.to_slv-3"], [entry.LocationName for entry in (self.first, self.second, self.third)])
+		self.assertEqual("lib.pkg.to_slv[natural, positive return unsigned]", str(self.second.Signature))
+
+	def test_Resolve(self):
+		self.assertEqual([self.third], self.index.Resolve(SourceLocationKind.Function, "lib.pkg.to_slv[boolean]"))
+		self.assertEqual([self.first], self.index.Resolve(SourceLocationKind.Function, "lib.pkg.to_slv[natural, positive return std_logic_vector]"))
+
+	def test_Ambiguous(self):
+		self.assertEqual(3, len(self.index.Resolve(SourceLocationKind.Function, "lib.pkg.to_slv")))
+		self.assertEqual(2, len(self.index.Resolve(SourceLocationKind.Function, "lib.pkg.to_slv[natural, positive]")))
+
+	def test_Unknown(self):
+		self.assertEqual([], self.index.Resolve(SourceLocationKind.Procedure, "lib.pkg.to_slv"))
+		self.assertEqual([], self.index.Resolve(SourceLocationKind.Function, "lib.pkg.to_slv[integer]"))
@@ -0,0 +1,165 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for highlighted source pages."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.SourcePage import CollectSourcePages, RenderSourceBlocks, SourcePageName, SourcePagesEnabled
+from VHDLDomain.Tracking import SourceHashTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class FakeHighlighter:
+	def highlight_block(self, sourceCode: str, language: str, linenos: bool = False) -> str:
+		return f'<div class="highlight"><pre>{sourceCode}</pre></div>'
+
+
+def CreateApplication(root: Path, baseDirectory: Path, *shortPaths: str):
+	hashes = SourceHashTable()
+	for shortPath in shortPaths:
+		hashes.AddHash("work", shortPath, "0" * 64)
+
+	catalog = SimpleNamespace(BaseDirectory=baseDirectory, SourceHashes=hashes)
+	design = SimpleNamespace(SourceLocations=SourceLocationTable())
+	domain = SimpleNamespace(Catalogs={"StopWatch": catalog}, Designs={"StopWatch": design})
+
+	builder = SimpleNamespace(
+		name="html",
+		format="html",
+		highlighter=FakeHighlighter(),
+		get_outfilename=lambda pageName: str(root / "html" / f"{pageName}.html")
+	)
+	return SimpleNamespace(
+		config=SimpleNamespace(vhdl_source_pages=True, pygments_style="sphinx", html_theme="alabaster", html_theme_options={}, templates_path=[]),
+		confdir=str(root / "doc"),
+		doctreedir=str(root / "doctrees"),
+		parallel=1,
+		builder=builder,
+		env=SimpleNamespace(domains={"vhdl": domain})
+	)
+
+
+class Links(TestCase):
+	def test_SourcePageName(self):
+		self.assertEqual("_vhdl/source/StopWatch/src/Counter.vhdl", SourcePageName("StopWatch", "src/Counter.vhdl"))
+
+	def test_SourcePagesEnabled(self):
+		for builderName, builderFormat, enabled in (("html", "html", True), ("dirhtml", "html", True), ("singlehtml", "html", False), ("epub", "html", False), ("latex", "latex", False)):
+			with self.subTest(builder=builderName):
+				application = SimpleNamespace(config=SimpleNamespace(vhdl_source_pages=True), builder=SimpleNamespace(name=builderName, format=builderFormat))
+				self.assertEqual(enabled, SourcePagesEnabled(application))
+
+		application = SimpleNamespace(config=SimpleNamespace(vhdl_source_pages=False), builder=SimpleNamespace(name="html", format="html"))
+		self.assertFalse(SourcePagesEnabled(application))
+
+	def test_Anchors(self):
+		locations = SourceLocationTable()
+		locations.Add(SourceLocationKind.Entity, "lib.counter", "Counter.vhdl", 1, 1, 3)
+		locations.Add(SourceLocationKind.Port, "lib.counter.clock", "Counter.vhdl", 2, 3, 2)
+		highlighted = '<div class="highlight"><pre>entity Counter is\n  port (Clock : in std_logic);\nend entity;\n</pre></div>'
+
+		html = RenderSourceBlocks(highlighted, locations.IterateDocument("Counter.vhdl"))
+
+		self.assertIn(f'id="{SourceLocationTable.Anchor(SourceLocationKind.Entity, "lib.counter")}"', html)
+		self.assertIn('<div class="vhdl-source-block vhdl-source-port" id="port-lib.counter.clock">  port', html)
+		self.assertEqual(html.count("<div class=\"vhdl-source-block"), html.count("</div>") - 1)
+
+
+class Collect(TestCase):
+	def setUp(self):
+		self.directory = TemporaryDirectory()
+		self.root = Path(self.directory.name)
+		(self.root / "doc").mkdir()
+		(self.root / "src").mkdir()
+		(self.root / "src" / "Counter.vhdl").write_text("entity Counter is end entity;\n", encoding="utf-8")
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_RelativeBaseDirectory(self):
+		application = CreateApplication(self.root, Path("../src"), "Counter.vhdl")
+
+		with patch("builtins.print"):
+			pages = list(CollectSourcePages(application))
+
+		self.assertEqual(["_vhdl/source/StopWatch/Counter.vhdl"], [pageName for pageName, _, _ in pages])
+		self.assertIn("entity Counter", pages[0][1]["body"])
+
+	def test_UnreadableSourceFile(self):
+		application = CreateApplication(self.root, Path("../src"), "Missing.vhdl", "Counter.vhdl")
+
+		with patch("builtins.print") as printMock:
+			pages = list(CollectSourcePages(application))
+
+		self.assertEqual(["_vhdl/source/StopWatch/Counter.vhdl"], [pageName for pageName, _, _ in pages])
+		self.assertTrue(any("Missing.vhdl" in str(call.args[0]) for call in printMock.call_args_list))
+
+	def test_ChangedStyle(self):
+		application = CreateApplication(self.root, Path("../src"), "Counter.vhdl")
+
+		with patch("builtins.print"):
+			pages = list(CollectSourcePages(application))
+			outputFile = Path(application.builder.get_outfilename(pages[0][0]))
+			outputFile.parent.mkdir(parents=True)
+			outputFile.write_text("", encoding="utf-8")
+
+			self.assertEqual([], list(CollectSourcePages(application)))
+
+			application.config.pygments_style = "monokai"
+			self.assertEqual(1, len(list(CollectSourcePages(application))))
+
+	def test_ChangedTemplate(self):
+		application = CreateApplication(self.root, Path("../src"), "Counter.vhdl")
+		application.config.templates_path = ["_templates"]
+		(self.root / "doc" / "_templates").mkdir()
+		template = self.root / "doc" / "_templates" / "layout.html"
+		template.write_text("{% extends '!layout.html' %}", encoding="utf-8")
+
+		with patch("builtins.print"):
+			pages = list(CollectSourcePages(application))
+			outputFile = Path(application.builder.get_outfilename(pages[0][0]))
+			outputFile.parent.mkdir(parents=True)
+			outputFile.write_text("", encoding="utf-8")
+
+			self.assertEqual([], list(CollectSourcePages(application)))
+
+			template.write_text("{% extends '!layout.html' %}{% block footer %}{% endblock %}", encoding="utf-8")
+			self.assertEqual(1, len(list(CollectSourcePages(application))))
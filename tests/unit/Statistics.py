@@ -0,0 +1,96 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for design statistics."""
+from types import SimpleNamespace
+from unittest import TestCase
+
+from VHDLDomain.Location import SourceLocationKind, SourceLocationTable
+from VHDLDomain.Statistics import CountLines, DesignStatistics, LineCount
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateEntity(name: str, ports: int, generics: int):
+	return SimpleNamespace(
+		Identifier=name,
+		NormalizedIdentifier=name.lower(),
+		PortItems=[SimpleNamespace(Identifiers=(f"p{i}", )) for i in range(ports)],
+		GenericItems=[SimpleNamespace(Identifiers=(f"g{i}", )) for i in range(generics)]
+	)
+
+
+class Lines(TestCase):
+	def test_CountLines(self):
+		sourceCode = "-- header\n\nlibrary ieee;  -- comment\n/* block\n   comment */\nentity e is\n  \nend entity;\n"
+
+		lineCount = CountLines(sourceCode)
+		self.assertEqual(LineCount(8, 2, 3), lineCount)
+		self.assertEqual(3, lineCount.CodeLines)
+
+
+class Statistics(TestCase):
+	def setUp(self):
+		locations = SourceLocationTable()
+		locations.Add(SourceLocationKind.Entity, "lib.counter", "Counter.vhdl", 3, 1, 22)
+		locations.Add(SourceLocationKind.Entity, "lib.debouncer", "Debouncer.vhdl", 1, 1, 5)
+
+		library = SimpleNamespace(
+			Identifier="lib",
+			NormalizedIdentifier="lib",
+			Entities={"counter": CreateEntity("Counter", 4, 1), "debouncer": CreateEntity("Debouncer", 2, 3)},
+			Architectures={"counter": {"rtl": None, "sim": None}, "debouncer": {"rtl": None}},
+			Packages={"utilities": SimpleNamespace(GenericItems=[])}
+		)
+		ieee = SimpleNamespace(Identifier="ieee", NormalizedIdentifier="ieee", Entities={}, Architectures={}, Packages={})
+
+		self.statistics = DesignStatistics()
+		self.statistics.AddDocument("lib", LineCount(30, 5, 10))
+		self.statistics.AddDocument("lib", LineCount(10, 1, 1))
+		self.statistics.AddDesign(SimpleNamespace(Libraries={"ieee": ieee, "lib": library}, SourceLocations=locations))
+
+	def test_Libraries(self):
+		libraries = list(self.statistics.IterateLibraries())
+		self.assertEqual(1, len(libraries))
+
+		library = libraries[0]
+		self.assertEqual(("lib", 2, 3, 1, 6, 4, 2, 40, 23, 11), tuple(library))
+		self.assertAlmostEqual(11 / 34, library.CommentRatio)
+		self.assertEqual(library[1:], self.statistics.Total[1:])
+
+	def test_TopEntities(self):
+		self.assertEqual(["Counter", "Debouncer"], [row.Entity for row in self.statistics.TopEntities("Ports", 5)])
+		self.assertEqual(["Debouncer"], [row.Entity for row in self.statistics.TopEntities("Generics", 1)])
+		self.assertEqual(20, self.statistics.TopEntities("Lines", 1)[0].Lines)
@@ -0,0 +1,147 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the stub page writer."""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+
+from VHDLDomain.Stub import StubWriter, CreateDirectiveStub, CreateToctreeStub, StubDocumentName, GenerateStubs
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Stubs(TestCase):
+	def test_DocumentName(self):
+		self.assertEqual("lib_Utilities/Counter", StubDocumentName("", "lib_Utilities", "Counter"))
+		self.assertEqual("vhdl/lib_Utilities/Counter", StubDocumentName("vhdl", "lib_Utilities", "Counter"))
+		self.assertEqual("vhdl/lib_Utilities", StubDocumentName("vhdl", "lib_Utilities"))
+		self.assertEqual("vhdl/StopWatch/work/Counter", StubDocumentName("vhdl", "work", "Counter", "StopWatch"))
+
+	def test_DirectiveStub(self):
+		content = CreateDirectiveStub("Counter", "describeentity", "lib_Utilities.Counter")
+
+		self.assertIn("\nCounter\n#######\n", content)
+		self.assertTrue(content.endswith(".. vhdl:describeentity:: lib_Utilities.Counter\n"))
+
+	def test_DirectiveStubWithOptions(self):
+		content = CreateDirectiveStub("Counter", "describeentity", "lib_Utilities.Counter", {"design": "StopWatch"})
+
+		self.assertTrue(content.endswith(".. vhdl:describeentity:: lib_Utilities.Counter\n   :design: StopWatch\n"))
+
+
+class Writer(TestCase):
+	def test_WriteOnlyChanged(self):
+		with TemporaryDirectory() as directory:
+			writer = StubWriter(Path(directory))
+			self.assertTrue(writer.Write(Path("lib/Counter.rst"), CreateDirectiveStub("Counter", "describeentity", "lib.Counter")))
+
+			writer = StubWriter(Path(directory))
+			self.assertFalse(writer.Write(Path("lib/Counter.rst"), CreateDirectiveStub("Counter", "describeentity", "lib.Counter")))
+			self.assertTrue(writer.Write(Path("lib/Counter.rst"), CreateDirectiveStub("Counter", "describeentity", "lib.Counter2")))
+			self.assertEqual(1, writer.WrittenCount)
+			self.assertEqual(1, writer.UnchangedCount)
+
+	def test_RemoveStale(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory)
+			writer = StubWriter(root)
+			writer.Write(Path("lib/Counter.rst"), CreateDirectiveStub("Counter", "describeentity", "lib.Counter"))
+			writer.Write(Path("old/Removed.rst"), CreateDirectiveStub("Removed", "describeentity", "old.Removed"))
+			writer.Write(Path("lib.rst"), CreateToctreeStub("lib", ["lib/Counter"]))
+			(root / "lib" / "Manual.rst").write_text("Manual\n######\n", encoding="utf-8")
+
+			writer = StubWriter(root)
+			writer.Write(Path("lib/Counter.rst"), CreateDirectiveStub("Counter", "describeentity", "lib.Counter"))
+			writer.Write(Path("lib.rst"), CreateToctreeStub("lib", ["lib/Counter"]))
+			writer.RemoveStale()
+
+			self.assertEqual(1, writer.RemovedCount)
+			self.assertFalse((root / "old").exists())
+			self.assertTrue((root / "lib" / "Counter.rst").exists())
+			self.assertTrue((root / "lib" / "Manual.rst").exists())
+
+	def test_RemoveStaleKeepsOtherDirectories(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory) / "vhdl"
+			writer = StubWriter(root)
+			writer.Write(Path("old/nested/Removed.rst"), CreateDirectiveStub("Removed", "describeentity", "old.Removed"))
+			(root / "lib" / "_images").mkdir(parents=True)
+
+			StubWriter(root).RemoveStale()
+
+			self.assertFalse((root / "old").exists())
+			self.assertTrue((root / "lib" / "_images").exists())
+
+	def test_RemoveStaleKeepsRoot(self):
+		with TemporaryDirectory() as directory:
+			root = Path(directory) / "vhdl"
+			StubWriter(root).Write(Path("Removed.rst"), CreateDirectiveStub("Removed", "describeentity", "old.Removed"))
+
+			StubWriter(root).RemoveStale()
+
+			self.assertFalse((root / "Removed.rst").exists())
+			self.assertTrue(root.exists())
+
+
+def CreateDesign(*entityNames: str) -> SimpleNamespace:
+	entities = {name.lower(): SimpleNamespace(Identifier=name, NormalizedIdentifier=name.lower()) for name in entityNames}
+	library = SimpleNamespace(Identifier="work", NormalizedIdentifier="work", Entities=entities, Packages={})
+	return SimpleNamespace(Libraries={"work": library})
+
+
+def CreateApplication(sourceDirectory: str, designs) -> SimpleNamespace:
+	domain = SimpleNamespace(Catalogs=designs)
+	return SimpleNamespace(srcdir=sourceDirectory, config=SimpleNamespace(vhdl_stub_directory="vhdl"), env=SimpleNamespace(domains={"vhdl": domain}))
+
+
+class Generate(TestCase):
+	def test_SingleDesign(self):
+		with TemporaryDirectory() as directory:
+			GenerateStubs(CreateApplication(directory, {"StopWatch": CreateDesign("Counter")}))
+
+			self.assertTrue((Path(directory) / "vhdl/work.rst").exists())
+			self.assertIn(":design: StopWatch", (Path(directory) / "vhdl/work/Counter.rst").read_text(encoding="utf-8"))
+
+	def test_DesignsSharingALibraryName(self):
+		with TemporaryDirectory() as directory:
+			GenerateStubs(CreateApplication(directory, {"StopWatch": CreateDesign("Counter"), "Display": CreateDesign("Counter", "Encoder")}))
+
+			root = Path(directory) / "vhdl"
+			self.assertIn(":design: StopWatch", (root / "StopWatch/work/Counter.rst").read_text(encoding="utf-8"))
+			self.assertIn(":design: Display", (root / "Display/work/Counter.rst").read_text(encoding="utf-8"))
+			self.assertIn("work/Encoder", (root / "Display/work.rst").read_text(encoding="utf-8"))
+			self.assertNotIn("work/Encoder", (root / "StopWatch/work.rst").read_text(encoding="utf-8"))
@@ -0,0 +1,86 @@
+# ==================================================================================================================== #
+# __     ___   _ ____  _     ____                        _                                                             #
+# \ \   / / | | |  _ \| |   |  _ \  ___  _ __ ___   __ _(_)_ __                                                        #
+#  \ \ / /| |_| | | | | |   | | | |/ _ \| '_ ` _ \ / _` | | '_ \                                                       #
+#   \ V / |  _  | |_| | |___| |_| | (_) | | | | | | (_| | | | | |                                                      #
+#    \_/  |_| |_|____/|_____|____/ \___/|_| |_| |_|\__,_|_|_| |_|                                                      #
+#                                                                                                                      #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2023 Patrick Lehmann - Boetzingen, Germany                                                            #
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for per-document dependency tracking."""
+from types import SimpleNamespace
+from unittest import TestCase
+
+from VHDLDomain.Tracking import DocumentTracker, SourceHashTable
+
+
+if __name__ == "__main__":  # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def CreateDesign(**files):
+	hashes = SourceHashTable()
+	for path, sourceCode in files.items():
+		hashes.AddDocument("lib", f"{path}.vhdl", sourceCode)
+
+	return SimpleNamespace(SourceHashes=hashes)
+
+
+class Tracker(TestCase):
+	def setUp(self):
+		design = CreateDesign(Counter="entity counter", Debouncer="entity debouncer")
+
+		self.tracker = DocumentTracker()
+		self.tracker.Add("counter", ("file", "StopWatch", "Counter.vhdl"), design.SourceHashes.GetFile("Counter.vhdl"))
+		self.tracker.AddUnit("counter", "StopWatch", "lib.counter")
+		self.tracker.Add("debouncer", ("file", "StopWatch", "Debouncer.vhdl"), design.SourceHashes.GetFile("Debouncer.vhdl"))
+		self.tracker.Add("library", ("library", "StopWatch", "lib"), design.SourceHashes.GetLibrary("lib"))
+		self.tracker.Add("overview", ("design", "StopWatch"), design.SourceHashes.Design)
+
+	def test_Unchanged(self):
+		designs = {"StopWatch": CreateDesign(Counter="entity counter", Debouncer="entity debouncer")}
+		self.assertEqual([], list(self.tracker.IterateOutdated(designs)))
+
+	def test_ChangedFile(self):
+		designs = {"StopWatch": CreateDesign(Counter="entity counter is", Debouncer="entity debouncer")}
+		self.assertEqual(["counter", "library", "overview"], sorted(self.tracker.IterateOutdated(designs)))
+
+	def test_AddedFile(self):
+		designs = {"StopWatch": CreateDesign(Counter="entity counter", Debouncer="entity debouncer", Toggle="entity toggle")}
+		self.assertEqual(["library", "overview"], sorted(self.tracker.IterateOutdated(designs)))
+
+	def test_RemovedDesign(self):
+		self.assertEqual(4, len(list(self.tracker.IterateOutdated({}))))
+
+	def test_ClearMerge(self):
+		self.tracker.ClearDocument("counter")
+		self.assertEqual(set(), self.tracker.GetUnits("counter"))
+
+		other = DocumentTracker()
+		other.AddUnit("counter", "StopWatch", "lib.counter")
+		self.tracker.MergeDocuments(other, {"counter"})
+		self.assertEqual({"StopWatch:lib.counter"}, self.tracker.GetUnits("counter"))